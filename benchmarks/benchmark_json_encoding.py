@@ -0,0 +1,67 @@
+"""
+Benchmark for encoding API responses to JSON.
+
+Compares the standard encoder (`encoder.JSONEncoder`) with the fast encoder (`FastJSONEncoder`, using orjson if
+installed) for a list of models, with the same options as used by connexion for serializing responses.
+
+Usage: python benchmarks/benchmark_json_encoding.py [--models 2000] [--versions 5] [--repeat 5]
+"""
+import argparse
+import json
+import timeit
+
+from reformers_model_api_server.encoder import JSONEncoder
+from reformers_model_api_server.controllers.fast_json import FastJSONEncoder, orjson
+from reformers_model_api_server.models.info_model import InfoModel
+from reformers_model_api_server.models.list_models import ListModels
+
+
+def create_list_models(models, versions):
+    search_results = dict()
+
+    for m in range(models):
+        for v in range(versions):
+            generation_parameters = {f'param-{p}': f'value-{m}-{v}-{p}' for p in range(20)}
+            generation_parameters['CREATED'] = '2025-07-21T17:32:28.123456+00:00'
+            generation_parameters['build'] = {'image': f'generator-{m}', 'digest': 'sha256:' + 64 * '0', 'size': 1234.5}
+
+            search_results.setdefault(f'model-{m}', dict())[f'v{v}'] = InfoModel(
+                parameters={'scenario': {'type': 'string', 'default': 'base', 'description': 'Szenario (Ü)'}},
+                optional_parameters={'seed': {'type': 'integer', 'default': 42}},
+                info={'description': f'model {m}', 'area': 12.75},
+                generation_parameters=generation_parameters,
+                image_name=f'generator/v0/model-{m}',
+                image_tag=f'v{v}',
+                format='docker'
+            )
+
+    return ListModels(generator_name='generator', generator_tag='v0', models=search_results)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--models', type=int, default=2000, help='number of models')
+    parser.add_argument('--versions', type=int, default=5, help='number of versions per model')
+    parser.add_argument('--repeat', type=int, default=5, help='number of repetitions')
+    args = parser.parse_args()
+
+    data = create_list_models(args.models, args.versions)
+
+    # Options used by connexion (indent) and Flask (sort keys, ASCII only) for serializing responses.
+    options = dict(indent=2, sort_keys=True, ensure_ascii=True)
+
+    standard = json.dumps(data, cls=JSONEncoder, **options)
+    fast = json.dumps(data, cls=FastJSONEncoder, **options)
+    if standard != fast:
+        raise RuntimeError('outputs of standard and fast encoder differ')
+
+    print(f'orjson available: {orjson is not None}')
+    print(f'{args.models * args.versions} model versions, {len(standard)} bytes')
+
+    for name, cls in [('standard', JSONEncoder), ('fast', FastJSONEncoder)]:
+        times = timeit.repeat(lambda: json.dumps(data, cls=cls, **options), number=1, repeat=args.repeat)
+        print(f'{name:>8}: {min(times) * 1000:8.1f} ms (best of {args.repeat})')
+
+
+if __name__ == '__main__':
+    main()
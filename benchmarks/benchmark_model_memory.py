@@ -0,0 +1,46 @@
+"""
+Benchmark for the memory used by model instances.
+
+Measures the memory allocated per `InfoModel` instance (excluding its attribute values, which are shared by all
+instances), i.e., the overhead of the model layer for large model listings.
+
+Usage: python benchmarks/benchmark_model_memory.py [--instances 10000]
+"""
+import argparse
+import tracemalloc
+
+from reformers_model_api_server.models.info_model import InfoModel
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--instances', type=int, default=10000, help='number of model instances')
+    args = parser.parse_args()
+
+    # Attribute values shared by all instances.
+    parameters = {'scenario': {'type': 'string', 'default': 'base'}}
+    generation_parameters = {'CREATED': '2025-07-21T17:32:28.123456+00:00'}
+
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    models = [  # noqa: F841
+        InfoModel(
+            parameters=parameters,
+            optional_parameters=parameters,
+            info='model info',
+            generation_parameters=generation_parameters,
+            image_name='generator/v0/model',
+            image_tag='v0',
+            format='docker'
+        )
+        for _ in range(args.instances)
+    ]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+
+    print(f'{args.instances} instances of InfoModel')
+    print(f'{(after - before) / args.instances:.1f} bytes per instance')
+
+
+if __name__ == '__main__':
+    main()
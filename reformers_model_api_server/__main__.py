@@ -21,8 +21,25 @@ class PrefixMiddleware:
 @click.option('--metagenerator-auth-config', default='registry-auth-config.json', help='path to authentication config file for accessing the container registries passed as input to metagenerators')
 @click.option('--remove-containers', default=True, help='set this to false to remove containers after they have exited')
 @click.option('--verify-ssl', default=False, help='set this to true to verify SSL certificates')
-def main(specification, host, repo_auth_config, registry_auth_config, metagenerator_auth_config, remove_containers, verify_ssl):
-    flask_app = start_app(specification, host, repo_auth_config, registry_auth_config, metagenerator_auth_config, remove_containers, verify_ssl)
+@click.option('--blob-cache-size', default=64 * 1024 * 1024, help='maximum size (in bytes) of the in-memory cache for image blobs')
+@click.option('--blob-cache-dir', default=None, help='directory for the on-disk cache for image blobs (disabled if not specified)')
+@click.option('--manifest-cache-ttl', default=60., help='time (in seconds) during which cached image manifests are used without revalidation')
+@click.option('--lookup-concurrency', default=8, help='maximum number of concurrent repository lookups for retrieving information about models')
+@click.option('--search-prefetch', default=1, help='number of search result pages retrieved in the background ahead of processing (0 disables prefetching)')
+@click.option('--generator-index-interval', default=300., help='time (in seconds) between background refreshes of the model generator index (0 disables background refreshes)')
+@click.option('--negative-cache-ttl', default=10., help='time (in seconds) during which image manifests and blobs that have not been found in the repository are remembered (0 disables remembering)')
+@click.option('--fast-json', default=True, help='set this to false to encode responses with the standard JSON encoder instead of orjson (if installed)')
+@click.option('--response-cache-size', default=64 * 1024 * 1024, help='maximum total size (in bytes) of the cache for encoded responses of the catalogue endpoints (0 disables the cache)')
+@click.option('--response-max-age', default=0, help='maximum age (in seconds) of the responses of the catalogue endpoints for caching on the client side (0 requires revalidation via ETag)')
+@click.option('--docker-pool-size', default=10, help='maximum number of pooled connections of the Docker client shared by all requests')
+@click.option('--docker-health-check-interval', default=60., help='time (in seconds) between health checks of the Docker client (0 disables health checks)')
+@click.option('--registry-login-ttl', default=3600., help='time (in seconds) during which Docker logins to container registries are remembered (0 logs in for every new model)')
+@click.option('--registry-login-backoff', default=10., help='time (in seconds) during which Docker logins to a container registry are skipped after a failed login (0 disables backoff)')
+@click.option('--image-pull-policy', default='if-digest-changed', type=click.Choice(['always', 'if-digest-changed', 'if-missing']), help='pull policy for model generator images (if-digest-changed pulls only if the image in the registry differs from the local image)')
+@click.option('--prewarm-generators', default='', help='comma-separated patterns of model generator names or name:tag (e.g., generator:v*), whose images are pulled in the background every generator index interval (only once at startup if the interval is 0, empty disables pre-warming)')
+@click.option('--prewarm-concurrency', default=2, help='maximum number of concurrent pulls of model generator images in the background')
+def main(specification, host, repo_auth_config, registry_auth_config, metagenerator_auth_config, remove_containers, verify_ssl, blob_cache_size, blob_cache_dir, manifest_cache_ttl, lookup_concurrency, search_prefetch, generator_index_interval, negative_cache_ttl, fast_json, response_cache_size, response_max_age, docker_pool_size, docker_health_check_interval, registry_login_ttl, registry_login_backoff, image_pull_policy, prewarm_generators, prewarm_concurrency):
+    flask_app = start_app(specification, host, repo_auth_config, registry_auth_config, metagenerator_auth_config, remove_containers, verify_ssl, blob_cache_size, blob_cache_dir, manifest_cache_ttl, lookup_concurrency, search_prefetch, generator_index_interval, negative_cache_ttl, fast_json, response_cache_size, response_max_age, docker_pool_size, docker_health_check_interval, registry_login_ttl, registry_login_backoff, image_pull_policy, prewarm_generators, prewarm_concurrency)
     flask_app.app.wsgi_app = PrefixMiddleware(flask_app.app.wsgi_app, prefix='/api')
     flask_app.run(port=8080)
 
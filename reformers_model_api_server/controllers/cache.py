@@ -0,0 +1,618 @@
+import gzip
+import json
+import os
+import pathlib
+import re
+import tempfile
+import threading
+import time
+
+from collections import OrderedDict
+from functools import partial
+from typing import Any, Callable, Hashable, Optional, Type
+from warnings import warn
+
+from reformers_model_api_server.controllers.single_flight import SingleFlight, copy_exception
+
+DIGEST_PATTERN = re.compile(r'[a-zA-Z0-9+._-]+:[a-fA-F0-9]+')
+
+class NegativeCache:
+    """
+    Cache for failed lookups (e.g., objects not found in the repository).
+
+    Lookups that failed with one of the specified exception types are remembered for a short time (TTL),
+    during which the exception is re-raised instead of querying the repository again.
+
+    :param ttl: time (in seconds) during which failed lookups are remembered (0 disables the cache)
+    :type ttl: float
+    :param exception_types: exception types that are cached
+    :type exception_types: tuple[Type[Exception], ...]
+    :param max_entries: maximum number of entries (entries are evicted in order of insertion)
+    :type max_entries: int
+    """
+
+    def __init__(
+            self,
+            ttl: float,
+            exception_types: tuple[Type[Exception], ...],
+            max_entries: int = 10000
+        ) -> None:
+        self.ttl = ttl
+        self.exception_types = exception_types
+        self.max_entries = max_entries
+
+        self._entries: dict[Hashable, tuple[Exception, float]] = dict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+
+    def check(
+            self,
+            key: Hashable
+        ) -> None:
+        """
+        Re-raise the exception of a remembered failed lookup (if any).
+
+        :param key: cache key
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if not entry:
+                return
+            if time.monotonic() >= entry[1]:
+                del self._entries[key]
+                return
+            self.hits += 1
+
+        raise copy_exception(entry[0])
+
+    def add(
+            self,
+            key: Hashable,
+            exception: Exception
+        ) -> None:
+        """
+        Remember failed lookup, in case the exception is of one of the cached exception types.
+
+        :param key: cache key
+        :param exception: exception raised by the lookup
+        """
+        if self.ttl <= 0 or not isinstance(exception, self.exception_types):
+            return
+
+        with self._lock:
+            self._entries.pop(key, None)
+            # The exception is kept without the traceback of the failed lookup.
+            self._entries[key] = (copy_exception(exception), time.monotonic() + self.ttl)
+
+            if len(self._entries) > self.max_entries:
+                # Remove expired entries first, then the oldest entries.
+                now = time.monotonic()
+                for expired_key in [k for k, (_, expiry) in self._entries.items() if now >= expiry]:
+                    del self._entries[expired_key]
+                while len(self._entries) > self.max_entries:
+                    del self._entries[next(iter(self._entries))]
+
+    def invalidate(
+            self,
+            key: Hashable
+        ) -> None:
+        """
+        Forget failed lookup.
+
+        :param key: cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+        """
+        with self._lock:
+            return dict(
+                entries=len(self._entries),
+                ttl=self.ttl,
+                hits=self.hits,
+            )
+
+class BlobCache:
+    """
+    Content-addressed cache for blobs retrieved from the repository.
+
+    Blobs are addressed by their digest (e.g., `manifest.config.digest`), hence their content never changes.
+    The cache consists of a memory tier (LRU, bounded by the total size of the serialized blobs) and an
+    optional disk tier (one JSON file per blob), which survives restarts of the server.
+
+    :param max_memory_size: maximum total size (in bytes) of the serialized blobs in the memory tier (0 disables the memory tier)
+    :type max_memory_size: int
+    :param cache_dir: directory for the disk tier (None disables the disk tier)
+    :type cache_dir: Optional[str]
+    :param single_flight: coalesce concurrent fetches of the same blob (optional)
+    :type single_flight: Optional[SingleFlight]
+    :param negative_cache: remember blobs that have not been found (optional)
+    :type negative_cache: Optional[NegativeCache]
+    """
+
+    def __init__(
+            self,
+            max_memory_size: int,
+            cache_dir: Optional[str] = None,
+            single_flight: Optional[SingleFlight] = None,
+            negative_cache: Optional[NegativeCache] = None
+        ) -> None:
+        self.max_memory_size = max_memory_size
+        self.single_flight = single_flight
+        self.negative_cache = negative_cache
+        self.memory_size = 0
+
+        self.cache_dir = None
+        if cache_dir:
+            self.cache_dir = pathlib.Path(cache_dir)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+
+        self._entries: OrderedDict[str, tuple[Any, int]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def get(
+            self,
+            digest: str,
+            deserialize: Callable[[dict], Any]
+        ) -> Optional[Any]:
+        """
+        Get blob from the cache.
+
+        :param digest: digest of the blob
+        :param deserialize: function for converting the serialized blob from the disk tier to an object
+        :return: blob or None if the blob is not cached
+        """
+        with self._lock:
+            entry = self._entries.get(digest)
+            if entry:
+                self._entries.move_to_end(digest)
+                self.memory_hits += 1
+                return entry[0]
+
+        blob_file = self._blob_file(digest)
+        if blob_file and blob_file.is_file():
+            try:
+                data = blob_file.read_bytes()
+                blob = deserialize(json.loads(data))
+            except Exception as ex:
+                warn(
+                    f'failed to read cached blob {digest}: {ex}',
+                    category=RuntimeWarning
+                )
+            else:
+                with self._lock:
+                    self.disk_hits += 1
+                    self._insert(digest, blob, len(data))
+                return blob
+
+        with self._lock:
+            self.misses += 1
+
+        return None
+
+    def put(
+            self,
+            digest: str,
+            blob: Any
+        ) -> None:
+        """
+        Add blob to the cache.
+
+        :param digest: digest of the blob
+        :param blob: blob object (must provide method `to_dict`)
+        """
+        data = json.dumps(blob.to_dict(), default=str).encode('utf-8')
+
+        with self._lock:
+            self._insert(digest, blob, len(data))
+
+        blob_file = self._blob_file(digest)
+        if blob_file and not blob_file.is_file():
+            try:
+                # Write to a temporary file first, such that concurrent readers never see partial blobs.
+                fd, tmp_file = tempfile.mkstemp(dir=self.cache_dir, suffix='.tmp')
+                with os.fdopen(fd, 'wb') as f:
+                    f.write(data)
+                os.replace(tmp_file, blob_file)
+            except OSError as ex:
+                warn(
+                    f'failed to write cached blob {digest}: {ex}',
+                    category=RuntimeWarning
+                )
+
+    def get_or_fetch(
+            self,
+            digest: str,
+            fetch: Callable[[], Any],
+            deserialize: Callable[[dict], Any]
+        ) -> Any:
+        """
+        Get blob from the cache or fetch it (and add it to the cache) if it is not cached.
+
+        :param digest: digest of the blob
+        :param fetch: function for retrieving the blob from the repository
+        :param deserialize: function for converting the serialized blob from the disk tier to an object
+        :return: blob
+        """
+        blob = self.get(digest, deserialize)
+        if blob is not None:
+            return blob
+
+        if self.negative_cache:
+            self.negative_cache.check(digest)
+
+        def fetch_and_put() -> Any:
+            try:
+                blob = fetch()
+            except Exception as ex:
+                if self.negative_cache:
+                    self.negative_cache.add(digest, ex)
+                raise
+            self.put(digest, blob)
+            return blob
+
+        if self.single_flight:
+            return self.single_flight.do(('blob', digest), fetch_and_put)
+        else:
+            return fetch_and_put()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+        """
+        with self._lock:
+            return dict(
+                entries=len(self._entries),
+                memory_size=self.memory_size,
+                max_memory_size=self.max_memory_size,
+                memory_hits=self.memory_hits,
+                disk_hits=self.disk_hits,
+                misses=self.misses,
+                not_found=self.negative_cache.stats() if self.negative_cache else None,
+            )
+
+    def _insert(
+            self,
+            digest: str,
+            blob: Any,
+            size: int
+        ) -> None:
+        # Blobs that do not fit into the memory tier at all are not added.
+        if size > self.max_memory_size:
+            return
+
+        old_entry = self._entries.pop(digest, None)
+        if old_entry:
+            self.memory_size -= old_entry[1]
+
+        self._entries[digest] = (blob, size)
+        self.memory_size += size
+
+        # Evict least recently used blobs.
+        while self.memory_size > self.max_memory_size:
+            _, (_, evicted_size) = self._entries.popitem(last=False)
+            self.memory_size -= evicted_size
+
+    def _blob_file(
+            self,
+            digest: str
+        ) -> Optional[pathlib.Path]:
+        # Only use well-formed digests as file names.
+        if not self.cache_dir or not DIGEST_PATTERN.fullmatch(digest):
+            return None
+        return self.cache_dir / (digest.replace(':', '_') + '.json')
+
+class ManifestCache:
+    """
+    Cache for manifests retrieved from the repository.
+
+    In contrast to blobs, manifests are addressed by tags, which may be moved to other images.
+    Cached manifests are therefore only used for a limited time (TTL).
+    Once the TTL of an entry has expired, the entry is revalidated with a conditional request
+    (the digest of the cached manifest is used as ETag) instead of fetching the manifest again.
+
+    :param ttl: time (in seconds) during which cached manifests are used without revalidation
+    :type ttl: float
+    :param single_flight: coalesce concurrent fetches (and revalidations) of the same manifest (optional)
+    :type single_flight: Optional[SingleFlight]
+    :param negative_cache: remember manifests that have not been found (optional)
+    :type negative_cache: Optional[NegativeCache]
+    """
+
+    def __init__(
+            self,
+            ttl: float,
+            single_flight: Optional[SingleFlight] = None,
+            negative_cache: Optional[NegativeCache] = None
+        ) -> None:
+        self.ttl = ttl
+        self.single_flight = single_flight
+        self.negative_cache = negative_cache
+
+        self._entries: dict[Hashable, tuple[Any, Optional[str], float]] = dict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.revalidations = 0
+        self.updates = 0
+
+    def get_or_fetch(
+            self,
+            key: Hashable,
+            fetch: Callable[[Optional[str]], Optional[tuple[Any, Optional[str]]]]
+        ) -> Any:
+        """
+        Get manifest from the cache or fetch it (and add it to the cache) if it is not cached or has expired.
+
+        :param key: cache key, e.g., (generator name, generator tag) or (generator name, generator tag, model name, model version)
+        :param fetch: function for retrieving the manifest from the repository; it is called with the ETag of
+            the cached manifest (or None) and returns either a tuple (manifest, ETag) or None if the manifest
+            has not been modified
+        :return: manifest
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and time.monotonic() < entry[2]:
+                self.hits += 1
+                return entry[0]
+
+        if not entry:
+            if self.negative_cache:
+                self.negative_cache.check(key)
+
+            with self._lock:
+                self.misses += 1
+
+            result = self._fetch(key, fetch, None)
+            if result is None:
+                raise RuntimeError(f'no manifest retrieved for {key}')
+
+            manifest, etag = result
+            with self._lock:
+                self._entries[key] = (manifest, etag, time.monotonic() + self.ttl)
+            return manifest
+
+        cached_manifest, cached_etag, _ = entry
+        try:
+            result = self._fetch(key, fetch, cached_etag)
+        except Exception as ex:
+            if self.negative_cache and isinstance(ex, self.negative_cache.exception_types):
+                # The tag has been removed (the failed lookup is remembered by the negative cache).
+                with self._lock:
+                    self._entries.pop(key, None)
+            raise
+
+        with self._lock:
+            if result is None:
+                # The cached manifest is still valid.
+                self.revalidations += 1
+                self._entries[key] = (cached_manifest, cached_etag, time.monotonic() + self.ttl)
+                return cached_manifest
+            else:
+                # The tag has been moved.
+                self.updates += 1
+                manifest, etag = result
+                self._entries[key] = (manifest, etag, time.monotonic() + self.ttl)
+                return manifest
+
+    def get_etag(
+            self,
+            key: Hashable
+        ) -> Optional[str]:
+        """
+        Get ETag (i.e., the digest) of cached manifest (None if the manifest is not cached or has no ETag).
+
+        :param key: cache key
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            return entry[1] if entry else None
+
+    def expire(
+            self,
+            key: Hashable
+        ) -> None:
+        """
+        Mark manifest as expired, i.e., it will be revalidated on the next access.
+
+        A remembered failed lookup is kept (see `invalidate` for forgetting it).
+
+        :param key: cache key
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry:
+                self._entries[key] = (entry[0], entry[1], 0.)
+
+    def expire_if_changed(
+            self,
+            key: Hashable,
+            etag: Optional[str]
+        ) -> None:
+        """
+        Mark manifest as expired in case its ETag differs from the specified one (e.g., the digest of the manifest
+        found by a search), i.e., it will be revalidated on the next access.
+
+        :param key: cache key
+        :param etag: current ETag of the manifest (ignored if not available)
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if not (etag and entry and entry[1] and entry[1] != etag):
+                return
+            self._entries[key] = (entry[0], entry[1], 0.)
+
+    def invalidate(
+            self,
+            key: Hashable
+        ) -> None:
+        """
+        Remove manifest from the cache (including a remembered failed lookup).
+
+        :param key: cache key
+        """
+        with self._lock:
+            self._entries.pop(key, None)
+
+        if self.negative_cache:
+            self.negative_cache.invalidate(key)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+        """
+        with self._lock:
+            return dict(
+                entries=len(self._entries),
+                ttl=self.ttl,
+                hits=self.hits,
+                misses=self.misses,
+                revalidations=self.revalidations,
+                updates=self.updates,
+                not_found=self.negative_cache.stats() if self.negative_cache else None,
+            )
+
+    def _fetch(
+            self,
+            key: Hashable,
+            fetch: Callable[[Optional[str]], Optional[tuple[Any, Optional[str]]]],
+            etag: Optional[str]
+        ) -> Optional[tuple[Any, Optional[str]]]:
+        try:
+            if self.single_flight:
+                return self.single_flight.do(('manifest', key, etag), partial(fetch, etag))
+            else:
+                return fetch(etag)
+        except Exception as ex:
+            if self.negative_cache:
+                self.negative_cache.add(key, ex)
+            raise
+
+class ResponseCache:
+    """
+    Cache for encoded (JSON) responses of the catalogue endpoints.
+
+    Responses are cached per endpoint and parameters (cache key) together with a digest of the underlying data
+    (e.g., the manifest digests of the model images). A cached response is only used as long as the digest of the
+    underlying data is unchanged, otherwise it is replaced. Along with the encoded response, a gzip-compressed
+    variant is cached. The cache is bounded by the total size of the cached responses (LRU).
+
+    :param max_size: maximum total size (in bytes) of the cached responses, including the compressed variants (0 disables the cache)
+    :type max_size: int
+    :param compress_level: gzip compression level of the compressed variants
+    :type compress_level: int
+    """
+
+    def __init__(
+            self,
+            max_size: int,
+            compress_level: int = 6
+        ) -> None:
+        self.max_size = max_size
+        self.compress_level = compress_level
+        self.size = 0
+
+        self._entries: OrderedDict[Hashable, tuple[str, bytes, bytes]] = OrderedDict()
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    @property
+    def enabled(self) -> bool:
+        """
+        True if responses are cached.
+        """
+        return self.max_size > 0
+
+    def get(
+            self,
+            key: Hashable,
+            digest: str
+        ) -> Optional[tuple[bytes, bytes]]:
+        """
+        Get response from the cache.
+
+        :param key: cache key, e.g., (endpoint, parameters)
+        :param digest: digest of the underlying data
+        :return: tuple of encoded response and compressed variant or None if there is no valid cached response
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry and entry[0] == digest:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry[1], entry[2]
+
+            if entry:
+                # The underlying data has changed.
+                self._remove(key)
+                self.invalidations += 1
+            self.misses += 1
+
+        return None
+
+    def put(
+            self,
+            key: Hashable,
+            digest: str,
+            body: bytes
+        ) -> tuple[bytes, bytes]:
+        """
+        Add response to the cache.
+
+        :param key: cache key, e.g., (endpoint, parameters)
+        :param digest: digest of the underlying data
+        :param body: encoded response
+        :return: tuple of encoded response and compressed variant
+        """
+        # The modification time is omitted, such that the compressed variant only depends on the response.
+        gzip_body = gzip.compress(body, compresslevel=self.compress_level, mtime=0)
+        size = len(body) + len(gzip_body)
+
+        with self._lock:
+            self._remove(key)
+
+            # Responses that do not fit into the cache at all are not added.
+            if size <= self.max_size:
+                self._entries[key] = (digest, body, gzip_body)
+                self.size += size
+
+                # Evict least recently used responses.
+                while self.size > self.max_size:
+                    _, (_, evicted_body, evicted_gzip_body) = self._entries.popitem(last=False)
+                    self.size -= len(evicted_body) + len(evicted_gzip_body)
+
+        return body, gzip_body
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get cache statistics.
+        """
+        with self._lock:
+            return dict(
+                entries=len(self._entries),
+                size=self.size,
+                max_size=self.max_size,
+                hits=self.hits,
+                misses=self.misses,
+                invalidations=self.invalidations,
+            )
+
+    def _remove(
+            self,
+            key: Hashable
+        ) -> None:
+        entry = self._entries.pop(key, None)
+        if entry:
+            self.size -= len(entry[1]) + len(entry[2])
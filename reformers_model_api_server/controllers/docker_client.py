@@ -0,0 +1,455 @@
+import docker
+import threading
+import time
+
+from contextlib import contextmanager
+from functools import partial
+from typing import Any, Callable, Iterator, Optional
+from urllib.parse import urlparse
+from warnings import warn
+
+from reformers_model_api_server.controllers.single_flight import SingleFlight
+
+class DockerClientManager:
+    """
+    Docker client shared by all requests (thread-safe).
+
+    Instead of creating a new client (i.e., a new HTTP session for the Docker daemon socket) per request, all requests
+    use the same client, whose connections are pooled. The client is created lazily and its connection to the Docker
+    daemon is checked periodically in the background. In case the health check fails, the client is replaced by a new
+    one.
+
+    Requests lease the client for the duration of their Docker calls (but not while waiting in between), hence, the
+    number of leases in use approximates the number of connections in use.
+
+    :param max_pool_size: maximum number of pooled connections to the Docker daemon
+    :param health_check_interval: time (in seconds) between health checks of the client (0 disables health checks)
+    :param create_client: function for creating a client (keyword argument `max_pool_size`), defaults to `docker.from_env`
+    """
+
+    def __init__(
+            self,
+            max_pool_size: int = 10,
+            health_check_interval: float = 60.,
+            create_client: Optional[Callable[..., Any]] = None
+        ) -> None:
+        self.max_pool_size = max_pool_size
+        self.health_check_interval = health_check_interval
+        self._create_client = partial(create_client or docker.from_env, max_pool_size=max_pool_size)
+
+        self._client: Optional[docker.DockerClient] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        self.in_use = 0
+        self.max_in_use = 0
+        self.leases = 0
+        self.saturated_leases = 0
+        self.created = 0
+        self.health_checks = 0
+        self.health_check_failures = 0
+
+    def start(self) -> None:
+        """
+        Start periodic health checks of the client in the background.
+        """
+        if self.health_check_interval <= 0:
+            return
+
+        threading.Thread(target=self._check_health_periodically, name='docker-health-check', daemon=True).start()
+
+    def stop(self) -> None:
+        """
+        Stop periodic health checks of the client.
+        """
+        self._stop.set()
+
+    @contextmanager
+    def client(self) -> Iterator[docker.DockerClient]:
+        """
+        Lease the shared client for Docker calls (the leases are tracked for the pool utilisation statistics).
+
+        :return: context manager providing the client
+        """
+        docker_client = self.get()
+
+        with self._lock:
+            self.leases += 1
+            self.in_use += 1
+            self.max_in_use = max(self.max_in_use, self.in_use)
+            if self.in_use > self.max_pool_size:
+                # More concurrent Docker calls than pooled connections (connections are not reused).
+                self.saturated_leases += 1
+
+        try:
+            yield docker_client
+        finally:
+            with self._lock:
+                self.in_use -= 1
+
+    def get(self) -> docker.DockerClient:
+        """
+        Get the shared client (created on first use or after a failed health check).
+        """
+        with self._lock:
+            if self._client is None:
+                self._client = self._create_client()
+                self.created += 1
+            return self._client
+
+    def check_health(self) -> bool:
+        """
+        Check the connection of the client to the Docker daemon (the client is replaced in case the check fails).
+
+        :return: True if the client is healthy (or has not been created yet)
+        """
+        with self._lock:
+            docker_client = self._client
+            if docker_client is None:
+                return True
+            self.health_checks += 1
+
+        try:
+            docker_client.ping()
+        except Exception as ex:
+            warn(
+                f'health check of Docker client failed: {ex}',
+                category=RuntimeWarning
+            )
+            with self._lock:
+                self.health_check_failures += 1
+                if self._client is docker_client:
+                    self._client = None
+
+            try:
+                docker_client.close()
+            except Exception:
+                pass
+
+            return False
+
+        return True
+
+    def close(self) -> None:
+        """
+        Close the shared client (a new client is created on next use).
+        """
+        with self._lock:
+            docker_client, self._client = self._client, None
+
+        if docker_client is not None:
+            docker_client.close()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get client statistics (including the pool utilisation).
+        """
+        with self._lock:
+            return dict(
+                max_pool_size=self.max_pool_size,
+                in_use=self.in_use,
+                max_in_use=self.max_in_use,
+                leases=self.leases,
+                saturated_leases=self.saturated_leases,
+                created=self.created,
+                health_checks=self.health_checks,
+                health_check_failures=self.health_check_failures,
+            )
+
+    def _check_health_periodically(self) -> None:
+        while not self._stop.wait(self.health_check_interval):
+            self.check_health()
+
+def normalize_registry(
+        registry: str
+    ) -> str:
+    """
+    Normalize registry address (e.g., `https://host:port/` or `host:port`) to `host:port`.
+    """
+    netloc = urlparse(registry if '//' in registry else f'//{registry}').netloc
+    return (netloc or registry).rstrip('/').lower()
+
+class RegistryLoginCache:
+    """
+    Login sessions of the shared Docker client per container registry (thread-safe).
+
+    Logins happen lazily, i.e., only for the registry an image is pulled from, and are remembered for a given time
+    (TTL), during which the registry is not contacted again. After a failed login, further attempts for the same
+    registry are skipped for a backoff time, which doubles with each consecutive failure. In case the client has
+    been replaced (see `DockerClientManager`), the new client logs in again.
+
+    :param auth_config: username / password per registry
+    :type auth_config: dict[str, tuple[str, str]]
+    :param ttl: time (in seconds) during which logins are remembered (0 disables the cache)
+    :type ttl: float
+    :param backoff: time (in seconds) during which logins are skipped after the first failed login
+    :type backoff: float
+    :param max_backoff: maximum time (in seconds) during which logins are skipped after failed logins
+    :type max_backoff: float
+    """
+
+    def __init__(
+            self,
+            auth_config: dict[str, tuple[str, str]],
+            ttl: float = 3600.,
+            backoff: float = 10.,
+            max_backoff: float = 300.
+        ) -> None:
+        self.ttl = ttl
+        self.backoff = backoff
+        self.max_backoff = max_backoff
+
+        self._auth_config = {
+            normalize_registry(registry_url): (registry_url, registry_auth_info)
+            for registry_url, registry_auth_info in auth_config.items()
+        }
+        # Registry -> (client, expiry time) of successful logins.
+        self._sessions: dict[str, tuple[Any, float]] = dict()
+        # Registry -> (number of consecutive failures, time of next attempt) of failed logins.
+        self._failures: dict[str, tuple[int, float]] = dict()
+        self._registry_locks: dict[str, threading.Lock] = dict()
+        self._lock = threading.Lock()
+
+        self.logins = 0
+        self.failed_logins = 0
+        self.hits = 0
+        self.skipped_logins = 0
+
+    def login(
+            self,
+            docker_client: docker.DockerClient,
+            registry: str
+        ) -> bool:
+        """
+        Log in to registry (unless there is a valid login session of the client).
+
+        Exceptions of failed logins are re-raised (subsequent logins are skipped during the backoff time).
+
+        :param docker_client: docker client
+        :param registry: registry address (e.g., `host:port`)
+        :return: True if the client is logged in, False if the registry is not configured or logins are skipped
+        """
+        key = normalize_registry(registry)
+        auth = self._auth_config.get(key)
+        if auth is None:
+            return False
+        registry_url, (username, password) = auth
+
+        with self._lock:
+            registry_lock = self._registry_locks.setdefault(key, threading.Lock())
+
+        # Concurrent logins to the same registry are serialized (only the first one contacts the registry).
+        with registry_lock:
+            now = time.monotonic()
+
+            with self._lock:
+                session = self._sessions.get(key)
+                if session and session[0] is docker_client and now < session[1]:
+                    self.hits += 1
+                    return True
+                failure = self._failures.get(key)
+                if failure and now < failure[1]:
+                    self.skipped_logins += 1
+                    return False
+
+            try:
+                docker_client.login(
+                    registry=registry_url,
+                    username=username,
+                    password=password,
+                    reauth=True
+                )
+            except Exception:
+                with self._lock:
+                    self.failed_logins += 1
+                    self._sessions.pop(key, None)
+                    failures = failure[0] + 1 if failure else 1
+                    backoff = min(self.backoff * 2 ** (failures - 1), self.max_backoff)
+                    self._failures[key] = (failures, time.monotonic() + backoff)
+                raise
+
+            with self._lock:
+                self.logins += 1
+                self._failures.pop(key, None)
+                if self.ttl > 0:
+                    self._sessions[key] = (docker_client, time.monotonic() + self.ttl)
+
+        return True
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get login statistics.
+        """
+        with self._lock:
+            now = time.monotonic()
+            return dict(
+                registries=len(self._auth_config),
+                sessions=sum(1 for _, expiry in self._sessions.values() if now < expiry),
+                ttl=self.ttl,
+                logins=self.logins,
+                failed_logins=self.failed_logins,
+                hits=self.hits,
+                skipped_logins=self.skipped_logins,
+            )
+
+# Pull policies for model generator images (see `pull_image`).
+PULL_ALWAYS = 'always'
+PULL_IF_DIGEST_CHANGED = 'if-digest-changed'
+PULL_IF_MISSING = 'if-missing'
+PULL_POLICIES = (PULL_ALWAYS, PULL_IF_DIGEST_CHANGED, PULL_IF_MISSING)
+
+def get_local_image(
+        docker_client: docker.DockerClient,
+        image_name: str
+    ) -> Optional[Any]:
+    """
+    Get image from the local Docker daemon (None if it does not exist locally).
+    """
+    try:
+        return docker_client.images.get(image_name)
+    except docker.errors.ImageNotFound: # type: ignore
+        return None
+
+def has_repo_digest(
+        image: Any,
+        repository: str,
+        digest: str
+    ) -> bool:
+    """
+    Check if a local image has been pulled from the repository with the given manifest digest.
+
+    :param image: local image
+    :param repository: image repository (e.g., `host:port/name`)
+    :param digest: manifest digest (e.g., `sha256:...`)
+    """
+    repo_digests = (getattr(image, 'attrs', None) or dict()).get('RepoDigests') or []
+    return f'{repository}@{digest}' in repo_digests
+
+def pull_image(
+        docker_client: docker.DockerClient,
+        repository: str,
+        tag: str,
+        digest: Optional[str] = None,
+        policy: str = PULL_ALWAYS
+    ) -> bool:
+    """
+    Pull image according to the pull policy.
+
+    + `always`: the image is always pulled (this ensures the latest version is used)
+    + `if-digest-changed`: the image is pulled unless the local image has been pulled with the given manifest digest
+      (the image is always pulled if the digest is not known)
+    + `if-missing`: the image is only pulled if it does not exist locally
+
+    :param docker_client: docker client
+    :param repository: image repository (e.g., `host:port/name`)
+    :param tag: image tag
+    :param digest: current manifest digest of the image in the registry (if known)
+    :param policy: pull policy
+    :return: True if the image has been pulled, False if the pull has been skipped
+    """
+    if policy not in PULL_POLICIES:
+        raise ValueError(f'unknown pull policy: {policy}')
+
+    image_name = f'{repository}:{tag}'
+
+    if PULL_IF_MISSING == policy:
+        pull = get_local_image(docker_client, image_name) is None
+    elif PULL_IF_DIGEST_CHANGED == policy and digest:
+        image = get_local_image(docker_client, image_name)
+        pull = image is None or not has_repo_digest(image, repository, digest)
+    else:
+        pull = True
+
+    if pull:
+        docker_client.images.pull(image_name)
+
+    return pull
+
+class ImagePuller:
+    """
+    Pull images according to the pull policy (see `pull_image`), coalescing concurrent pulls of the same image.
+
+    While an image is being pulled, further pulls of the same image reference (and manifest digest) do not contact
+    the registry, but wait for the pull in flight. The durations of the pulls are recorded per model generator.
+
+    :param single_flight: coalescing of concurrent pulls
+    :type single_flight: SingleFlight
+    :param policy: pull policy
+    :type policy: str
+    """
+
+    def __init__(
+            self,
+            single_flight: SingleFlight,
+            policy: str = PULL_ALWAYS
+        ) -> None:
+        if policy not in PULL_POLICIES:
+            raise ValueError(f'unknown pull policy: {policy}')
+
+        self.single_flight = single_flight
+        self.policy = policy
+
+        # Model generator name -> (number of pulls, total duration, maximum duration, last duration).
+        self._durations: dict[str, tuple[int, float, float, float]] = dict()
+        self._lock = threading.Lock()
+
+        self.pulls = 0
+        self.skipped_pulls = 0
+
+    def pull(
+            self,
+            docker_client: docker.DockerClient,
+            repository: str,
+            tag: str,
+            digest: Optional[str] = None,
+            generator_name: Optional[str] = None
+        ) -> bool:
+        """
+        Pull image according to the pull policy (or wait for a concurrent pull of the same image).
+
+        :param docker_client: docker client
+        :param repository: image repository (e.g., `host:port/name`)
+        :param tag: image tag
+        :param digest: current manifest digest of the image in the registry (if known)
+        :param generator_name: model generator name for recording the pull duration (defaults to the repository)
+        :return: True if the image has been pulled (by this or a concurrent call), False if the pull has been skipped
+        """
+        def pull_and_record() -> bool:
+            start_time = time.monotonic()
+            pulled = pull_image(docker_client, repository, tag, digest, self.policy)
+            duration = time.monotonic() - start_time
+
+            with self._lock:
+                if not pulled:
+                    self.skipped_pulls += 1
+                    return False
+                self.pulls += 1
+                name = generator_name or repository
+                pulls, total, maximum, _ = self._durations.get(name, (0, 0., 0., 0.))
+                self._durations[name] = (pulls + 1, total + duration, max(maximum, duration), duration)
+
+            return True
+
+        # Callers that know a different digest do not share the decision of a call in flight (e.g., to skip the pull).
+        return self.single_flight.do(('image_pull', f'{repository}:{tag}', digest), pull_and_record)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get pull statistics (including the pull durations per model generator).
+        """
+        with self._lock:
+            return dict(
+                policy=self.policy,
+                pulls=self.pulls,
+                skipped_pulls=self.skipped_pulls,
+                durations={
+                    name: dict(
+                        pulls=pulls,
+                        total=total,
+                        mean=total / pulls,
+                        max=maximum,
+                        last=last,
+                    )
+                    for name, (pulls, total, maximum, last) in self._durations.items()
+                },
+            )
@@ -0,0 +1,144 @@
+import codecs
+
+from typing import Any, Optional
+
+from reformers_model_api_server.encoder import JSONEncoder
+from reformers_model_api_server.models.base_model import Model
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Name of the codec error handler for escaping non-ASCII characters.
+ESCAPE_NON_ASCII = 'reformers_model_api_server.escape_non_ascii'
+
+# Model class -> tuple of (attribute name, JSON key).
+_field_plans: dict[type, tuple[tuple[str, str], ...]] = dict()
+
+def get_field_plan(
+        o: Model
+    ) -> tuple[tuple[str, str], ...]:
+    """
+    Get (precomputed) names and JSON keys of the attributes of a model.
+    """
+    field_plan = _field_plans.get(type(o))
+
+    if field_plan is None:
+        field_plan = tuple((attr, o.attribute_map[attr]) for attr in o.openapi_types)
+        _field_plans[type(o)] = field_plan
+
+    return field_plan
+
+def escape_non_ascii(
+        error: UnicodeEncodeError
+    ) -> tuple[str, int]:
+    """
+    Codec error handler for escaping non-ASCII characters like the standard JSON encoder (option `ensure_ascii`).
+    """
+    escaped = []
+
+    for character in error.object[error.start:error.end]:
+        code_point = ord(character)
+        if code_point < 0x10000:
+            escaped.append(f'\\u{code_point:04x}')
+        else:
+            # Use surrogate pair.
+            code_point -= 0x10000
+            escaped.append(f'\\u{0xd800 | (code_point >> 10):04x}\\u{0xdc00 | (code_point & 0x3ff):04x}')
+
+    return ''.join(escaped), error.end
+
+codecs.register_error(ESCAPE_NON_ASCII, escape_non_ascii)
+
+def has_divergent_float(
+        o: Any
+    ) -> bool:
+    """
+    Check for floats, which orjson encodes differently than the standard JSON encoder.
+
+    This concerns floats in exponent notation (e.g., `1e16` instead of `1e+16` or `0.00001` instead of `1e-05`)
+    as well as NaN and infinite floats (encoded as null). Models are not checked, their attributes are checked
+    when they are converted to dicts.
+    """
+    stack = [o]
+
+    while stack:
+        value = stack.pop()
+        value_type = type(value)
+
+        if value_type is str or value_type is int or value_type is bool or value is None:
+            continue
+        elif value_type is dict or isinstance(value, dict):
+            stack.extend(value.values())
+        elif value_type is list or value_type is tuple or isinstance(value, (list, tuple)):
+            stack.extend(value)
+        elif isinstance(value, float):
+            # Check the range for which the standard JSON encoder does not use exponent notation.
+            if not (0. == value or 1e-4 <= abs(value) < 1e16):
+                return True
+
+    return False
+
+class FastJSONEncoder(JSONEncoder):
+    """
+    JSON encoder for API responses using orjson (if available).
+
+    The output is identical to the output of `encoder.JSONEncoder`. In case the output of orjson might differ
+    (e.g., unsupported encoder options or number formats), the standard JSON encoder is used instead. Models are
+    converted to dicts according to a precomputed plan per model class.
+    """
+
+    def default(self, o: Any) -> Any:
+        if isinstance(o, Model):
+            dikt = {}
+            for attr, key in get_field_plan(o):
+                value = getattr(o, attr)
+                if value is None and not self.include_nulls:
+                    continue
+                dikt[key] = value
+            return dikt
+        return JSONEncoder.default(self, o)
+
+    def encode(self, o: Any) -> str:
+        option = self._get_orjson_option()
+        if option is None or has_divergent_float(o):
+            return JSONEncoder.encode(self, o)
+
+        try:
+            encoded = orjson.dumps(o, default=self._orjson_default, option=option)
+        except (TypeError, ValueError):
+            # Let the standard JSON encoder handle (or report) unsupported data.
+            return JSONEncoder.encode(self, o)
+
+        if not self.ensure_ascii:
+            return encoded.decode('utf-8')
+
+        # In contrast to orjson, the standard JSON encoder also escapes DEL (which is an ASCII character).
+        encoded = encoded.replace(b'\x7f', b'\\u007f')
+        if encoded.isascii():
+            return encoded.decode('ascii')
+        return encoded.decode('utf-8').encode('ascii', ESCAPE_NON_ASCII).decode('ascii')
+
+    def _orjson_default(self, o: Any) -> Any:
+        converted = self.default(o)
+        if has_divergent_float(converted):
+            raise ValueError('float not supported')
+        return converted
+
+    def _get_orjson_option(self) -> Optional[int]:
+        # Only the output formats of orjson that are identical to the standard JSON encoder are supported.
+        if orjson is None or self.skipkeys or not self.allow_nan:
+            return None
+
+        if self.indent is None and (self.item_separator, self.key_separator) == (',', ':'):
+            option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS
+        elif self.indent in (2, '  ') and (self.item_separator, self.key_separator) == (',', ': '):
+            option = orjson.OPT_PASSTHROUGH_DATETIME | orjson.OPT_PASSTHROUGH_DATACLASS | orjson.OPT_INDENT_2
+        else:
+            return None
+
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+
+        return option
@@ -0,0 +1,189 @@
+import threading
+import time
+
+from contextlib import closing
+from typing import Any, Callable, Optional
+from warnings import warn
+
+from reformers_model_api_server.controllers.util import iterate_search_items
+
+class GeneratorIndex:
+    """
+    In-memory index of the model generators available in the repository.
+
+    The index maps model generator names to their tags (and the digests of the associated manifests).
+    It is built by searching through the complete repository and refreshed periodically in the background.
+    Lookups for unknown model generators (or tags) trigger a refresh, such that newly pushed model generators
+    are found without waiting for the next periodic refresh. To protect the repository from clients polling
+    unknown model generators, refreshes triggered by lookups are rate-limited.
+
+    :param search_api_func: API function used for searching the model generators repository
+    :param refresh_interval: time (in seconds) between periodic refreshes (0 disables periodic refreshes)
+    :param min_refresh_interval: minimum time (in seconds) between refreshes triggered by lookups
+    :param prefetch: number of search result pages retrieved in the background ahead of processing
+    """
+
+    def __init__(
+            self,
+            search_api_func: Callable,
+            refresh_interval: float,
+            min_refresh_interval: float = 5.,
+            prefetch: int = 0
+        ) -> None:
+        self.search_api_func = search_api_func
+        self.refresh_interval = refresh_interval
+        self.min_refresh_interval = min_refresh_interval
+        self.prefetch = prefetch
+
+        # Model generator name -> model generator tag -> manifest digest (None if unknown).
+        self._generators: Optional[dict[str, dict[str, Optional[str]]]] = None
+        self._last_refresh = 0.
+        self._refresh_count = 0
+        self._lookup_refresh_count = 0
+        self._lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._stop = threading.Event()
+
+    def start(self) -> None:
+        """
+        Start periodic refreshes of the index in the background.
+        """
+        if self.refresh_interval <= 0:
+            return
+
+        threading.Thread(target=self._refresh_periodically, name='generator-index', daemon=True).start()
+
+    def stop(self) -> None:
+        """
+        Stop periodic refreshes of the index.
+        """
+        self._stop.set()
+
+    def refresh(self) -> None:
+        """
+        Rebuild the index by searching through the model generators repository.
+        """
+        with self._refresh_lock:
+            self._refresh()
+
+    def generators(self) -> dict[str, list[str]]:
+        """
+        Get all model generators and their tags.
+
+        :return: dict with list of model generator tags for each model generator name
+        """
+        generators = self._get_generators()
+        return {name: list(tags) for name, tags in generators.items()}
+
+    def get_tags(
+            self,
+            generator_name: str,
+            generator_tag: Optional[str] = None
+        ) -> list[str]:
+        """
+        Get tags of a model generator.
+
+        In case the model generator (or the specified tag) is not found, the index is refreshed.
+
+        :param generator_name: model generator name
+        :param generator_tag: expected model generator tag (optional)
+        :return: list of model generator tags (empty if the model generator does not exist)
+        """
+        tags = self._get_generators().get(generator_name, dict())
+
+        if not tags or (generator_tag and generator_tag not in tags):
+            self._refresh_after_miss()
+            tags = self._get_generators().get(generator_name, dict())
+
+        return list(tags)
+
+    def get_digest(
+            self,
+            generator_name: str,
+            generator_tag: str
+        ) -> Optional[str]:
+        """
+        Get digest of the manifest of a model generator image (without triggering a refresh).
+
+        :param generator_name: model generator name
+        :param generator_tag: model generator tag
+        :return: manifest digest (None if unknown)
+        """
+        return self._get_generators().get(generator_name, dict()).get(generator_tag)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get index statistics.
+        """
+        with self._lock:
+            generators = self._generators or dict()
+            return dict(
+                generators=len(generators),
+                tags=sum(len(tags) for tags in generators.values()),
+                refreshes=self._refresh_count,
+                lookup_refreshes=self._lookup_refresh_count,
+                seconds_since_refresh=time.monotonic() - self._last_refresh if self._generators is not None else None,
+            )
+
+    def _get_generators(self) -> dict[str, dict[str, Optional[str]]]:
+        with self._lock:
+            generators = self._generators
+
+        if generators is None:
+            # The index has not been built yet.
+            with self._refresh_lock:
+                if self._generators is None:
+                    self._refresh()
+            with self._lock:
+                generators = self._generators
+
+        return generators or dict()
+
+    def _refresh(self) -> None:
+        # Build the new index completely before replacing the current one.
+        generators: dict[str, dict[str, Optional[str]]] = dict()
+
+        with closing(iterate_search_items(self.search_api_func, prefetch=self.prefetch)) as search_items:
+            for search_item in search_items:
+                tags = generators.setdefault(search_item.name, dict())
+                tags[search_item.version] = get_search_item_digest(search_item)
+
+        with self._lock:
+            self._generators = generators
+            self._last_refresh = time.monotonic()
+            self._refresh_count += 1
+
+    def _refresh_after_miss(self) -> None:
+        requested = time.monotonic()
+
+        with self._refresh_lock:
+            # Skip refresh if the index has been refreshed recently (e.g., by a concurrent lookup).
+            with self._lock:
+                if self._last_refresh >= requested or requested - self._last_refresh < self.min_refresh_interval:
+                    return
+                self._lookup_refresh_count += 1
+
+            self._refresh()
+
+    def _refresh_periodically(self) -> None:
+        while not self._stop.wait(self.refresh_interval):
+            try:
+                self.refresh()
+            except Exception as ex:
+                warn(
+                    f'failed to refresh model generator index: {ex}',
+                    category=RuntimeWarning
+                )
+
+def get_search_item_digest(
+        search_item: Any
+    ) -> Optional[str]:
+    """
+    Get manifest digest of a container image search item (None if not available).
+    """
+    for asset in getattr(search_item, 'assets', None) or []:
+        checksum = getattr(asset, 'checksum', None) or dict()
+        if checksum.get('sha256'):
+            return f'sha256:{checksum["sha256"]}'
+
+    return None
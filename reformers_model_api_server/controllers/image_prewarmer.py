@@ -0,0 +1,185 @@
+import threading
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from fnmatch import fnmatchcase
+from typing import Any, Callable, Iterable, Optional
+from warnings import warn
+
+from reformers_model_api_server.controllers.generator_index import GeneratorIndex
+
+class ImagePrewarmer:
+    """
+    Pull model generator images into the local Docker daemon in the background (pre-warming).
+
+    Periodically, the model generators listed by the index (see `GeneratorIndex`) are matched against an allow-list
+    of patterns (e.g., `generator`, `generator:v*` or `*`). Images of allowed model generator tags that are new or
+    have been updated since they have last been warmed (i.e., their manifest digest has changed) are pulled by a pool
+    of worker threads. Hence, model creations find the image locally instead of pulling it within the request.
+
+    :param generator_index: index of the model generators
+    :param warm_image: function for pulling an image, called with model generator name, tag and manifest digest
+    :param allow_list: patterns of model generator names or `name:tag` (pre-warming is disabled if empty)
+    :param interval: time (in seconds) between pre-warming runs (0 runs pre-warming only once at startup)
+    :param concurrency: maximum number of concurrent pulls
+    """
+
+    def __init__(
+            self,
+            generator_index: GeneratorIndex,
+            warm_image: Callable[[str, str, Optional[str]], Any],
+            allow_list: Iterable[str],
+            interval: float,
+            concurrency: int = 2
+        ) -> None:
+        self.generator_index = generator_index
+        self.warm_image = warm_image
+        self.allow_list = tuple(allow_list)
+        self.interval = interval
+        self.concurrency = concurrency
+
+        # (model generator name, model generator tag) -> manifest digest of the warmed image (None if unknown).
+        self._warmed: dict[tuple[str, str], Optional[str]] = dict()
+        self._in_flight: set[tuple[str, str]] = set()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+
+        self.runs = 0
+        self.pulls = 0
+        self.skipped_pulls = 0
+        self.failures = 0
+
+    @property
+    def enabled(self) -> bool:
+        """
+        Check if pre-warming is enabled.
+        """
+        return bool(self.allow_list) and self.concurrency > 0
+
+    def is_allowed(
+            self,
+            generator_name: str,
+            generator_tag: str
+        ) -> bool:
+        """
+        Check if the image of a model generator tag matches the allow-list.
+
+        :param generator_name: model generator name
+        :param generator_tag: model generator tag
+        """
+        return any(
+            fnmatchcase(generator_name, pattern) or fnmatchcase(f'{generator_name}:{generator_tag}', pattern)
+            for pattern in self.allow_list
+        )
+
+    def start(self) -> None:
+        """
+        Start pre-warming in the background (the first run starts immediately).
+        """
+        if not self.enabled:
+            if self.allow_list:
+                warn(
+                    f'pre-warming of model generator images is disabled (concurrency: {self.concurrency})',
+                    category=RuntimeWarning
+                )
+            return
+
+        threading.Thread(target=self._warm_periodically, name='image-prewarmer', daemon=True).start()
+
+    def stop(self) -> None:
+        """
+        Stop pre-warming (pulls in progress are completed).
+        """
+        self._stop.set()
+
+        with self._lock:
+            executor, self._executor = self._executor, None
+
+        if executor:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+    def warm(self) -> list[Future]:
+        """
+        Pull images of new or updated model generator tags matching the allow-list (without waiting for the pulls).
+
+        :return: futures representing the pulls
+        """
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.concurrency, thread_name_prefix='prewarm')
+            executor = self._executor
+            self.runs += 1
+
+        futures = []
+
+        for generator_name, generator_tags in self.generator_index.generators().items():
+            for generator_tag in generator_tags:
+                if not self.is_allowed(generator_name, generator_tag):
+                    continue
+
+                key = (generator_name, generator_tag)
+                digest = self.generator_index.get_digest(generator_name, generator_tag)
+
+                with self._lock:
+                    if key in self._in_flight or (key in self._warmed and self._warmed[key] == digest):
+                        continue
+                    self._in_flight.add(key)
+
+                futures.append(executor.submit(self._warm_image, key, digest))
+
+        return futures
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get pre-warming statistics.
+        """
+        with self._lock:
+            return dict(
+                enabled=self.enabled,
+                runs=self.runs,
+                warmed=len(self._warmed),
+                in_flight=len(self._in_flight),
+                pulls=self.pulls,
+                skipped_pulls=self.skipped_pulls,
+                failures=self.failures,
+            )
+
+    def _warm_image(
+            self,
+            key: tuple[str, str],
+            digest: Optional[str]
+        ) -> None:
+        try:
+            pulled = self.warm_image(key[0], key[1], digest)
+        except Exception as ex:
+            # The image is pulled again by the next run.
+            warn(
+                f'failed to pre-warm image of model generator {key[0]}:{key[1]}: {ex}',
+                category=RuntimeWarning
+            )
+            with self._lock:
+                self.failures += 1
+        else:
+            with self._lock:
+                self._warmed[key] = digest
+                if pulled:
+                    self.pulls += 1
+                else:
+                    self.skipped_pulls += 1
+        finally:
+            with self._lock:
+                self._in_flight.discard(key)
+
+    def _warm_periodically(self) -> None:
+        while True:
+            try:
+                self.warm()
+            except Exception as ex:
+                warn(
+                    f'failed to pre-warm model generator images: {ex}',
+                    category=RuntimeWarning
+                )
+
+            # Without an interval, images are only warmed once at startup.
+            if self.interval <= 0 or self._stop.wait(self.interval):
+                return
@@ -1,4 +1,5 @@
 import connexion
+from flask import current_app
 from typing import Dict
 from typing import Tuple
 from typing import Union
@@ -17,3 +18,25 @@ def get_auth_info():  # noqa: E501
     """
     auth_time = connexion.context['token_info'].get('auth_time')
     return InfoAuth(auth_time)
+
+
+def get_stats() -> Dict[str, dict]:
+    """Get server statistics
+
+    Statistics about the caches and indexes used for accessing the repository, and further metrics.
+
+    :rtype: Dict[str, dict]
+    """
+    with current_app.app_context():
+        return dict(
+            blob_cache=current_app.blob_cache.stats(),
+            manifest_cache=current_app.manifest_cache.stats(),
+            response_cache=current_app.response_cache.stats(),
+            generator_index=current_app.generator_index.stats(),
+            single_flight=current_app.single_flight.stats(),
+            docker_client=current_app.docker_client_manager.stats(),
+            registry_login=current_app.registry_login_cache.stats(),
+            image_puller=current_app.image_puller.stats(),
+            image_prewarmer=current_app.image_prewarmer.stats(),
+            metrics=current_app.metrics.stats(),
+        )
@@ -0,0 +1,45 @@
+import threading
+
+from typing import Any
+
+class Metrics:
+    """
+    Thread-safe counters for monitoring the server (reported via `GET /stats`).
+    """
+
+    def __init__(self) -> None:
+        self._counters: dict[str, int] = dict()
+        self._lock = threading.Lock()
+
+    def increment(
+            self,
+            name: str,
+            value: int = 1
+        ) -> None:
+        """
+        Increment counter.
+
+        :param name: counter name
+        :param value: increment
+        """
+        with self._lock:
+            self._counters[name] = self._counters.get(name, 0) + value
+
+    def get(
+            self,
+            name: str
+        ) -> int:
+        """
+        Get current value of counter (0 if the counter has never been incremented).
+
+        :param name: counter name
+        """
+        with self._lock:
+            return self._counters.get(name, 0)
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Get all counters.
+        """
+        with self._lock:
+            return dict(self._counters)
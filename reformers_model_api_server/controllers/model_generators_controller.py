@@ -2,13 +2,15 @@
 from connexion.problem import problem
 from flask import current_app
 from functools import partial
-from typing import Any, Union
+from typing import Any, Optional, Union
 
 from reformers_model_api_server.models.info_model_generator import InfoModelGenerator  # noqa: E501
-from reformers_model_api_server.controllers.util import convert_to_nested_dict, paginated_search  # noqa: E501
+from reformers_model_api_server.controllers.request_memo import memoize_per_request
+from reformers_model_api_server.controllers.util import cache_response, convert_to_nested_dict, create_digest, get_cached_response, get_generator_manifest  # noqa: E501
 
-from reformers_model_repo_client import RetrieveBlobsApi, RetrieveManifestsApi, SearchRepositoryApi
+from reformers_model_repo_client import RetrieveBlobsApi
 from reformers_model_repo_client.exceptions import NotFoundException
+from reformers_model_repo_client.models.container_info import ContainerInfo
 
 def info_model_generator(
         generator_name: str,
@@ -17,6 +19,9 @@ def info_model_generator(
     """
     Get information about model generator
 
+    The encoded response is cached, it is used as long as the model generator image config is unchanged.
+    The ETag of the response is derived from the digest of the image config (status 304 if unchanged).
+
     :param generator_name:
     :type generator_name: str
     :param generator_tag:
@@ -25,26 +30,54 @@ def info_model_generator(
     """
     with current_app.app_context():
 
-        manifest_api_instance = RetrieveManifestsApi(current_app.repo_client)
+        # Retrieve manifest of model generator image from the cache or the repository.
+        manifest = get_model_generator_manifest(generator_name, generator_tag)
+        if manifest is None:
+            return model_generator_not_found()
 
-        try:
-            # Retrieve manifest of model generator image from the repository.
-            manifest = manifest_api_instance.get_manifest_generator(generator_name, generator_tag)
-        except NotFoundException as e:
-            return problem(
-                title='Not Found',
-                detail='Model generator not found',
-                status=404,
-                type='about:blank',
-            )
-        except Exception as e:
-            raise Exception(f'Exception when calling RetrieveManifestsApi->get_manifest_generator: {e}\n')
+        # The information is taken from the labels of the image config, which is addressed by its digest.
+        response_key = ('info_model_generator', generator_name, generator_tag)
+        response = get_cached_response(response_key, manifest.config.digest)
+        if response:
+            return response
+
+        return cache_response(
+            response_key, manifest.config.digest, get_model_generator_info(generator_name, generator_tag)
+        )
+
+def get_model_generator_info(
+        generator_name: str,
+        generator_tag: str
+    ) -> Union[InfoModelGenerator, problem]:
+    """
+    Retrieve information about model generator (from the model generator image config labels)
+
+    :param generator_name:
+    :type generator_name: str
+    :param generator_tag:
+    :type generator_tag: str
+    :rtype: Union[InfoModelGenerator, problem]
+    """
+    with current_app.app_context():
+
+        # Retrieve manifest of model generator image from the cache or the repository.
+        manifest = get_model_generator_manifest(generator_name, generator_tag)
+        if manifest is None:
+            return model_generator_not_found()
 
         blobs_api_instance = RetrieveBlobsApi(current_app.repo_client)
 
         try:
-            # Retrieve blob of model generator image from the repository.
-            blob = blobs_api_instance.get_blob_generator(generator_name, manifest.config.digest)
+            # Retrieve blob of model generator image from the cache or the repository (once per request).
+            blob = memoize_per_request(
+                ('blob', manifest.config.digest),
+                partial(
+                    current_app.blob_cache.get_or_fetch,
+                    manifest.config.digest,
+                    partial(blobs_api_instance.get_blob_generator, generator_name, manifest.config.digest),
+                    ContainerInfo.from_dict
+                )
+            )
         except Exception as e:
             raise Exception(f'Exception when calling RetrieveBlobsApi->get_blob_generator: {e}\n')
 
@@ -76,6 +109,41 @@ def info_model_generator(
             build=generator_info.get('build', dict()),
         )
 
+def get_model_generator_manifest(
+        generator_name: str,
+        generator_tag: str
+    ) -> Optional[Any]:
+    """
+    Retrieve manifest of model generator image (from the cache or the repository)
+
+    :param generator_name:
+    :type generator_name: str
+    :param generator_tag:
+    :type generator_tag: str
+    :return: manifest (None if the model generator does not exist)
+    """
+    with current_app.app_context():
+
+        try:
+            return get_generator_manifest(
+                generator_name, generator_tag, current_app.repo_client, current_app.manifest_cache
+            )
+        except NotFoundException as e:
+            return None
+        except Exception as e:
+            raise Exception(f'Exception when calling RetrieveManifestsApi->get_manifest_generator: {e}\n')
+
+def model_generator_not_found() -> problem:
+    """
+    Create problem response for model generators that do not exist
+    """
+    return problem(
+        title='Not Found',
+        detail='Model generator not found',
+        status=404,
+        type='about:blank',
+    )
+
 def list_model_generators() -> dict[str, list[str]] :
     """
     Get list of model generator names
@@ -83,36 +151,32 @@ def list_model_generators() -> dict[str, list[str]] :
     :rtype: dict[str, list[str]]
     """
     with current_app.app_context():
-        # Initialize API search function.
-        search_api_instance = SearchRepositoryApi(current_app.repo_client)
-
-        # Initialize search results.
-        search_results = dict()
-
-        # Search for available model generators.
-        paginated_search(
-            search_api_func=partial(
-                search_api_instance.search_components,
-                repository='model-generators'
-            ),
-            add_search_item=partial(
-                search_add_model_generators_with_tags,
-                search_results=search_results
-            )
-        )
+        # Model generators are looked up in the index, which is refreshed in the background.
+        generators = current_app.generator_index.generators()
+
+    # The encoded response is cached, it is used as long as the index is unchanged (the ETag is derived from the index).
+    response_key = ('list_model_generators',)
+    generators_digest = create_digest(generators)
+    response = get_cached_response(response_key, generators_digest)
+    if response:
+        return response
 
-        return search_results
+    return cache_response(response_key, generators_digest, generators)
 
-def search_add_model_generators_with_tags(
-        search_item: Any,
-        search_results: dict
-    ) -> None:
+def get_model_generator_tags(
+        generator_name: str,
+        generator_tag: Optional[str] = None
+    ) -> list[str]:
     """
-    Retrieve relevant information for model generator search item.
+    Get list of tags of a model generator (empty if the model generator does not exist)
+
+    In case the model generator (or the expected tag) is not found in the index, the index is refreshed.
+
+    :param generator_name:
+    :type generator_name: str
+    :param generator_tag: expected tag
+    :type generator_tag: str
+    :rtype: list[str]
     """
-    model_generator_name = search_item.name
-    model_generator_tags = search_results.get(model_generator_name, None)
-    if model_generator_tags:
-        model_generator_tags.append(search_item.version)
-    else:
-        search_results[search_item.name] = [search_item.version]
+    with current_app.app_context():
+        return current_app.generator_index.get_tags(generator_name, generator_tag)
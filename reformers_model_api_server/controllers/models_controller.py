@@ -1,14 +1,18 @@
 import json
+import queue
+import threading
 import connexion
 import docker
 import docker.models.containers
 
+from concurrent.futures import Future
+from contextlib import closing
 from connexion.problem import problem
 from datetime import datetime, timezone
-from flask import current_app
+from flask import current_app, stream_with_context
 from functools import partial
 from time import sleep
-from typing import Any, Union, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, Optional, Union, Tuple
 from urllib.parse import urlparse
 from warnings import warn
 
@@ -18,38 +22,119 @@ from reformers_model_api_server.models.info_model import InfoModel  # noqa: E501
 from reformers_model_api_server.models.info_model_generator import InfoModelGenerator  # noqa: E501
 from reformers_model_api_server.models.list_models import ListModels  # noqa: E501
 from reformers_model_api_server.models.request_create_model import RequestCreateModel  # noqa: E501
-from reformers_model_api_server.controllers.model_generators_controller import info_model_generator, list_model_generators
-from reformers_model_api_server.controllers.util import get_model_artifact_asset_type, paginated_search, create_task_id, container_name, get_model_image_labels, get_from_nested_dict
+from reformers_model_api_server.controllers.generator_index import get_search_item_digest
+from reformers_model_api_server.controllers.model_generators_controller import get_model_generator_info, get_model_generator_tags
+from reformers_model_api_server.controllers.util import get_model_artifact_asset_type, iterate_search_items, create_task_id, container_name, get_model_image_labels, get_from_nested_dict, gather_results, run_as_future, submit_in_app_context, create_models_cursor, decode_models_cursor, cache_response, create_digest, get_cached_response, get_search_item_fingerprint
 
 from reformers_model_repo_client import HandleArtifactsApi, SearchRepositoryApi
+from reformers_model_repo_client.exceptions import NotFoundException
 
-def registry_login() -> docker.DockerClient:
+def registry_login(
+        docker_client: docker.DockerClient,
+        registry: str
+    ) -> docker.DockerClient:
     """
-    Authenticate to container registries and return docker client.
+    Authenticate to container registry (if not already logged in) and return docker client.
 
+    :param docker_client: docker client (shared by all requests, see `DockerClientManager`)
+    :type docker_client: DockerClient
+    :param registry: container registry of the image (e.g., `host:port`)
+    :type registry: str
     :return: docker client
     :rtype: DockerClient
     """
-    docker_client = docker.from_env()
-
     with current_app.app_context():
 
-        for registry_url, registry_auth_info in current_app.registry_auth_config.items():
-            try:
-                docker_client.login(
-                    registry=registry_url,
-                    username=registry_auth_info[0],
-                    password=registry_auth_info[1],
-                    reauth=False
-                )
-            except docker.errors.APIError: # type: ignore
-                warn(
-                    f'Docker login to {registry_url} failed',
-                    category=RuntimeWarning
-                )
+        # Login sessions are cached per registry (see `RegistryLoginCache`).
+        try:
+            current_app.registry_login_cache.login(docker_client, registry)
+        except docker.errors.APIError: # type: ignore
+            warn(
+                f'Docker login to {registry} failed',
+                category=RuntimeWarning
+            )
 
     return docker_client
 
+def get_generator_registry() -> Optional[str]:
+    """
+    Get address of the container registry of the model generators.
+
+    :return: registry address (`host:port`), None if the registry is not configured
+    :rtype: Optional[str]
+    """
+    with current_app.app_context():
+
+        registry_info = current_app.repo_settings['model-generators']
+        registry_format = registry_info.format
+        if 'docker' != registry_format:
+            return None
+        registry_port = registry_info.additional_properties[registry_format]['httpPort']
+        registry_host = urlparse(current_app.repo_client.configuration.host).hostname
+
+        return f'{registry_host}:{registry_port}'
+
+def pull_generator_image(
+        docker_client: docker.DockerClient,
+        registry: str,
+        generator_name: str,
+        generator_tag: str,
+        generator_digest: Optional[str] = None
+    ) -> bool:
+    """
+    Pull model generator image according to the pull policy (see `ImagePuller`).
+
+    Concurrent pulls of the same image (e.g., by concurrent requests) are coalesced.
+
+    :param docker_client: docker client (shared by all requests, see `DockerClientManager`)
+    :type docker_client: DockerClient
+    :param registry: container registry of the model generators (e.g., `host:port`)
+    :type registry: str
+    :param generator_name:
+    :type generator_name: str
+    :param generator_tag:
+    :type generator_tag: str
+    :param generator_digest: current digest of the model generator image manifest (if known)
+    :type generator_digest: Optional[str]
+    :return: True if the image has been pulled, False if the pull has been skipped
+    :rtype: bool
+    """
+    with current_app.app_context():
+
+        registry_login(docker_client, registry)
+
+        return current_app.image_puller.pull(
+            docker_client, f'{registry}/{generator_name}', generator_tag, generator_digest, generator_name
+        )
+
+def warm_generator_image(
+        app: Any,
+        generator_name: str,
+        generator_tag: str,
+        generator_digest: Optional[str] = None
+    ) -> bool:
+    """
+    Pull model generator image in the background (see `ImagePrewarmer`).
+
+    :param app: Flask app
+    :param generator_name:
+    :type generator_name: str
+    :param generator_tag:
+    :type generator_tag: str
+    :param generator_digest: current digest of the model generator image manifest (if known)
+    :type generator_digest: Optional[str]
+    :return: True if the image has been pulled, False if the pull has been skipped
+    :rtype: bool
+    """
+    with app.app_context():
+
+        registry = get_generator_registry()
+        if not registry:
+            raise RuntimeError('generator container registry not configured')
+
+        with current_app.docker_client_manager.client() as docker_client:
+            return pull_generator_image(docker_client, registry, generator_name, generator_tag, generator_digest)
+
 def create_model(
         generator_name: str,
         generator_tag: str,
@@ -76,8 +161,13 @@ def create_model(
     try:
         info_create_model = RequestCreateModel.from_dict(request_create_model)
 
+        # The digest of the generator image manifest decides whether the image is pulled (see below), hence, the
+        # cached manifest is revalidated (the model generator tag may have been pushed again in the meantime).
+        with current_app.app_context():
+            current_app.manifest_cache.expire((generator_name, generator_tag))
+
         # Get info on model generator.
-        info_generator = info_model_generator(generator_name, generator_tag)
+        info_generator = get_model_generator_info(generator_name, generator_tag)
 
         if not type(info_generator) == InfoModelGenerator:
             return info_generator
@@ -105,34 +195,34 @@ def create_model(
             if not current_app.repo_client.configuration.verify_ssl:
                 env['EXTRA_FLAGS'] = '--skip-tls-verify ' + (env.get('EXTRA_FLAGS', str())) # type: ignore
 
-            registry_info = current_app.repo_settings['model-generators']
-            registry_format = registry_info.format
-            if 'docker' != registry_format:
+            registry_prefix = get_generator_registry()
+            if not registry_prefix:
                 return problem(
                     title='Interal Server Error',
                     detail='Creation of new model failed: generator container registry not configured',
                     status=500,
                     )
-            registry_port = registry_info.additional_properties[registry_format]['httpPort']
-            registry_host = urlparse(current_app.repo_client.configuration.host).hostname
-            registry_prefix = f'{registry_host}:{registry_port}'
 
             image_name = f'{registry_prefix}/{generator_name}:{generator_tag}'
 
-            docker_client = registry_login()
+            # Digest of the generator image manifest revalidated above (the image is pulled if the digest is unknown).
+            generator_digest = current_app.manifest_cache.get_etag((generator_name, generator_tag))
 
-            # Pull the image (this ensures the latest version is pulled)
-            docker_client.images.pull(image_name)
+            # The docker client (and its pooled connections) is shared by all requests, it is leased for Docker calls only.
+            with current_app.docker_client_manager.client() as docker_client:
+                # Pull the image according to the pull policy (e.g., only if the local image is outdated).
+                # Pulls and skipped pulls are counted by the image puller.
+                pull_generator_image(docker_client, registry_prefix, generator_name, generator_tag, generator_digest)
 
-            # Run the container
-            container : docker.models.containers.Container = docker_client.containers.run(
-                name=container_name(model_name, model_tag, creation_date),
-                image=image_name,
-                volumes=[f'{current_app.metagenerator_auth_config_file}:/workspace/config.json:ro'],
-                environment=env, # type: ignore
-                detach=True,
-                remove=current_app.remove_containers,
-                ) # type: ignore
+                # Run the container
+                container : docker.models.containers.Container = docker_client.containers.run(
+                    name=container_name(model_name, model_tag, creation_date),
+                    image=image_name,
+                    volumes=[f'{current_app.metagenerator_auth_config_file}:/workspace/config.json:ro'],
+                    environment=env, # type: ignore
+                    detach=True,
+                    remove=current_app.remove_containers,
+                    ) # type: ignore
 
             timeout = 20
             sleep_time = 1
@@ -142,7 +232,8 @@ def create_model(
                     if current_app.remove_containers:
                         raise RuntimeError('failed to start the generator')
                     else:
-                        logs = container.logs().decode('utf-8')
+                        with current_app.docker_client_manager.client():
+                            logs = container.logs().decode('utf-8')
                         raise RuntimeError(f'failed to start the generator: {logs}')
                 if elapsed_time >= timeout:
                     raise RuntimeError('timeout')
@@ -150,7 +241,11 @@ def create_model(
                 sleep(sleep_time)
                 elapsed_time += sleep_time
 
-                container.reload() # Load this object from the server again and update attrs with the new data.
+                with current_app.docker_client_manager.client():
+                    container.reload() # Load this object from the server again and update attrs with the new data.
+
+            # The model image is about to be pushed, forget previous lookups (e.g., not found).
+            current_app.manifest_cache.invalidate((generator_name, generator_tag, model_name, model_tag))
 
             return (
                 InfoCreateModel(
@@ -172,22 +267,42 @@ def create_model(
 
 def list_models(
           generator_name: str,
-          generator_tag: str
-    ) -> Union[ListModels, problem]:
+          generator_tag: str,
+          view: str = 'full',
+          limit: Optional[int] = None,
+          cursor: Optional[str] = None
+    ) -> Union[ListModels, Tuple[ListModels, int, Dict[str, str]], problem]:
     """
     Get information about available models
 
+    In view `summary`, the information about the models is taken from the search results only, i.e., without
+    retrieving model image labels or model artifact label files (no generation parameters).
+
+    In case a limit or a cursor is specified, the models are sorted by model name and version and only the
+    information about the models on the requested page is retrieved. The cursor for retrieving the next page
+    is returned via header `X-Next-Cursor`.
+
+    The encoded response (without limit and cursor) is cached, it is used as long as the search items
+    (including the checksums of their assets) are unchanged. The ETag of the response is derived from the
+    search items (status 304 if unchanged).
+
     :param generator_name:
     :type generator_name: str
     :param generator_tag:
     :type generator_tag: str
+    :param view: `full` (default) or `summary`
+    :type view: str
+    :param limit: maximum number of model versions per page
+    :type limit: int
+    :param cursor: cursor for retrieving the next page (as returned with the previous page)
+    :type cursor: str
     :rtype: Union[ListModels, Tuple[ListModels, int], Tuple[ListModels, int, Dict[str, str]]]
     """
-    # Get list of available generators.
-    available_model_generators = list_model_generators()
+    # Get available tags of generator.
+    available_generator_tags = get_model_generator_tags(generator_name, generator_tag)
 
     # Check generator name.
-    if generator_name not in available_model_generators:
+    if not available_generator_tags:
         return problem(
             title='Not Found',
             detail='Model generator not found',
@@ -196,7 +311,7 @@ def list_models(
         )
 
     # Check generator tag.
-    if generator_tag not in available_model_generators[generator_name]:
+    if generator_tag not in available_generator_tags:
         return problem(
             title='Not Found',
             detail='Model generator not found (unknown version)',
@@ -205,73 +320,690 @@ def list_models(
         )
 
     with current_app.app_context():
-        # Initialize API search function.
+        # Initialize API search function (concurrent identical searches are coalesced).
         search_api_instance = SearchRepositoryApi(current_app.repo_client)
+        search_components = current_app.single_flight.wrap(
+            search_api_instance.search_components, 'search_components'
+        )
 
-        # Initialize search results.
-        search_results = dict()
+        # Search for model images and model artifacts concurrently (in separate threads). The relevant information
+        # for the search items is retrieved by a pool of worker threads, the searches only submit these lookups
+        # but never wait for them (hence, the searches must not run in the same pool to avoid deadlocks).
+        summary = 'summary' == view
+        search_model_images = partial(
+            iterate_model_search_items,
+            partial(search_components, name=f'*{generator_name}?{generator_tag}*', format='docker'),
+            partial(is_model_image_search_item, generator_name=generator_name, generator_tag=generator_tag)
+        )
+        search_model_artifacts = partial(
+            iterate_model_search_items,
+            partial(search_components, group=f'*{generator_name}?{generator_tag}*', format='maven2'),
+            partial(is_model_artifact_search_item, generator_name=generator_name, generator_tag=generator_tag)
+        )
+        get_model_image_summary_docker = partial(get_model_image_summary, format='docker')
+        get_model_artifact_summary_maven2 = partial(get_model_artifact_summary, format='maven2')
+        get_model_image_info_docker = partial(get_model_image_info, format='docker')
+        get_model_artifact_info_maven2 = partial(get_model_artifact_info, format='maven2')
 
-        # Start with search for model images, ...
-        search_model_images_format = 'docker'
-        paginated_search(
-            search_api_func=partial(
-                search_api_instance.search_components,
-                name=f'*{generator_name}?{generator_tag}*',
-                format=search_model_images_format,
-            ),
-            add_search_item=partial(
-                search_add_model_images_with_tags,
-                search_results=search_results,
-                format=search_model_images_format
-            )
+        # In streaming mode, the information about each model version is sent as soon as it has been retrieved.
+        stream = 'application/x-ndjson' == connexion.request.accept_mimetypes.best_match(
+            ['application/json', 'application/x-ndjson']
         )
+        completed: Optional[queue.Queue] = queue.Queue() if stream else None
+
+        headers = dict()
+        response_key = response_digest = None
+        if limit is None and cursor is None:
+            model_image_search_items = search_model_images()
+            model_artifact_search_items = search_model_artifacts()
+
+            if completed is None:
+                # The ETag of the response is derived from the search items, the encoded response is cached (if the
+                # response cache is enabled) and used as long as they are unchanged. Hence, the searches have to be
+                # completed before retrieving any further information.
+                model_image_search_items, model_artifact_search_items = gather_results([
+                    submit_in_app_context(current_app.search_executor, list, model_image_search_items),
+                    submit_in_app_context(current_app.search_executor, list, model_artifact_search_items),
+                ])
+
+                response_key = ('list_models', generator_name, generator_tag, view)
+                response_digest = create_digest([
+                    get_search_item_fingerprint(search_item)
+                    for search_item in model_image_search_items + model_artifact_search_items
+                ])
+                response = get_cached_response(response_key, response_digest)
+                if response:
+                    return response
+
+                # Cached manifests of model images that have been moved in the meantime must not be used.
+                for search_item in model_image_search_items:
+                    current_app.manifest_cache.expire_if_changed(
+                        tuple(search_item.name.split('/')) + (search_item.version,),
+                        get_search_item_digest(search_item)
+                    )
+
+            if completed is not None:
+                # Each search has a bounded number of lookups whose information has not been sent yet. Model images
+                # are only sent once all model artifacts are known, as they take precedence (see `add_model_info`).
+                image_lookups = threading.Semaphore(2 * current_app.lookup_concurrency)
+                artifact_lookups = threading.Semaphore(2 * current_app.lookup_concurrency)
+                model_artifact_keys: set[Tuple[str, str]] = set()
+                stop = threading.Event()
+
+                # The searches are only started once the response is iterated (e.g., not for HEAD requests).
+                search_model_images = partial(
+                    submit_in_app_context,
+                    current_app.search_executor,
+                    stream_model_info_lookups,
+                    model_image_search_items,
+                    get_model_image_summary_docker if summary else get_model_image_info_docker,
+                    partial(put_completed, completed, MODEL_IMAGE),
+                    image_lookups,
+                    stop,
+                    lookup=not summary
+                )
+                search_model_artifacts = partial(
+                    submit_in_app_context,
+                    current_app.search_executor,
+                    stream_model_info_lookups,
+                    model_artifact_search_items,
+                    get_model_artifact_summary_maven2 if summary else get_model_artifact_info_maven2,
+                    partial(put_completed, completed, MODEL_ARTIFACT),
+                    artifact_lookups,
+                    stop,
+                    lookup=not summary,
+                    model_keys=model_artifact_keys
+                )
+
+                return stream_model_infos(iterate_streamed_model_infos(
+                    completed, search_model_images, search_model_artifacts, image_lookups, artifact_lookups,
+                    model_artifact_keys, stop
+                ))
+
+            searches = [
+                submit_in_app_context(
+                    current_app.search_executor,
+                    submit_model_info_lookups,
+                    model_image_search_items,
+                    get_model_image_summary_docker if summary else get_model_image_info_docker,
+                    lookup=not summary
+                ),
+                submit_in_app_context(
+                    current_app.search_executor,
+                    submit_model_info_lookups,
+                    model_artifact_search_items,
+                    get_model_artifact_summary_maven2 if summary else get_model_artifact_info_maven2,
+                    lookup=not summary
+                ),
+            ]
+
+            model_image_infos, model_artifact_infos = gather_results(searches)
+            model_infos = model_image_infos + model_artifact_infos
+        else:
+            try:
+                after = decode_models_cursor(cursor) if cursor else None
+            except Exception as ex:
+                return problem(
+                    title='Bad Request',
+                    detail=f'Invalid cursor: {ex}',
+                    status=400,
+                    type='about:blank',
+                )
 
-        # ... then continue with search for model artifacts.
-        search_model_artifacts_format = 'maven2'
-        paginated_search(
-            search_api_func=partial(
-                search_api_instance.search_components,
-                group=f'*{generator_name}?{generator_tag}*',
-                format=search_model_artifacts_format,
-            ),
-            add_search_item=partial(
-                search_add_model_artifacts_with_tags,
-                search_results=search_results,
-                format=search_model_artifacts_format
+            # The search items are sorted by means of their summaries (no further information needed).
+            model_artifact_summaries = submit_in_app_context(
+                current_app.search_executor,
+                list_model_summaries,
+                search_model_artifacts(),
+                get_model_artifact_summary_maven2,
+                get_model_artifact_info_maven2
             )
-        )
+            model_image_summaries = list_model_summaries(
+                search_model_images(),
+                get_model_image_summary_docker,
+                get_model_image_info_docker
+            )
+            page, next_page = get_models_page(
+                model_image_summaries + model_artifact_summaries.result(), limit, after
+            )
+            if next_page:
+                headers['X-Next-Cursor'] = create_models_cursor(*next_page)
+
+            # Retrieve the relevant information only for the models on the requested page.
+            if summary:
+                model_infos = [run_as_future(lambda info: info, model_summary) for model_summary, _ in page]
+            else:
+                model_infos = [
+                    submit_in_app_context(current_app.lookup_executor, get_model_info)
+                    for _, get_model_info in page
+                ]
+
+            if completed is not None:
+                for model_info in model_infos:
+                    model_info.add_done_callback(completed.put)
+                return stream_model_infos(
+                    iterate_completed_model_infos(completed, expected=len(model_infos)), headers
+                )
 
-        return ListModels(
+        # Add results in search order (model images first, then model artifacts) or page order.
+        search_results = dict()
+        for model_info in gather_results(model_infos):
+            add_model_info(model_info, search_results)
+
+        models = ListModels(
             generator_name=generator_name,
             generator_tag=generator_tag,
             models=search_results
             )
 
-def search_add_model_images_with_tags(
+        if response_key:
+            return cache_response(response_key, response_digest, models)
+
+        return (models, 200, headers) if headers else models
+
+def get_model(
+          generator_name: str,
+          generator_tag: str,
+          model_name: str,
+          model_version: str
+    ) -> Union[InfoModel, problem]:
+    """
+    Get information about a specific model version
+
+    Only the information about the requested model artifact (or model image) is retrieved.
+
+    :param generator_name:
+    :type generator_name: str
+    :param generator_tag:
+    :type generator_tag: str
+    :param model_name:
+    :type model_name: str
+    :param model_version: model image tag or model artifact version
+    :type model_version: str
+    :rtype: Union[InfoModel, problem]
+    """
+    # Check generator name and tag.
+    if generator_tag not in get_model_generator_tags(generator_name, generator_tag):
+        return problem(
+            title='Not Found',
+            detail='Model generator not found',
+            status=404,
+            type='about:blank',
+        )
+
+    try:
+        # Look for model artifact first (like in the list of models, it takes precedence over a model image with
+        # the same model name and version, see `add_model_info`), ...
+        search_item = find_model_artifact_search_item(generator_name, generator_tag, model_name, model_version)
+        if search_item:
+            _, _, artifact_info = get_model_artifact_info(search_item, 'maven2')
+            return artifact_info
+
+        # ... then for model image.
+        try:
+            return create_model_image_info(generator_name, generator_tag, model_name, model_version, 'docker')
+        except NotFoundException:
+            return problem(
+                title='Not Found',
+                detail='Model not found',
+                status=404,
+                type='about:blank',
+            )
+
+    except Exception as ex:
+        # E.g., the image config or its labels are invalid.
+        return problem(
+            title='Interal Server Error',
+            detail=f'Retrieval of model failed: {ex}',
+            status=500,
+        )
+
+def find_model_artifact_search_item(
+        generator_name: str,
+        generator_tag: str,
+        model_name: str,
+        model_version: str
+    ) -> Optional[Any]:
+    """
+    Search for a specific model artifact.
+
+    :return: search item (None if the model artifact does not exist)
+    """
+    with current_app.app_context():
+        # Concurrent identical searches are coalesced.
+        search_api_instance = SearchRepositoryApi(current_app.repo_client)
+        search_components = current_app.single_flight.wrap(
+            search_api_instance.search_components, 'search_components'
+        )
+
+        search_api_func = partial(
+            search_components,
+            group=f'{generator_name}.{generator_tag}',
+            name=model_name,
+            version=model_version,
+            format='maven2',
+        )
+        with closing(iterate_search_items(search_api_func)) as search_items:
+            for search_item in search_items:
+                if (is_model_artifact_search_item(search_item, generator_name, generator_tag)
+                        and search_item.name == model_name and search_item.version == model_version):
+                    return search_item
+
+    return None
+
+def iterate_model_search_items(
+        search_api_func: Callable,
+        is_search_item: Callable[[Any], bool]
+    ) -> Iterator[Any]:
+    """
+    Iterate through the search items of the requested model generator.
+
+    The search patterns also match other model generators (e.g., generator `pv` matches `pv-ext`), such search items
+    are discarded before retrieving any further information about them.
+
+    :param search_api_func: API function used for searching
+    :param is_search_item: function for checking if a search item belongs to the requested model generator
+    :return: iterator over the search items (in search order)
+    """
+    with current_app.app_context():
+        # The iterator may be consumed by another thread (outside of the app context).
+        prefetch = current_app.search_prefetch
+        metrics = current_app.metrics
+
+    def iterate() -> Iterator[Any]:
+        discarded_search_items = 0
+
+        try:
+            with closing(iterate_search_items(search_api_func, prefetch=prefetch)) as search_items:
+                for search_item in search_items:
+                    if not is_search_item(search_item):
+                        discarded_search_items += 1
+                        continue
+
+                    yield search_item
+        finally:
+            metrics.increment('list_models_discarded_search_items', discarded_search_items)
+
+    return iterate()
+
+def submit_model_info_lookups(
+        search_items: Iterable[Any],
+        get_model_info: Callable[[Any], Optional[Tuple[str, str, InfoModel]]],
+        lookup: bool = True
+    ) -> list[Future]:
+    """
+    Submit the retrieval of the relevant information for each search item to the pool of worker threads.
+
+    :param search_items: search items (see `iterate_model_search_items`)
+    :param get_model_info: function for retrieving information about a search item (see `get_model_image_info`)
+    :param lookup: set this to false in case the information is taken from the search item only (no pool of worker threads needed)
+    :return: futures representing the retrieval of information about the search items (in search order)
+    """
+    model_infos = []
+
+    with current_app.app_context():
+        for search_item in search_items:
+            if lookup:
+                model_info = submit_in_app_context(current_app.lookup_executor, get_model_info, search_item)
+            else:
+                model_info = run_as_future(get_model_info, search_item)
+
+            model_infos.append(model_info)
+
+    return model_infos
+
+# Sources of the futures added to the queue of completed futures in streaming mode (see `iterate_streamed_model_infos`).
+MODEL_IMAGE = 'model_image'
+MODEL_ARTIFACT = 'model_artifact'
+
+def put_completed(
+        completed: queue.Queue,
+        source: str,
+        future: Future
+    ) -> None:
+    """
+    Add completed future to the queue of completed futures (together with its source).
+    """
+    completed.put((source, future))
+
+def stream_model_info_lookups(
+        search_items: Iterable[Any],
+        get_model_info: Callable[[Any], Optional[Tuple[str, str, InfoModel]]],
+        add_done_callback: Callable[[Future], None],
+        pending_lookups: threading.Semaphore,
+        stop: threading.Event,
+        lookup: bool = True,
+        model_keys: Optional[set[Tuple[str, str]]] = None
+    ) -> int:
+    """
+    Submit the retrieval of the relevant information for each search item to the pool of worker threads (streaming mode).
+
+    In contrast to `submit_model_info_lookups`, the futures are not kept, they are only passed to the callback once
+    completed. A lookup is only submitted once the number of pending lookups (i.e., lookups whose information has not
+    been sent yet) permits, the consumer releases the semaphore after sending the information.
+
+    :param search_items: search items (see `iterate_model_search_items`)
+    :param get_model_info: function for retrieving information about a search item (see `get_model_image_info`)
+    :param add_done_callback: callback attached to each future (see `iterate_streamed_model_infos`)
+    :param pending_lookups: semaphore limiting the number of pending lookups
+    :param stop: event signalling that no further lookups are needed (e.g., the client has disconnected)
+    :param lookup: set this to false in case the information is taken from the search item only (no pool of worker threads needed)
+    :param model_keys: set to which model name and version of each search item are added (before it is submitted)
+    :return: number of submitted lookups
+    """
+    submitted = 0
+
+    with current_app.app_context():
+        for search_item in search_items:
+            pending_lookups.acquire()
+            if stop.is_set():
+                break
+
+            if model_keys is not None:
+                model_keys.add((search_item.name, search_item.version))
+
+            if lookup:
+                model_info = submit_in_app_context(current_app.lookup_executor, get_model_info, search_item)
+            else:
+                model_info = run_as_future(get_model_info, search_item)
+
+            model_info.add_done_callback(add_done_callback)
+            submitted += 1
+
+    return submitted
+
+def iterate_streamed_model_infos(
+        completed: queue.Queue,
+        search_model_images: Callable[[], Future],
+        search_model_artifacts: Callable[[], Future],
+        image_lookups: threading.Semaphore,
+        artifact_lookups: threading.Semaphore,
+        model_artifact_keys: set[Tuple[str, str]],
+        stop: threading.Event
+    ) -> Iterator[Tuple[str, str, InfoModel]]:
+    """
+    Iterate through information about models in the order the retrieval has completed (streaming mode).
+
+    Futures are dropped as soon as their information has been sent. Like in the complete list of models (see
+    `add_model_info`), a model artifact takes precedence over a model image with the same model name and version.
+    Hence, model images are held back until the model artifact search has completed (i.e., all model artifacts are
+    known), which is bounded by the number of pending lookups of the model image search.
+
+    The searches are only started once the iteration starts. Only the iteration releases the pending lookups, hence,
+    searches started without ever iterating would wait for them forever (e.g., in case the response is discarded).
+
+    :param completed: queue to which tuples (source, future) are added once completed (see `put_completed`)
+    :param search_model_images: function for starting the model image search (see `stream_model_info_lookups`)
+    :param search_model_artifacts: function for starting the model artifact search (see `stream_model_info_lookups`)
+    :param image_lookups: semaphore limiting the number of pending lookups of the model image search
+    :param artifact_lookups: semaphore limiting the number of pending lookups of the model artifact search
+    :param model_artifact_keys: model names and versions of the model artifacts (complete once the search has completed)
+    :param stop: event for stopping the searches in case the iteration ends early
+    :return: iterator over model name, model version and info about model
+    """
+    expected_images = expected_artifacts = None
+    received_images = received_artifacts = 0
+    held_back_images: list[Future] = []
+
+    def receive(future: Future, pending_lookups: threading.Semaphore) -> Optional[Tuple[str, str, InfoModel]]:
+        try:
+            return future.result()
+        finally:
+            pending_lookups.release()
+
+    try:
+        search_model_images().add_done_callback(partial(put_completed, completed, 'image_search'))
+        search_model_artifacts().add_done_callback(partial(put_completed, completed, 'artifact_search'))
+
+        while (expected_images is None or received_images < expected_images
+                or expected_artifacts is None or received_artifacts < expected_artifacts):
+            source, future = completed.get()
+
+            if 'image_search' == source:
+                expected_images = future.result()
+            elif 'artifact_search' == source:
+                expected_artifacts = future.result()
+                while held_back_images:
+                    model_info = receive(held_back_images.pop(0), image_lookups)
+                    if model_info and model_info[:2] not in model_artifact_keys:
+                        yield model_info
+            elif MODEL_ARTIFACT == source:
+                received_artifacts += 1
+                model_info = receive(future, artifact_lookups)
+                if model_info:
+                    yield model_info
+            else:
+                received_images += 1
+                if expected_artifacts is None:
+                    held_back_images.append(future)
+                    continue
+                model_info = receive(future, image_lookups)
+                if model_info and model_info[:2] not in model_artifact_keys:
+                    yield model_info
+    finally:
+        # Unblock the searches (in case the iteration has ended early).
+        stop.set()
+        image_lookups.release()
+        artifact_lookups.release()
+
+def iterate_completed_model_infos(
+        completed: queue.Queue,
+        expected: int
+    ) -> Iterator[Tuple[str, str, InfoModel]]:
+    """
+    Iterate through information about models in the order the retrieval has completed.
+
+    :param completed: queue to which futures representing the retrieval of information are added once completed
+    :param expected: number of submitted futures
+    :return: iterator over model name, model version and info about model
+    """
+    for _ in range(expected):
+        future = completed.get()
+        model_info = future.result()
+        if model_info:
+            yield model_info
+
+def stream_model_infos(
+        model_infos: Iterator[Tuple[str, str, InfoModel]],
+        headers: Optional[Dict[str, str]] = None
+    ) -> Any:
+    """
+    Create streaming response with one JSON record per model version (newline-delimited JSON).
+
+    Each record has the form `{"model_name": ..., "model_version": ..., "model": ...}`. In case the retrieval
+    of information fails after the response has been started, a problem record is sent as last record.
+    """
+    json_encoder = current_app.json_encoder
+
+    def generate() -> Iterator[str]:
+        try:
+            # The iterator is closed as well in case the response is closed early.
+            with closing(model_infos): # type: ignore
+                for model_name, model_version, info in model_infos:
+                    record = dict(model_name=model_name, model_version=model_version, model=info)
+                    yield json.dumps(record, cls=json_encoder, separators=(',', ':')) + '\n'
+        except Exception as ex:
+            record = dict(title='Interal Server Error', detail=f'Retrieval of models failed: {ex}', status=500)
+            yield json.dumps(record) + '\n'
+
+    return current_app.response_class(
+        stream_with_context(generate()), mimetype='application/x-ndjson', headers=headers
+    )
+
+def list_model_summaries(
+        search_items: Iterable[Any],
+        get_model_summary: Callable[[Any], Optional[Tuple[str, str, InfoModel]]],
+        get_model_info: Callable[[Any], Optional[Tuple[str, str, InfoModel]]]
+    ) -> list[Tuple[Tuple[str, str, InfoModel], Callable[[], Optional[Tuple[str, str, InfoModel]]]]]:
+    """
+    Retrieve summary information for all search items (from the search items only).
+
+    :param search_items: search items (see `iterate_model_search_items`)
+    :param get_model_summary: function for retrieving summary information about a search item (see `get_model_image_summary`)
+    :param get_model_info: function for retrieving information about a search item (see `get_model_image_info`)
+    :return: list of summary information and function for retrieving information about the search item (in search order)
+    """
+    model_summaries = []
+
+    for search_item in search_items:
+        model_summary = get_model_summary(search_item)
+        if model_summary:
+            model_summaries.append((model_summary, partial(get_model_info, search_item)))
+
+    return model_summaries
+
+def get_models_page(
+        model_summaries: list[Tuple[Tuple[str, str, InfoModel], Callable]],
+        limit: Optional[int],
+        after: Optional[Tuple[str, str]]
+    ) -> Tuple[list[Tuple[Tuple[str, str, InfoModel], Callable]], Optional[Tuple[str, str]]]:
+    """
+    Get page of models sorted by model name and version.
+
+    In case there is a model image and a model artifact with the same model name and version, the latter is used
+    (like in the complete list of models, see `add_model_info`).
+
+    :param model_summaries: list of summary information (see `list_model_summaries`)
+    :param limit: maximum number of model versions per page (no limit if not specified)
+    :param after: model name and version of the last model version on the previous page
+    :return: page and model name and version of the last model version on the page (None if there is no next page)
+    """
+    models = dict()
+    for model_summary, get_model_info in model_summaries:
+        model_name, model_version, _ = model_summary
+        models[(model_name, model_version)] = (model_summary, get_model_info)
+
+    keys = sorted(key for key in models if after is None or key > after)
+    page_keys = keys[:limit] if limit else keys
+    next_page = page_keys[-1] if len(page_keys) < len(keys) else None
+
+    return [models[key] for key in page_keys], next_page
+
+def is_model_image_search_item(
         search_item: Any,
-        search_results: dict,
-        format: str,
+        generator_name: str,
+        generator_tag: str
+    ) -> bool:
+    """
+    Check if search item is an image (named `<generator_name>/<generator_tag>/<model_name>`) of the specified model generator.
+    """
+    model_image_name_parts = search_item.name.split('/')
+    return model_image_name_parts[:2] == [generator_name, generator_tag] and len(model_image_name_parts) > 2
+
+def is_model_artifact_search_item(
+        search_item: Any,
+        generator_name: str,
+        generator_tag: str
+    ) -> bool:
+    """
+    Check if search item is an artifact (with group `<generator_name>.<generator_tag>`) of the specified model generator.
+    """
+    return search_item.group == f'{generator_name}.{generator_tag}'
+
+def add_model_info(
+        model_info: Optional[Tuple[str, str, InfoModel]],
+        search_results: dict
     ) -> None:
     """
+    Add information about model (as returned by `get_model_image_info` or `get_model_artifact_info`) to search results.
+    """
+    if not model_info:
+        return
+
+    model_name, model_version, info = model_info
+
+    all_model_versions = search_results.setdefault(model_name, dict())
+    all_model_versions[model_version] = info
+
+def get_model_image_summary(
+        search_item: Any,
+        format: str
+    ) -> Optional[Tuple[str, str, InfoModel]]:
+    """
+    Retrieve summary information for model image search item (from the search item only).
+
+    :return: model name, model version and info about model (None if search item is not a model image)
+    """
+    model_image_name = search_item.name
+    model_version = search_item.version
+
+    model_image_name_parts = model_image_name.split('/')
+    if model_image_name_parts[-1] == 'cache':
+        return None # This is an artifact of the build cache, skip this search result.
+
+    image_info = InfoModel(
+        image_name=model_image_name,
+        image_tag=model_version,
+        format=format
+    )
+
+    return model_image_name_parts[-1], model_version, image_info
+
+def get_model_artifact_summary(
+        search_item: Any,
+        format: str
+    ) -> Tuple[str, str, InfoModel]:
+    """
+    Retrieve summary information for model artifact search item (from the search item only).
+
+    :return: model name, model version and info about model
+    """
+    try:
+        artifact_type = get_model_artifact_asset_type(search_item)
+    except:
+        artifact_type = None
+
+    artifact_info = InfoModel(
+        artifact_id=search_item.name,
+        artifact_version=search_item.version,
+        artifact_group_id=search_item.group,
+        artifact_type=artifact_type,
+        format=format
+    )
+
+    return search_item.name, search_item.version, artifact_info
+
+def get_model_image_info(
+        search_item: Any,
+        format: str,
+    ) -> Optional[Tuple[str, str, InfoModel]]:
+    """
     Retrieve relevant information for model image search item.
+
+    :return: model name, model version and info about model (None if search item is not a model image)
     """
     model_image_name = search_item.name
     model_version = search_item.version
 
     model_image_name_parts = model_image_name.split('/')
     if model_image_name_parts[-1] == 'cache':
-        return # This is an artifact of the build cache, skip this search result.
+        return None # This is an artifact of the build cache, skip this search result.
     else:
         generator_name, generator_tag, model_name = model_image_name.split('/')
 
+    image_info = create_model_image_info(generator_name, generator_tag, model_name, model_version, format)
+
+    return model_name, model_version, image_info
+
+def create_model_image_info(
+        generator_name: str,
+        generator_tag: str,
+        model_name: str,
+        model_version: str,
+        format: str
+    ) -> InfoModel:
+    """
+    Retrieve relevant information for model image (from the caches, if available).
+
+    :return: info about model
+    """
     with current_app.app_context():
         # Retrieve model image config.
         image_labels = get_model_image_labels(
-            generator_name, generator_tag, model_name, model_version, current_app.repo_client
+            generator_name, generator_tag, model_name, model_version, current_app.repo_client,
+            current_app.blob_cache, current_app.manifest_cache
         )
 
-    print('IMAGE_LABELS:', image_labels)
-
     # Retrieve generation parameters from config labels.
     generation_parameters = get_from_nested_dict(
         image_labels, [generator_name, generator_tag, model_name, model_version]
@@ -284,26 +1016,24 @@ def search_add_model_images_with_tags(
     # Retrieve (meta-)information about this specific model.
     model_info = generation_parameters.pop('info', None)
 
-    image_info = InfoModel(
+    return InfoModel(
         parameters=model_parameters,
         optional_parameters=model_optional_parameters,
         info=model_info,
         generation_parameters=generation_parameters,
-        image_name=model_image_name,
+        image_name=f'{generator_name}/{generator_tag}/{model_name}',
         image_tag=model_version,
         format=format
     )
 
-    all_model_versions = search_results.setdefault(model_name, dict())
-    all_model_versions[model_version] = image_info
-
-def search_add_model_artifacts_with_tags(
+def get_model_artifact_info(
         search_item: Any,
-        search_results: dict,
         format: str
-    ) -> None:
+    ) -> Tuple[str, str, InfoModel]:
     """
     Retrieve relevant information for model artifact search item.
+
+    :return: model name, model version and info about model
     """
     model_name = search_item.name
     model_version = search_item.version
@@ -319,10 +1049,13 @@ def search_add_model_artifacts_with_tags(
     labels_file_extension = 'json'
 
     with current_app.app_context():
-        # Retrieve file with labels for model artifact.
+        # Retrieve file with labels for model artifact (concurrent identical requests are coalesced).
         artifacts_api_instance = HandleArtifactsApi(current_app.repo_client)
+        get_artifact_with_http_info = current_app.single_flight.wrap(
+            artifacts_api_instance.get_artifact_with_http_info, 'get_artifact_with_http_info'
+        )
         try:
-            response = artifacts_api_instance.get_artifact_with_http_info(
+            response = get_artifact_with_http_info(
                 generator_name, generator_tag, model_name, model_version,
                 labels_file_name, labels_file_extension
             )
@@ -351,5 +1084,4 @@ def search_add_model_artifacts_with_tags(
         format=format
     )
 
-    all_model_versions = search_results.setdefault(model_name, dict())
-    all_model_versions[model_version] = artifact_info
+    return model_name, model_version, artifact_info
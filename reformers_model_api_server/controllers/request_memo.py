@@ -0,0 +1,94 @@
+import threading
+
+from flask import has_request_context, request
+from typing import Any, Callable, Hashable, Optional
+
+from reformers_model_api_server.controllers.single_flight import SingleFlight, copy_exception
+
+# Key of the memo in the WSGI environment of a request.
+REQUEST_MEMO_ENVIRON_KEY = 'reformers_model_api_server.request_memo'
+
+class RequestMemo:
+    """
+    Memo for the objects retrieved from the repository while handling a single API request.
+
+    Each object (identified by its key) is retrieved at most once, further lookups (also from concurrent
+    worker threads) return the memoized result. Failed lookups are memoized as well, i.e., the exception
+    is re-raised. In contrast to the caches, the memo is never revalidated and is discarded together with
+    the request.
+    """
+
+    def __init__(self) -> None:
+        self._entries: dict[Hashable, tuple[Any, Optional[Exception]]] = dict()
+        self._lock = threading.Lock()
+        self._single_flight = SingleFlight()
+
+        self.hits = 0
+        self.fetches = 0
+
+    def get_or_fetch(
+            self,
+            key: Hashable,
+            fetch: Callable[[], Any]
+        ) -> Any:
+        """
+        Retrieve object from the memo or, if not yet available, retrieve it and add it to the memo.
+
+        :param key: key identifying the object
+        :param fetch: function for retrieving the object
+        :return: object
+        """
+        def lookup() -> tuple[Any, Optional[Exception]]:
+            with self._lock:
+                entry = self._entries.get(key)
+                if entry:
+                    self.hits += 1
+                    return entry
+
+            try:
+                entry = (fetch(), None)
+            except Exception as ex:
+                entry = (None, ex)
+
+            with self._lock:
+                self._entries[key] = entry
+                self.fetches += 1
+            return entry
+
+        # Concurrent lookups of the same object wait for the first one.
+        result, exception = self._single_flight.do(key, lookup)
+        if exception:
+            raise copy_exception(exception)
+        return result
+
+def get_request_memo() -> Optional[RequestMemo]:
+    """
+    Get memo of the current request (None outside of requests).
+
+    The memo is stored in the WSGI environment of the request (and not in `flask.g`), such that it is shared
+    by all app contexts pushed while handling the request.
+    """
+    if not has_request_context():
+        return None
+
+    memo = request.environ.get(REQUEST_MEMO_ENVIRON_KEY)
+    if memo is None:
+        memo = request.environ.setdefault(REQUEST_MEMO_ENVIRON_KEY, RequestMemo())
+    return memo
+
+def memoize_per_request(
+        key: Hashable,
+        fetch: Callable[[], Any]
+    ) -> Any:
+    """
+    Retrieve object at most once per request (outside of requests, the object is always retrieved).
+
+    :param key: key identifying the object
+    :param fetch: function for retrieving the object
+    :return: object
+    """
+    memo = get_request_memo()
+    if memo is None:
+        return fetch()
+
+    return memo.get_or_fetch(key, fetch)
@@ -0,0 +1,121 @@
+import copy
+import threading
+
+from functools import partial
+from typing import Any, Callable, Hashable, Optional
+
+def copy_exception(
+        exception: BaseException
+    ) -> BaseException:
+    """
+    Copy exception (without traceback) for raising it again.
+
+    Raising the same exception instance repeatedly (e.g., for all callers sharing a failed call) extends its
+    traceback with every raise, which keeps the frames (and the objects they reference) alive.
+
+    :param exception: exception to be copied
+    :return: copy of the exception (or the exception without traceback if it cannot be copied)
+    """
+    try:
+        copied = copy.copy(exception)
+    except Exception:
+        return exception.with_traceback(None)
+
+    copied.__cause__ = exception.__cause__
+    copied.__suppress_context__ = exception.__suppress_context__
+    return copied
+
+class _Call:
+    """
+    Call in flight, shared by all callers with the same key.
+    """
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.exception: Optional[BaseException] = None
+
+class SingleFlight:
+    """
+    Coalesce concurrent identical calls (single-flight).
+
+    While a call with a given key is in flight, further calls with the same key do not execute their
+    function, but wait for the call in flight and share its result (or exception). Once the call has
+    finished, the next call with the same key is executed again, i.e., results are not cached.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, _Call] = dict()
+        self._lock = threading.Lock()
+
+        self.executed = 0
+        self.coalesced = 0
+
+    def do(
+            self,
+            key: Hashable,
+            func: Callable[[], Any]
+        ) -> Any:
+        """
+        Execute function, unless a call with the same key is already in flight.
+
+        :param key: key identifying identical calls
+        :param func: function to be executed
+        :return: result of the function (or of the call in flight)
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            if call:
+                self.coalesced += 1
+                is_leader = False
+            else:
+                call = self._calls[key] = _Call()
+                self.executed += 1
+                is_leader = True
+
+        if not is_leader:
+            call.done.wait()
+            if call.exception:
+                raise copy_exception(call.exception)
+            return call.result
+
+        try:
+            call.result = func()
+        except BaseException as ex:
+            call.exception = ex
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+
+        return call.result
+
+    def wrap(
+            self,
+            func: Callable,
+            *key_prefix: Hashable
+        ) -> Callable:
+        """
+        Wrap function, such that concurrent calls with identical arguments are coalesced.
+
+        :param func: function to be wrapped (its arguments must be hashable)
+        :param key_prefix: prefix of the keys identifying identical calls, e.g., the name of an API function
+        :return: wrapped function
+        """
+        def coalesced_func(*args: Any, **kwargs: Any) -> Any:
+            key = (key_prefix, args, tuple(sorted(kwargs.items())))
+            return self.do(key, partial(func, *args, **kwargs))
+
+        return coalesced_func
+
+    def stats(self) -> dict[str, int]:
+        """
+        Get coalescing statistics.
+        """
+        with self._lock:
+            return dict(
+                in_flight=len(self._calls),
+                executed=self.executed,
+                coalesced=self.coalesced,
+            )
@@ -11,7 +11,7 @@ from typing import Optional, Tuple, Union
 
 from reformers_model_api_server.models.info_create_model import InfoCreateModel  # noqa: E501
 from reformers_model_api_server.models.info_model_generator import InfoModelGenerator  # noqa: E501
-from reformers_model_api_server.controllers.model_generators_controller import info_model_generator
+from reformers_model_api_server.controllers.model_generators_controller import get_model_generator_info
 from reformers_model_api_server.controllers.util import container_name, decode_task_id, get_model_image_labels, get_from_nested_dict, prune_docker_logs
 from reformers_model_repo_client.exceptions import NotFoundException
 
@@ -51,7 +51,7 @@ def status_model_creation(
     """
     try:
         # Get info on model generator.
-        info_generator = info_model_generator(generator_name, generator_tag)
+        info_generator = get_model_generator_info(generator_name, generator_tag)
 
         if not type(info_generator) == InfoModelGenerator:
             return info_generator
@@ -108,22 +108,27 @@ def get_task_status(
 
         remove_containers: bool = current_app.remove_containers
 
-        docker_client = docker.from_env()
+        # The docker client (and its pooled connections) is shared by all requests, it is leased for Docker calls only.
+        with current_app.docker_client_manager.client() as docker_client:
 
-        ls = docker_client.containers.list(
-            all=True,
-            filters=dict(name=container_name(model_name, model_tag, task_creation_date))
-            )
+            ls = docker_client.containers.list(
+                all=True,
+                filters=dict(name=container_name(model_name, model_tag, task_creation_date))
+                )
+
+            if 1 == len(ls) and 'exited' != ls[0].status:
+                # The container is still runnning.
+                raw_logs_tail: str = ls[0].logs(tail=1).decode('utf-8') # Get latest output from logs
+                logs_tail: str = prune_docker_logs(raw_logs_tail) # Remove ANSI escape code
+                return TaskStatus.PENDING, f'generator is {ls[0].status}, progress: {logs_tail}'
+        if 0 == len(ls) or (1 == len(ls) and 'exited' == ls[0].status):
+            # The task may have just moved the model tag, hence the cached manifest has to be revalidated.
+            current_app.manifest_cache.expire((generator_name, generator_tag, model_name, model_tag))
 
-        if 1 == len(ls) and 'exited' != ls[0].status:
-            # The container is still runnning.
-            raw_logs_tail: str = ls[0].logs(tail=1).decode('utf-8') # Get latest output from logs
-            logs_tail: str = prune_docker_logs(raw_logs_tail) # Remove ANSI escape code
-            return TaskStatus.PENDING, f'generator is {ls[0].status}, progress: {logs_tail}'
-        elif 0 == len(ls) or (1 == len(ls) and 'exited' == ls[0].status):
             try:
                 image_labels = get_model_image_labels(
-                    generator_name, generator_tag, model_name, model_tag, current_app.repo_client
+                    generator_name, generator_tag, model_name, model_tag, current_app.repo_client,
+                    current_app.blob_cache, current_app.manifest_cache
                 )
             except NotFoundException:
                 # The container has finished but no model image has been created.
@@ -172,4 +177,5 @@ def get_task_logs(
     if remove_containers or 0 == len(containers):
         return None
 
-    return containers[0].logs().decode('utf-8')
+    with current_app.docker_client_manager.client():
+        return containers[0].logs().decode('utf-8')
@@ -1,297 +1,782 @@
-import re
-import base64
-from datetime import datetime, timezone
-from dateutil import parser as datetimeparser
-
-from typing import Any, Callable, Tuple, Optional
-from warnings import warn
-
-from reformers_model_repo_client import RepositorySearchResult, RetrieveBlobsApi, RetrieveManifestsApi
-from reformers_model_repo_client.models.container_info import ContainerInfo
-from reformers_model_repo_client.models.container_info_config import ContainerInfoConfig
-
-ANSI_ESCAPE_PATTERN = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
-LOGS_INDENT_PATTERN = ' -\n\t'
-
-def prune_docker_logs(
-        log_line: str
-    ) -> str:
-    """
-    Remove formatting (ANSI escape codes, indentation, etc.) from a line of docker build logs.
-    """
-    return ANSI_ESCAPE_PATTERN.sub('', log_line).strip(LOGS_INDENT_PATTERN)
-
-def paginated_search(
-        search_api_func: Callable,
-        add_search_item: Callable[[Any], None]
-    ) -> None:
-    """
-    This helper function generalizes the search through paginated search results.
-
-    :param search_api_func: API function used for searching
-    :param add_search_item: function for extracting relevant information from a search item
-    """
-    # Initialize paginated search.
-    continuation_token = None
-    next_page = True
-
-    # Iterate through search result pages.
-    while next_page:
-        # Get search result page.
-        search_result_page = search_api_func(
-            continuation_token=continuation_token
-        )
-
-        # Extract seach result items.
-        for search_item in search_result_page.items:
-            add_search_item(search_item)
-
-        # Check if there is another search result page.
-        continuation_token = search_result_page.continuation_token
-        next_page = continuation_token != None
-
-def get_model_artifact_asset_type(
-        model_info: RepositorySearchResult
-    ) -> str:
-    """
-    Get type (file extension) of model artifact.
-    """
-    # Contruct regex pattern for model artifact file.
-    asset_name = model_info.name.replace('.', '\.')
-    asset_version = model_info.version.replace('.', '\.')
-    asset_pattern = re.compile(f'{asset_name}-{asset_version}\.[a-zA-Z0-9.]+')
-
-    # Get all model artifact assets.
-    assets = model_info.assets
-    # Retrieve asset file names.
-    asset_file_names = [a.path.split('/')[-1] for a in assets]
-    # Remove asset files with extra classifiers.
-    assets_no_classifiers = [a for a in asset_file_names if asset_pattern.fullmatch(a)]
-    # Get asset file extensions
-    asset_file_extensions = [a.split('.')[-1] for a in assets_no_classifiers]
-    # Remove POM and checksum files
-    type = [a for a in asset_file_extensions if a not in ['pom', 'md5', 'sha1', 'sha256', 'sha512']]
-
-    if 1 != len(type):
-        raise RuntimeError(f'unable to determine asset type: {asset_name}-{asset_version}')
-
-    return type[0]
-
-def get_model_image_blob(
-        generator_name: str,
-        generator_tag: str,
-        model_name: str,
-        model_version: str,
-        repo_client: Any
-    ) -> ContainerInfo:
-    # Retrieve manifest of model image from the repository.
-    manifest_api_instance = RetrieveManifestsApi(repo_client)
-    manifest = manifest_api_instance.get_manifest_model(
-        generator_name, generator_tag, model_name, model_version
-    )
-
-    # Retrieve blob of model image from the repository.
-    blobs_api_instance = RetrieveBlobsApi(repo_client)
-    blob = blobs_api_instance.get_blob_model(
-        generator_name, generator_tag, model_name, manifest.config.digest
-    )
-
-    return blob
-
-def get_model_image_config(
-        generator_name: str,
-        generator_tag: str,
-        model_name: str,
-        model_version: str,
-        repo_client: Any
-    ) -> ContainerInfoConfig:
-    blob = get_model_image_blob(
-        generator_name, generator_tag, model_name, model_version, repo_client
-    )
-
-    if not blob.config:
-        raise RuntimeError(
-            f'no model image config found for {generator_name}/{generator_tag}/{model_name}:{model_version}'
-        )
-    else:
-        return blob.config
-
-def get_model_image_creation_date(
-        generator_name: str,
-        generator_tag: str,
-        model_name: str,
-        model_version: str,
-        repo_client: Any
-    ) -> Optional[datetime]:
-    blob = get_model_image_blob(
-        generator_name, generator_tag, model_name, model_version, repo_client
-    )
-
-    return datetimeparser.parse(blob.created) if blob.created else None
-
-def get_model_image_labels(
-        generator_name: str,
-        generator_tag: str,
-        model_name: str,
-        model_version: str,
-        repo_client: Any
-    ) -> dict:
-    config = get_model_image_config(
-        generator_name, generator_tag, model_name, model_version, repo_client
-    )
-
-    return convert_to_nested_dict(config.labels) if config.labels else {}
-
-def convert_to_nested_dict(
-        data: dict[str, Any],
-        conflict_key: str='_value'
-    ) -> dict:
-    """
-    Helper function for converting a dict with dot-separated keys to a nested dict.
-
-    :param data: dict with dot-separated keys
-    :param conflict_key: in case dot-separated keys are inconsistent, the items in question will be added with this subkey instead
-    :return: nested dict
-
-    # Example
-
-    For instance, the following dict
-    ```
-    {'a.x': 'AX', 'a.y': 'AY', 'b.x': 'BX', 'b.y': 'BY'}
-    ```
-
-    will be converted to
-    ```
-    {'a': {'x': 'AX','y': 'AY'}, 'b': {'x': 'BX', 'y': 'BY'}}
-    ```
-
-    In case the keys are inconsistent, the items in question will be added with subkey `conflict_key` (default='_value') instead.
-    For example, in the following dict
-    ```
-    {'a': 'A', 'a.b': 'AB'}
-    ```
-
-    the key 'a' is first associated to a value ('A') and then to a dict ({'b':'B'}).
-    The helper function will patch this inconsistency by returning the following dict:
-    ```
-    {'a': {'_value': 'A', 'b': 'AB'}}
-    ```
-    """
-    # Internal helper function for warnings.
-    def warn_conflict(val: Any, key_from: str, key_to:str) -> None:
-        warn(
-            f'key "{key_from}" is in conflict with a previous key, move previous value "{val}" to key "{key_to}"',
-            category=RuntimeWarning
-        )
-
-    result = {}
-    for k, v in data.items():
-        tmp = result
-
-        # Split the dot-separated key to subkeys.
-        *keys, final = k.split('.')
-
-        # Iterate through all but the last subkey.
-        for subkey in keys:
-            # Get item with specified key. If key doesn't exist, insert empty dict.
-            tmp2 = tmp.setdefault(subkey.strip(), {})
-
-            # If all keys are consistent, the retrieved item should be a dict.
-            # Apply a patch, if this is not the case.
-            if type(tmp2) != dict:
-                warn_conflict(tmp2, k, f'<...>.{subkey}.{conflict_key}')
-                tmp2 = tmp[subkey.strip()] = {conflict_key: tmp2}
-
-            tmp = tmp2
-
-        final = final.strip()
-        if final in tmp:
-            # If all keys are consistent, the last subkey should not have been previously used.
-            # Apply a patch, if this is not the case.
-            warn_conflict(v, k, f'{k}.{conflict_key}')
-            tmp[final][conflict_key] = v
-        else:
-            tmp[final] = v
-
-    return result
-
-def get_from_nested_dict(
-        nested_dict: dict,
-        nested_keys: list[str],
-        default: Any = dict()
-    ) -> Any:
-    """
-    Get data from nested dict.
-    """
-    if 0 == len(nested_keys):
-        raise RuntimeError('no nested keys provided')
-    elif 1 == len(nested_keys):
-        return nested_dict.get(nested_keys[0], default)
-    else:
-        nd = nested_dict.get(nested_keys[0], {})
-        return get_from_nested_dict(nd, nested_keys[1:], default)
-
-def create_task_id(
-        model_name: str,
-        model_tag: str,
-        creation_date: datetime
-    ) -> str:
-    """
-    Create a task ID from a model name, model tag, and creation date.
-
-    The task ID is the Base64-encoded plain task ID.
-    The plain task ID corresponds to <model-name>:<model-tag>:<creation-date-in-epoch-time>.
-    """
-    # Check that model name / tag complies with naming rules.
-    pattern = re.compile('[a-z0-9][a-z0-9-]+')
-    if not pattern.fullmatch(model_name):
-        raise RuntimeError('invalid model name')
-    if not pattern.fullmatch(model_tag):
-        raise RuntimeError('invalid model tag')
-
-    # Concatenate model name, model tag, and creation date.
-    plain_task_id = f'{model_name}:{model_tag}:{creation_date.timestamp()}'
-
-    # Encode plain task ID.
-    task_id = base64.b64encode(plain_task_id.encode())
-
-    return task_id.decode('utf8')
-
-def decode_task_id(
-        task_id: str
-    ) -> Tuple[str, str, datetime]:
-    """
-    Decode a task ID and retrieve the original model name, model tag, and creation date.
-    """
-    try:
-        # Get plain text version of base64-encoded string.
-        plain_task_id = base64.b64decode(task_id).decode('utf-8')
-
-        # Extract model name, model tag, and creation date in epoch time (as string).
-        model_name, model_tag, str_creation_date_epoch = plain_task_id.split(':')
-
-        # Parse to float.
-        creation_date_epoch = float(str_creation_date_epoch)
-    except:
-        raise RuntimeError('malformed task ID')
-
-    # Convert creation time from epoch time to UTC datetime.
-    creation_date = datetime.fromtimestamp(creation_date_epoch, tz=timezone.utc)
-
-    return model_name, model_tag, creation_date
-
-from hashlib import sha1
-
-def container_name(
-       model_name: str,
-       model_tag: str,
-       creation_date: datetime
-) -> str:
-    """
-    Provide a (sufficiently) unique container name from model name, model tag, and creation date.
-    """
-    m = sha1()
-    m.update(model_name.encode())
-    m.update(model_tag.encode())
-    m.update(creation_date.isoformat().encode())
-    return m.hexdigest()
+import re
+import base64
+import json
+import queue
+import threading
+from concurrent.futures import Executor, Future
+from contextlib import closing
+from datetime import datetime, timezone
+from functools import partial
+from dateutil import parser as datetimeparser
+from flask import copy_current_request_context, current_app, has_request_context, request
+from flask import json as flask_json
+from hashlib import sha256
+
+from typing import Any, Callable, Hashable, Iterable, Iterator, Tuple, Optional
+from warnings import warn
+
+from reformers_model_repo_client import RepositorySearchResult, RetrieveBlobsApi, RetrieveManifestsApi
+from reformers_model_repo_client.models.container_info import ContainerInfo
+from reformers_model_repo_client.exceptions import ApiException
+from reformers_model_repo_client.models.container_info_config import ContainerInfoConfig
+
+from reformers_model_api_server.controllers.cache import BlobCache, ManifestCache
+from reformers_model_api_server.controllers.request_memo import memoize_per_request
+from reformers_model_api_server.models.base_model import Model
+
+ANSI_ESCAPE_PATTERN = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
+LOGS_INDENT_PATTERN = ' -\n\t'
+
+def prune_docker_logs(
+        log_line: str
+    ) -> str:
+    """
+    Remove formatting (ANSI escape codes, indentation, etc.) from a line of docker build logs.
+    """
+    return ANSI_ESCAPE_PATTERN.sub('', log_line).strip(LOGS_INDENT_PATTERN)
+
+def paginated_search(
+        search_api_func: Callable,
+        add_search_item: Callable[[Any], None],
+        prefetch: int = 0
+    ) -> None:
+    """
+    This helper function generalizes the search through paginated search results.
+
+    :param search_api_func: API function used for searching
+    :param add_search_item: function for extracting relevant information from a search item
+    :param prefetch: number of search result pages that are retrieved in the background ahead of
+        processing (lookahead depth), set to 0 for retrieving the pages only when they are needed
+    """
+    with closing(iterate_search_items(search_api_func, prefetch=prefetch)) as search_items:
+        for search_item in search_items:
+            add_search_item(search_item)
+
+def iterate_search_items(
+        search_api_func: Callable,
+        limit: Optional[int] = None,
+        stop_condition: Optional[Callable[[Any], bool]] = None,
+        prefetch: int = 0
+    ) -> Iterator[Any]:
+    """
+    Lazily iterate through the items of paginated search results.
+
+    Search result pages are only retrieved when they are needed, i.e., only the current page is kept in
+    memory (plus up to `prefetch` pages, if prefetching is enabled). No further pages are retrieved once
+    the iteration has been terminated, either by the caller or because of `limit` or `stop_condition`.
+
+    :param search_api_func: API function used for searching
+    :param limit: maximum number of search items to iterate through
+    :param stop_condition: iteration is terminated at the first search item for which this function
+        returns True (this search item is not included)
+    :param prefetch: number of search result pages that are retrieved in the background ahead of
+        processing (lookahead depth), set to 0 for retrieving the pages only when they are needed
+    """
+    if limit is not None and limit <= 0:
+        return
+
+    if prefetch > 0:
+        search_result_pages = prefetch_search_result_pages(search_api_func, prefetch)
+    else:
+        search_result_pages = iterate_search_result_pages(search_api_func)
+
+    count = 0
+    with closing(search_result_pages):
+        for search_result_page in search_result_pages:
+            # Extract seach result items.
+            for search_item in search_result_page.items:
+                if stop_condition and stop_condition(search_item):
+                    return
+
+                yield search_item
+
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+def iterate_search_result_pages(
+        search_api_func: Callable
+    ) -> Iterator[Any]:
+    """
+    Iterate through paginated search results, the next page is only retrieved when it is needed.
+
+    :param search_api_func: API function used for searching
+    """
+    # Initialize paginated search.
+    continuation_token = None
+    next_page = True
+
+    # Iterate through search result pages.
+    while next_page:
+        # Get search result page.
+        search_result_page = search_api_func(
+            continuation_token=continuation_token
+        )
+
+        yield search_result_page
+
+        # Check if there is another search result page.
+        continuation_token = search_result_page.continuation_token
+        next_page = continuation_token != None
+
+def prefetch_search_result_pages(
+        search_api_func: Callable,
+        lookahead: int
+    ) -> Iterator[Any]:
+    """
+    Iterate through paginated search results, the pages are retrieved by a background thread.
+
+    The background thread requests the next page as soon as the continuation token is known, such that
+    retrieving pages overlaps with processing them. At most `lookahead` pages are buffered ahead of processing.
+
+    :param search_api_func: API function used for searching
+    :param lookahead: maximum number of buffered search result pages
+    """
+    # Entries are tuples of search result page and exception, (None, None) marks the end of the search.
+    pages: queue.Queue[Tuple[Any, Optional[Exception]]] = queue.Queue(maxsize=lookahead)
+    stop = threading.Event()
+
+    def put(entry: Tuple[Any, Optional[Exception]]) -> bool:
+        # Do not block forever in case iteration has been stopped early.
+        while not stop.is_set():
+            try:
+                pages.put(entry, timeout=0.1)
+                return True
+            except queue.Full:
+                pass
+        return False
+
+    def fetch_pages() -> None:
+        try:
+            for search_result_page in iterate_search_result_pages(search_api_func):
+                if not put((search_result_page, None)):
+                    return
+            put((None, None))
+        except Exception as ex:
+            put((None, ex))
+
+    threading.Thread(target=fetch_pages, name='search-prefetch', daemon=True).start()
+
+    try:
+        while True:
+            search_result_page, exception = pages.get()
+            if exception:
+                raise exception
+            if search_result_page is None:
+                return
+            yield search_result_page
+    finally:
+        stop.set()
+
+def submit_in_app_context(
+        executor: Executor,
+        func: Callable,
+        *args: Any,
+        **kwargs: Any
+    ) -> Future:
+    """
+    Submit a function to be executed by a pool of worker threads within the app context of the current app.
+
+    When called while handling a request, the function is also executed within (a copy of) the request context,
+    such that the worker threads share the memo of the request (see `memoize_per_request`).
+
+    :param executor: pool of worker threads
+    :param func: function to be executed
+    :param args: positional arguments passed to the function
+    :param kwargs: keyword arguments passed to the function
+    :return: future representing the execution of the function
+    """
+    app = current_app._get_current_object() # type: ignore
+
+    def func_in_app_context() -> Any:
+        with app.app_context():
+            return func(*args, **kwargs)
+
+    if has_request_context():
+        func_in_app_context = copy_current_request_context(func_in_app_context)
+
+    return executor.submit(func_in_app_context)
+
+def run_as_future(
+        func: Callable,
+        *args: Any,
+        **kwargs: Any
+    ) -> Future:
+    """
+    Execute a function in the current thread and return a (completed) future representing its execution.
+
+    This allows to handle functions, which are cheap enough to not be submitted to a pool of worker threads,
+    in the same way as submitted functions (see `submit_in_app_context`).
+
+    :param func: function to be executed
+    :param args: positional arguments passed to the function
+    :param kwargs: keyword arguments passed to the function
+    :return: completed future
+    """
+    future: Future = Future()
+
+    try:
+        future.set_result(func(*args, **kwargs))
+    except Exception as ex:
+        future.set_exception(ex)
+
+    return future
+
+def gather_results(
+        futures: Iterable[Future]
+    ) -> list:
+    """
+    Wait for all futures and return their results in the original order.
+
+    An exception raised by one of the functions does not affect the execution of the other functions.
+    After all functions have finished, the first exception (in the original order) is re-raised.
+
+    :param futures: futures representing the execution of functions
+    :return: results of all functions
+    """
+    results = []
+    exception = None
+
+    for future in futures:
+        try:
+            results.append(future.result())
+        except Exception as ex:
+            results.append(None)
+            exception = exception or ex
+
+    if exception:
+        raise exception
+
+    return results
+
+def get_model_artifact_asset_type(
+        model_info: RepositorySearchResult
+    ) -> str:
+    """
+    Get type (file extension) of model artifact.
+    """
+    # Contruct regex pattern for model artifact file.
+    asset_name = model_info.name.replace('.', '\.')
+    asset_version = model_info.version.replace('.', '\.')
+    asset_pattern = re.compile(f'{asset_name}-{asset_version}\.[a-zA-Z0-9.]+')
+
+    # Get all model artifact assets.
+    assets = model_info.assets
+    # Retrieve asset file names.
+    asset_file_names = [a.path.split('/')[-1] for a in assets]
+    # Remove asset files with extra classifiers.
+    assets_no_classifiers = [a for a in asset_file_names if asset_pattern.fullmatch(a)]
+    # Get asset file extensions
+    asset_file_extensions = [a.split('.')[-1] for a in assets_no_classifiers]
+    # Remove POM and checksum files
+    type = [a for a in asset_file_extensions if a not in ['pom', 'md5', 'sha1', 'sha256', 'sha512']]
+
+    if 1 != len(type):
+        raise RuntimeError(f'unable to determine asset type: {asset_name}-{asset_version}')
+
+    return type[0]
+
+def conditional_manifest_fetch(
+        get_manifest_with_http_info: Callable,
+        *args: Any
+    ) -> Callable[[Optional[str]], Optional[Tuple[Any, Optional[str]]]]:
+    """
+    Create a function for conditionally retrieving a manifest from the repository (see `ManifestCache`).
+
+    The created function sends the ETag of a cached manifest via header `If-None-Match` and returns None in case
+    the repository reports that the manifest has not been modified (status 304) or the digest of the retrieved
+    manifest is equal to the ETag. Otherwise, the retrieved manifest and its digest are returned.
+
+    :param get_manifest_with_http_info: API function for retrieving a manifest (including HTTP info)
+    :param args: arguments passed to the API function
+    """
+    def fetch(etag: Optional[str]) -> Optional[Tuple[Any, Optional[str]]]:
+        headers = {'If-None-Match': f'"{etag}"'} if etag else None
+
+        try:
+            response = get_manifest_with_http_info(*args, _headers=headers)
+        except ApiException as ex:
+            if etag and 304 == ex.status:
+                return None
+            raise
+
+        # Registries provide the manifest digest via header (the ETag is the quoted digest).
+        response_headers = response.headers or {}
+        digest = response_headers.get('Docker-Content-Digest') or response_headers.get('ETag')
+        if digest:
+            digest = digest.removeprefix('W/').strip('"')
+
+        if etag and digest == etag:
+            return None
+
+        return response.data, digest
+
+    return fetch
+
+def get_generator_manifest(
+        generator_name: str,
+        generator_tag: str,
+        repo_client: Any,
+        manifest_cache: Optional[ManifestCache] = None
+    ) -> Any:
+    """
+    Retrieve manifest of model generator image (from the cache, if available).
+
+    The manifest is retrieved at most once per request.
+    """
+    manifest_api_instance = RetrieveManifestsApi(repo_client)
+
+    if not manifest_cache:
+        fetch_manifest = partial(manifest_api_instance.get_manifest_generator, generator_name, generator_tag)
+    else:
+        fetch_manifest = partial(
+            manifest_cache.get_or_fetch,
+            (generator_name, generator_tag),
+            conditional_manifest_fetch(
+                manifest_api_instance.get_manifest_generator_with_http_info,
+                generator_name, generator_tag
+            )
+        )
+
+    return memoize_per_request(('manifest', generator_name, generator_tag), fetch_manifest)
+
+def get_model_manifest(
+        generator_name: str,
+        generator_tag: str,
+        model_name: str,
+        model_version: str,
+        repo_client: Any,
+        manifest_cache: Optional[ManifestCache] = None
+    ) -> Any:
+    """
+    Retrieve manifest of model image (from the cache, if available).
+
+    The manifest is retrieved at most once per request.
+    """
+    manifest_api_instance = RetrieveManifestsApi(repo_client)
+
+    if not manifest_cache:
+        fetch_manifest = partial(
+            manifest_api_instance.get_manifest_model,
+            generator_name, generator_tag, model_name, model_version
+        )
+    else:
+        fetch_manifest = partial(
+            manifest_cache.get_or_fetch,
+            (generator_name, generator_tag, model_name, model_version),
+            conditional_manifest_fetch(
+                manifest_api_instance.get_manifest_model_with_http_info,
+                generator_name, generator_tag, model_name, model_version
+            )
+        )
+
+    return memoize_per_request(
+        ('manifest', generator_name, generator_tag, model_name, model_version), fetch_manifest
+    )
+
+def get_model_image_blob(
+        generator_name: str,
+        generator_tag: str,
+        model_name: str,
+        model_version: str,
+        repo_client: Any,
+        blob_cache: Optional[BlobCache] = None,
+        manifest_cache: Optional[ManifestCache] = None
+    ) -> ContainerInfo:
+    # Retrieve manifest of model image from the cache or the repository.
+    manifest = get_model_manifest(
+        generator_name, generator_tag, model_name, model_version, repo_client, manifest_cache
+    )
+
+    # Retrieve blob of model image from the repository.
+    blobs_api_instance = RetrieveBlobsApi(repo_client)
+    fetch_blob = partial(
+        blobs_api_instance.get_blob_model,
+        generator_name, generator_tag, model_name, manifest.config.digest
+    )
+
+    if blob_cache:
+        # Blobs are content-addressed, i.e., cached blobs never become stale.
+        fetch_blob = partial(
+            blob_cache.get_or_fetch, manifest.config.digest, fetch_blob, ContainerInfo.from_dict
+        )
+
+    return memoize_per_request(('blob', manifest.config.digest), fetch_blob)
+
+def get_model_image_config(
+        generator_name: str,
+        generator_tag: str,
+        model_name: str,
+        model_version: str,
+        repo_client: Any,
+        blob_cache: Optional[BlobCache] = None,
+        manifest_cache: Optional[ManifestCache] = None
+    ) -> ContainerInfoConfig:
+    blob = get_model_image_blob(
+        generator_name, generator_tag, model_name, model_version, repo_client, blob_cache, manifest_cache
+    )
+
+    if not blob.config:
+        raise RuntimeError(
+            f'no model image config found for {generator_name}/{generator_tag}/{model_name}:{model_version}'
+        )
+    else:
+        return blob.config
+
+def get_model_image_creation_date(
+        generator_name: str,
+        generator_tag: str,
+        model_name: str,
+        model_version: str,
+        repo_client: Any,
+        blob_cache: Optional[BlobCache] = None,
+        manifest_cache: Optional[ManifestCache] = None
+    ) -> Optional[datetime]:
+    blob = get_model_image_blob(
+        generator_name, generator_tag, model_name, model_version, repo_client, blob_cache, manifest_cache
+    )
+
+    return datetimeparser.parse(blob.created) if blob.created else None
+
+def get_model_image_labels(
+        generator_name: str,
+        generator_tag: str,
+        model_name: str,
+        model_version: str,
+        repo_client: Any,
+        blob_cache: Optional[BlobCache] = None,
+        manifest_cache: Optional[ManifestCache] = None
+    ) -> dict:
+    config = get_model_image_config(
+        generator_name, generator_tag, model_name, model_version, repo_client, blob_cache, manifest_cache
+    )
+
+    return convert_to_nested_dict(config.labels) if config.labels else {}
+
+def convert_to_nested_dict(
+        data: dict[str, Any],
+        conflict_key: str='_value'
+    ) -> dict:
+    """
+    Helper function for converting a dict with dot-separated keys to a nested dict.
+
+    :param data: dict with dot-separated keys
+    :param conflict_key: in case dot-separated keys are inconsistent, the items in question will be added with this subkey instead
+    :return: nested dict
+
+    # Example
+
+    For instance, the following dict
+    ```
+    {'a.x': 'AX', 'a.y': 'AY', 'b.x': 'BX', 'b.y': 'BY'}
+    ```
+
+    will be converted to
+    ```
+    {'a': {'x': 'AX','y': 'AY'}, 'b': {'x': 'BX', 'y': 'BY'}}
+    ```
+
+    In case the keys are inconsistent, the items in question will be added with subkey `conflict_key` (default='_value') instead.
+    For example, in the following dict
+    ```
+    {'a': 'A', 'a.b': 'AB'}
+    ```
+
+    the key 'a' is first associated to a value ('A') and then to a dict ({'b':'B'}).
+    The helper function will patch this inconsistency by returning the following dict:
+    ```
+    {'a': {'_value': 'A', 'b': 'AB'}}
+    ```
+    """
+    # Internal helper function for warnings.
+    def warn_conflict(val: Any, key_from: str, key_to:str) -> None:
+        warn(
+            f'key "{key_from}" is in conflict with a previous key, move previous value "{val}" to key "{key_to}"',
+            category=RuntimeWarning
+        )
+
+    result = {}
+    for k, v in data.items():
+        tmp = result
+
+        # Split the dot-separated key to subkeys.
+        *keys, final = k.split('.')
+
+        # Iterate through all but the last subkey.
+        for subkey in keys:
+            # Get item with specified key. If key doesn't exist, insert empty dict.
+            tmp2 = tmp.setdefault(subkey.strip(), {})
+
+            # If all keys are consistent, the retrieved item should be a dict.
+            # Apply a patch, if this is not the case.
+            if type(tmp2) != dict:
+                warn_conflict(tmp2, k, f'<...>.{subkey}.{conflict_key}')
+                tmp2 = tmp[subkey.strip()] = {conflict_key: tmp2}
+
+            tmp = tmp2
+
+        final = final.strip()
+        if final in tmp:
+            # If all keys are consistent, the last subkey should not have been previously used.
+            # Apply a patch, if this is not the case.
+            warn_conflict(v, k, f'{k}.{conflict_key}')
+            tmp[final][conflict_key] = v
+        else:
+            tmp[final] = v
+
+    return result
+
+def get_from_nested_dict(
+        nested_dict: dict,
+        nested_keys: list[str],
+        default: Any = dict()
+    ) -> Any:
+    """
+    Get data from nested dict.
+    """
+    if 0 == len(nested_keys):
+        raise RuntimeError('no nested keys provided')
+    elif 1 == len(nested_keys):
+        return nested_dict.get(nested_keys[0], default)
+    else:
+        nd = nested_dict.get(nested_keys[0], {})
+        return get_from_nested_dict(nd, nested_keys[1:], default)
+
+def create_task_id(
+        model_name: str,
+        model_tag: str,
+        creation_date: datetime
+    ) -> str:
+    """
+    Create a task ID from a model name, model tag, and creation date.
+
+    The task ID is the Base64-encoded plain task ID.
+    The plain task ID corresponds to <model-name>:<model-tag>:<creation-date-in-epoch-time>.
+    """
+    # Check that model name / tag complies with naming rules.
+    pattern = re.compile('[a-z0-9][a-z0-9-]+')
+    if not pattern.fullmatch(model_name):
+        raise RuntimeError('invalid model name')
+    if not pattern.fullmatch(model_tag):
+        raise RuntimeError('invalid model tag')
+
+    # Concatenate model name, model tag, and creation date.
+    plain_task_id = f'{model_name}:{model_tag}:{creation_date.timestamp()}'
+
+    # Encode plain task ID.
+    task_id = base64.b64encode(plain_task_id.encode())
+
+    return task_id.decode('utf8')
+
+def decode_task_id(
+        task_id: str
+    ) -> Tuple[str, str, datetime]:
+    """
+    Decode a task ID and retrieve the original model name, model tag, and creation date.
+    """
+    try:
+        # Get plain text version of base64-encoded string.
+        plain_task_id = base64.b64decode(task_id).decode('utf-8')
+
+        # Extract model name, model tag, and creation date in epoch time (as string).
+        model_name, model_tag, str_creation_date_epoch = plain_task_id.split(':')
+
+        # Parse to float.
+        creation_date_epoch = float(str_creation_date_epoch)
+    except:
+        raise RuntimeError('malformed task ID')
+
+    # Convert creation time from epoch time to UTC datetime.
+    creation_date = datetime.fromtimestamp(creation_date_epoch, tz=timezone.utc)
+
+    return model_name, model_tag, creation_date
+
+def create_models_cursor(
+        model_name: str,
+        model_version: str
+    ) -> str:
+    """
+    Create a cursor for retrieving the next page of models (after the specified model name and version).
+
+    The cursor is the Base64-encoded JSON array [<model-name>, <model-version>].
+    """
+    plain_cursor = json.dumps([model_name, model_version])
+
+    return base64.urlsafe_b64encode(plain_cursor.encode()).decode('utf8')
+
+def decode_models_cursor(
+        cursor: str
+    ) -> Tuple[str, str]:
+    """
+    Decode a cursor and retrieve the model name and version of the last model on the previous page.
+    """
+    try:
+        model_name, model_version = json.loads(base64.urlsafe_b64decode(cursor).decode('utf-8'))
+    except:
+        raise RuntimeError('malformed cursor')
+
+    if not (isinstance(model_name, str) and isinstance(model_version, str)):
+        raise RuntimeError('malformed cursor')
+
+    return model_name, model_version
+
+def create_digest(
+        data: Any
+    ) -> str:
+    """
+    Create digest (SHA-256) of JSON-serializable data, e.g., for validating cached responses.
+    """
+    plain_data = json.dumps(data, sort_keys=True, separators=(',', ':'), default=str)
+
+    return 'sha256:' + sha256(plain_data.encode('utf-8')).hexdigest()
+
+def get_search_item_fingerprint(
+        search_item: Any
+    ) -> list:
+    """
+    Get the properties of a search item that determine the information about it (name, version and asset checksums).
+
+    Other properties (e.g., the time of the last download of an asset) are omitted, as they change without
+    affecting the information.
+    """
+    assets = [
+        [getattr(asset, 'path', None), getattr(asset, 'checksum', None)]
+        for asset in getattr(search_item, 'assets', None) or []
+    ]
+
+    return [getattr(search_item, 'group', None), search_item.name, search_item.version, assets]
+
+def get_cached_response(
+        key: Hashable,
+        digest: Optional[str]
+    ) -> Optional[Any]:
+    """
+    Get response from the response cache (or status 304 in case the client's copy of the response is unchanged).
+
+    In case the client sends the ETag of the current response via header `If-None-Match`, status 304 (Not Modified)
+    is returned without body. Otherwise, a cached response is sent as is, i.e., without constructing and encoding
+    the response data again.
+
+    :param key: cache key, e.g., (endpoint, parameters)
+    :param digest: digest of the underlying data (no cached response is used if not available)
+    :return: response or None if there is no valid cached response
+    """
+    if not digest:
+        return None
+
+    with current_app.app_context():
+        response_cache = current_app.response_cache
+        metrics = current_app.metrics
+
+    etag = create_response_etag(key, digest, is_gzip_accepted(response_cache))
+    if request.if_none_match.contains_weak(etag):
+        metrics.increment('not_modified_responses')
+        return current_app.response_class(status=304, headers=create_cache_headers(etag))
+
+    if not response_cache.enabled:
+        return None
+
+    cached = response_cache.get(key, digest)
+    return create_json_response(*cached, etag) if cached else None
+
+def cache_response(
+        key: Hashable,
+        digest: Optional[str],
+        data: Any
+    ) -> Any:
+    """
+    Encode response data and add it to the response cache (the response is sent with an ETag).
+
+    Only models, dicts and lists are cached, other responses (e.g., problems) are returned unchanged.
+
+    :param key: cache key, e.g., (endpoint, parameters)
+    :param digest: digest of the underlying data (the response is neither cached nor sent with an ETag if not available)
+    :param data: response data
+    :return: response
+    """
+    if not digest or not isinstance(data, (Model, dict, list)):
+        return data
+
+    with current_app.app_context():
+        response_cache = current_app.response_cache
+
+    # Encode the response data like connexion does, i.e., with the JSON encoder of the app and indentation.
+    body = (flask_json.dumps(data, indent=2) + '\n').encode('utf-8')
+
+    gzip_body = None
+    if response_cache.enabled:
+        body, gzip_body = response_cache.put(key, digest, body)
+
+    return create_json_response(body, gzip_body, create_response_etag(key, digest, is_gzip_accepted(response_cache)))
+
+def create_json_response(
+        body: bytes,
+        gzip_body: Optional[bytes],
+        etag: str
+    ) -> Any:
+    """
+    Create response from encoded JSON response data (the compressed variant is sent if available and accepted by the client).
+    """
+    headers = create_cache_headers(etag)
+
+    if gzip_body is not None and request.accept_encodings['gzip'] > 0:
+        body = gzip_body
+        headers['Content-Encoding'] = 'gzip'
+
+    return current_app.response_class(body, mimetype='application/json', headers=headers)
+
+def is_gzip_accepted(
+        response_cache: Any
+    ) -> bool:
+    """
+    Check if the compressed variant of a cached response is sent (i.e., responses are cached and the client accepts gzip).
+    """
+    return response_cache.enabled and request.accept_encodings['gzip'] > 0
+
+def create_response_etag(
+        key: Hashable,
+        digest: str,
+        gzip: bool = False
+    ) -> str:
+    """
+    Create strong ETag of a response from the cache key and the digest of the underlying data.
+
+    The compressed variant of the response has its own ETag (suffix `-gzip`).
+    """
+    etag = create_digest([key, digest]).removeprefix('sha256:')
+
+    return f'{etag}-gzip' if gzip else etag
+
+def create_cache_headers(
+        etag: str
+    ) -> dict[str, str]:
+    """
+    Create headers for caching responses on the client side (ETag and Cache-Control).
+
+    Responses have to be revalidated via header `If-None-Match` before they are reused, unless a maximum age
+    is configured.
+    """
+    with current_app.app_context():
+        max_age = current_app.response_max_age
+
+    return {
+        'ETag': f'"{etag}"',
+        'Cache-Control': f'max-age={max_age}' if max_age > 0 else 'no-cache',
+        'Vary': 'Accept-Encoding',
+    }
+
+from hashlib import sha1
+
+def container_name(
+       model_name: str,
+       model_tag: str,
+       creation_date: datetime
+) -> str:
+    """
+    Provide a (sufficiently) unique container name from model name, model tag, and creation date.
+    """
+    m = sha1()
+    m.update(model_name.encode())
+    m.update(model_tag.encode())
+    m.update(creation_date.isoformat().encode())
+    return m.hexdigest()
@@ -12,6 +12,22 @@ class ApplicationProblemJson(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'detail': str,
+        'status': int,
+        'title': str,
+        'type': str
+    }
+
+    attribute_map = {
+        'detail': 'detail',
+        'status': 'status',
+        'title': 'title',
+        'type': 'type'
+    }
+
+    __slots__ = ('_detail', '_status', '_title', '_type')
+
     def __init__(self, detail=None, status=None, title=None, type=None):  # noqa: E501
         """ApplicationProblemJson - a model defined in OpenAPI
 
@@ -24,20 +40,6 @@ class ApplicationProblemJson(Model):
         :param type: The type of this ApplicationProblemJson.  # noqa: E501
         :type type: str
         """
-        self.openapi_types = {
-            'detail': str,
-            'status': int,
-            'title': str,
-            'type': str
-        }
-
-        self.attribute_map = {
-            'detail': 'detail',
-            'status': 'status',
-            'title': 'title',
-            'type': 'type'
-        }
-
         self._detail = detail
         self._status = status
         self._title = title
@@ -16,6 +16,10 @@ class Model:
     # value is json key in definition.
     attribute_map: typing.Dict[str, str] = {}
 
+    # Attribute values are stored in slots (declared by the subclasses)
+    # instead of a per-instance dict.
+    __slots__ = ()
+
     @classmethod
     def from_dict(cls: typing.Type[T], dikt) -> T:
         """Returns the dict as a model"""
@@ -61,7 +65,13 @@ class Model:
 
     def __eq__(self, other):
         """Returns true if both objects are equal"""
-        return self.__dict__ == other.__dict__
+        if not isinstance(other, Model) \
+                or self.openapi_types != other.openapi_types \
+                or self.attribute_map != other.attribute_map:
+            return False
+
+        return all(getattr(self, attr) == getattr(other, attr)
+                   for attr in self.openapi_types)
 
     def __ne__(self, other):
         """Returns true if both objects are not equal"""
@@ -14,6 +14,18 @@ class CreateModel(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'model_name': str,
+        'parameters': Dict[str, object]
+    }
+
+    attribute_map = {
+        'model_name': 'model_name',
+        'parameters': 'parameters'
+    }
+
+    __slots__ = ('_model_name', '_parameters')
+
     def __init__(self, model_name=None, parameters=None):  # noqa: E501
         """CreateModel - a model defined in OpenAPI
 
@@ -22,16 +34,6 @@ class CreateModel(Model):
         :param parameters: The parameters of this CreateModel.  # noqa: E501
         :type parameters: Dict[str, object]
         """
-        self.openapi_types = {
-            'model_name': str,
-            'parameters': Dict[str, object]
-        }
-
-        self.attribute_map = {
-            'model_name': 'model_name',
-            'parameters': 'parameters'
-        }
-
         self._model_name = model_name
         self._parameters = parameters
 
@@ -12,20 +12,22 @@ class InfoAuth(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        '_date': str
+    }
+
+    attribute_map = {
+        '_date': 'date'
+    }
+
+    __slots__ = ('__date',)
+
     def __init__(self, _date=None):  # noqa: E501
         """InfoAuth - a model defined in OpenAPI
 
         :param _date: The _date of this InfoAuth.  # noqa: E501
         :type _date: str
         """
-        self.openapi_types = {
-            '_date': str
-        }
-
-        self.attribute_map = {
-            '_date': 'date'
-        }
-
         self.__date = _date
 
     @classmethod
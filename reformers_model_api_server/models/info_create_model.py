@@ -14,6 +14,22 @@ class InfoCreateModel(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'task_id': str,
+        'status': str,
+        'creation_date': datetime,
+        'info': str
+    }
+
+    attribute_map = {
+        'task_id': 'task-id',
+        'status': 'status',
+        'creation_date': 'creation-date',
+        'info': 'info'
+    }
+
+    __slots__ = ('_task_id', '_status', '_creation_date', '_info')
+
     def __init__(self, task_id=None, status=None, creation_date=None, info=None):  # noqa: E501
         """InfoCreateModel - a model defined in OpenAPI
 
@@ -26,20 +42,6 @@ class InfoCreateModel(Model):
         :param info: The info of this InfoCreateModel.  # noqa: E501
         :type info: str
         """
-        self.openapi_types = {
-            'task_id': str,
-            'status': str,
-            'creation_date': datetime,
-            'info': str
-        }
-
-        self.attribute_map = {
-            'task_id': 'task-id',
-            'status': 'status',
-            'creation_date': 'creation-date',
-            'info': 'info'
-        }
-
         self._task_id = task_id
         self._status = status
         self._creation_date = creation_date
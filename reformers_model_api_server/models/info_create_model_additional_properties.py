@@ -12,20 +12,22 @@ class InfoCreateModelAdditionalProperties(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'info': str
+    }
+
+    attribute_map = {
+        'info': 'info'
+    }
+
+    __slots__ = ('_info',)
+
     def __init__(self, info=None):  # noqa: E501
         """InfoCreateModelAdditionalProperties - a model defined in OpenAPI
 
         :param info: The info of this InfoCreateModelAdditionalProperties.  # noqa: E501
         :type info: str
         """
-        self.openapi_types = {
-            'info': str
-        }
-
-        self.attribute_map = {
-            'info': 'info'
-        }
-
         self._info = info
 
     @classmethod
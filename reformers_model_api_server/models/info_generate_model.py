@@ -14,6 +14,22 @@ class InfoGenerateModel(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'generator_name': str,
+        'generator_tag': str,
+        'mandatory_parameters': Dict[str, object],
+        'optional_parameters': Dict[str, object]
+    }
+
+    attribute_map = {
+        'generator_name': 'generator_name',
+        'generator_tag': 'generator_tag',
+        'mandatory_parameters': 'mandatory_parameters',
+        'optional_parameters': 'optional_parameters'
+    }
+
+    __slots__ = ('_generator_name', '_generator_tag', '_mandatory_parameters', '_optional_parameters')
+
     def __init__(self, generator_name=None, generator_tag=None, mandatory_parameters=None, optional_parameters=None):  # noqa: E501
         """InfoGenerateModel - a model defined in OpenAPI
 
@@ -26,20 +42,6 @@ class InfoGenerateModel(Model):
         :param optional_parameters: The optional_parameters of this InfoGenerateModel.  # noqa: E501
         :type optional_parameters: Dict[str, object]
         """
-        self.openapi_types = {
-            'generator_name': str,
-            'generator_tag': str,
-            'mandatory_parameters': Dict[str, object],
-            'optional_parameters': Dict[str, object]
-        }
-
-        self.attribute_map = {
-            'generator_name': 'generator_name',
-            'generator_tag': 'generator_tag',
-            'mandatory_parameters': 'mandatory_parameters',
-            'optional_parameters': 'optional_parameters'
-        }
-
         self._generator_name = generator_name
         self._generator_tag = generator_tag
         self._mandatory_parameters = mandatory_parameters
@@ -18,6 +18,36 @@ class InfoModel(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'parameters': Dict[str, ModelParametersValue],
+        'optional_parameters': Dict[str, ModelParametersValue],
+        'info': str,
+        'generation_parameters': Dict[str, ModelParametersValue],
+        'format': ModelFormat,
+        'image_name': str,
+        'image_tag': str,
+        'artifact_group_id': str,
+        'artifact_id': str,
+        'artifact_version': str,
+        'artifact_type': str
+    }
+
+    attribute_map = {
+        'parameters': 'parameters',
+        'optional_parameters': 'optional_parameters',
+        'info': 'info',
+        'generation_parameters': 'generation_parameters',
+        'format': 'format',
+        'image_name': 'image-name',
+        'image_tag': 'image-tag',
+        'artifact_group_id': 'artifact-group-id',
+        'artifact_id': 'artifact-id',
+        'artifact_version': 'artifact-version',
+        'artifact_type': 'artifact-type'
+    }
+
+    __slots__ = ('_parameters', '_optional_parameters', '_info', '_generation_parameters', '_format', '_image_name', '_image_tag', '_artifact_group_id', '_artifact_id', '_artifact_version', '_artifact_type')
+
     def __init__(self, parameters=None, optional_parameters=None, info=None, generation_parameters=None, format=None, image_name=None, image_tag=None, artifact_group_id=None, artifact_id=None, artifact_version=None, artifact_type=None):  # noqa: E501
         """InfoModel - a model defined in OpenAPI
 
@@ -44,34 +74,6 @@ class InfoModel(Model):
         :param artifact_type: The artifact_type of this InfoModel.  # noqa: E501
         :type artifact_type: str
         """
-        self.openapi_types = {
-            'parameters': Dict[str, ModelParametersValue],
-            'optional_parameters': Dict[str, ModelParametersValue],
-            'info': str,
-            'generation_parameters': Dict[str, ModelParametersValue],
-            'format': ModelFormat,
-            'image_name': str,
-            'image_tag': str,
-            'artifact_group_id': str,
-            'artifact_id': str,
-            'artifact_version': str,
-            'artifact_type': str
-        }
-
-        self.attribute_map = {
-            'parameters': 'parameters',
-            'optional_parameters': 'optional_parameters',
-            'info': 'info',
-            'generation_parameters': 'generation_parameters',
-            'format': 'format',
-            'image_name': 'image-name',
-            'image_tag': 'image-tag',
-            'artifact_group_id': 'artifact-group-id',
-            'artifact_id': 'artifact-id',
-            'artifact_version': 'artifact-version',
-            'artifact_type': 'artifact-type'
-        }
-
         self._parameters = parameters
         self._optional_parameters = optional_parameters
         self._info = info
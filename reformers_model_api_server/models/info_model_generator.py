@@ -18,6 +18,24 @@ class InfoModelGenerator(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'generator_name': str,
+        'generator_tag': str,
+        'parameters': Dict[str, ModelGeneratorParametersValue],
+        'config': Dict[str, ModelGeneratorConfigurationValue],
+        'build': object
+    }
+
+    attribute_map = {
+        'generator_name': 'generator_name',
+        'generator_tag': 'generator_tag',
+        'parameters': 'parameters',
+        'config': 'config',
+        'build': 'build'
+    }
+
+    __slots__ = ('_generator_name', '_generator_tag', '_parameters', '_config', '_build')
+
     def __init__(self, generator_name=None, generator_tag=None, parameters=None, config=None, build=None):  # noqa: E501
         """InfoModelGenerator - a model defined in OpenAPI
 
@@ -32,22 +50,6 @@ class InfoModelGenerator(Model):
         :param build: The build of this InfoModelGenerator.  # noqa: E501
         :type build: object
         """
-        self.openapi_types = {
-            'generator_name': str,
-            'generator_tag': str,
-            'parameters': Dict[str, ModelGeneratorParametersValue],
-            'config': Dict[str, ModelGeneratorConfigurationValue],
-            'build': object
-        }
-
-        self.attribute_map = {
-            'generator_name': 'generator_name',
-            'generator_tag': 'generator_tag',
-            'parameters': 'parameters',
-            'config': 'config',
-            'build': 'build'
-        }
-
         self._generator_name = generator_name
         self._generator_tag = generator_tag
         self._parameters = parameters
@@ -12,6 +12,20 @@ class InfoModelGeneratorAdditionalProperties(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'mandatory_parameters': Dict[str, object],
+        'optional_parameters': Dict[str, object],
+        'info': str
+    }
+
+    attribute_map = {
+        'mandatory_parameters': 'mandatory_parameters',
+        'optional_parameters': 'optional_parameters',
+        'info': 'info'
+    }
+
+    __slots__ = ('_mandatory_parameters', '_optional_parameters', '_info')
+
     def __init__(self, mandatory_parameters=None, optional_parameters=None, info=None):  # noqa: E501
         """InfoModelGeneratorAdditionalProperties - a model defined in OpenAPI
 
@@ -22,18 +36,6 @@ class InfoModelGeneratorAdditionalProperties(Model):
         :param info: The info of this InfoModelGeneratorAdditionalProperties.  # noqa: E501
         :type info: str
         """
-        self.openapi_types = {
-            'mandatory_parameters': Dict[str, object],
-            'optional_parameters': Dict[str, object],
-            'info': str
-        }
-
-        self.attribute_map = {
-            'mandatory_parameters': 'mandatory_parameters',
-            'optional_parameters': 'optional_parameters',
-            'info': 'info'
-        }
-
         self._mandatory_parameters = mandatory_parameters
         self._optional_parameters = optional_parameters
         self._info = info
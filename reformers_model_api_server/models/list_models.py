@@ -16,6 +16,20 @@ class ListModels(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'generator_name': str,
+        'generator_tag': str,
+        'models': Dict[str, Dict[str, InfoModel]]
+    }
+
+    attribute_map = {
+        'generator_name': 'generator_name',
+        'generator_tag': 'generator_tag',
+        'models': 'models'
+    }
+
+    __slots__ = ('_generator_name', '_generator_tag', '_models')
+
     def __init__(self, generator_name=None, generator_tag=None, models=None):  # noqa: E501
         """ListModels - a model defined in OpenAPI
 
@@ -26,18 +40,6 @@ class ListModels(Model):
         :param models: The models of this ListModels.  # noqa: E501
         :type models: Dict[str, Dict[str, InfoModel]]
         """
-        self.openapi_types = {
-            'generator_name': str,
-            'generator_tag': str,
-            'models': Dict[str, Dict[str, InfoModel]]
-        }
-
-        self.attribute_map = {
-            'generator_name': 'generator_name',
-            'generator_tag': 'generator_tag',
-            'models': 'models'
-        }
-
         self._generator_name = generator_name
         self._generator_tag = generator_tag
         self._models = models
@@ -17,15 +17,19 @@ class ModelFormat(Model):
     """
     DOCKER = 'docker'
     MAVEN = 'maven'
+
+    openapi_types = {
+    }
+
+    attribute_map = {
+    }
+
+    __slots__ = ()
+
     def __init__(self):  # noqa: E501
         """ModelFormat - a model defined in OpenAPI
 
         """
-        self.openapi_types = {
-        }
-
-        self.attribute_map = {
-        }
 
     @classmethod
     def from_dict(cls, dikt) -> 'ModelFormat':
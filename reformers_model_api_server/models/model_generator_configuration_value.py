@@ -12,15 +12,18 @@ class ModelGeneratorConfigurationValue(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+    }
+
+    attribute_map = {
+    }
+
+    __slots__ = ()
+
     def __init__(self):  # noqa: E501
         """ModelGeneratorConfigurationValue - a model defined in OpenAPI
 
         """
-        self.openapi_types = {
-        }
-
-        self.attribute_map = {
-        }
 
     @classmethod
     def from_dict(cls, dikt) -> 'ModelGeneratorConfigurationValue':
@@ -12,6 +12,18 @@ class ModelGeneratorParametersInner(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'info': str,
+        'default': str
+    }
+
+    attribute_map = {
+        'info': 'info',
+        'default': 'default'
+    }
+
+    __slots__ = ('_info', '_default')
+
     def __init__(self, info=None, default=None):  # noqa: E501
         """ModelGeneratorParametersInner - a model defined in OpenAPI
 
@@ -20,16 +32,6 @@ class ModelGeneratorParametersInner(Model):
         :param default: The default of this ModelGeneratorParametersInner.  # noqa: E501
         :type default: str
         """
-        self.openapi_types = {
-            'info': str,
-            'default': str
-        }
-
-        self.attribute_map = {
-            'info': 'info',
-            'default': 'default'
-        }
-
         self._info = info
         self._default = default
 
@@ -14,6 +14,18 @@ class ModelGeneratorParametersValue(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'info': str,
+        'default': ModelGeneratorParametersValueDefault
+    }
+
+    attribute_map = {
+        'info': 'info',
+        'default': 'default'
+    }
+
+    __slots__ = ('_info', '_default')
+
     def __init__(self, info=None, default=None):  # noqa: E501
         """ModelGeneratorParametersValue - a model defined in OpenAPI
 
@@ -22,16 +34,6 @@ class ModelGeneratorParametersValue(Model):
         :param default: The default of this ModelGeneratorParametersValue.  # noqa: E501
         :type default: ModelGeneratorParametersValueDefault
         """
-        self.openapi_types = {
-            'info': str,
-            'default': ModelGeneratorParametersValueDefault
-        }
-
-        self.attribute_map = {
-            'info': 'info',
-            'default': 'default'
-        }
-
         self._info = info
         self._default = default
 
@@ -16,6 +16,20 @@ class RequestCreateModel(Model):
     Do not edit the class manually.
     """
 
+    openapi_types = {
+        'model_name': str,
+        'model_tag': str,
+        'parameters': Dict[str, ModelGeneratorConfigurationValue]
+    }
+
+    attribute_map = {
+        'model_name': 'model_name',
+        'model_tag': 'model_tag',
+        'parameters': 'parameters'
+    }
+
+    __slots__ = ('_model_name', '_model_tag', '_parameters')
+
     def __init__(self, model_name=None, model_tag=None, parameters=None):  # noqa: E501
         """RequestCreateModel - a model defined in OpenAPI
 
@@ -26,18 +40,6 @@ class RequestCreateModel(Model):
         :param parameters: The parameters of this RequestCreateModel.  # noqa: E501
         :type parameters: Dict[str, ModelGeneratorConfigurationValue]
         """
-        self.openapi_types = {
-            'model_name': str,
-            'model_tag': str,
-            'parameters': Dict[str, ModelGeneratorConfigurationValue]
-        }
-
-        self.attribute_map = {
-            'model_name': 'model_name',
-            'model_tag': 'model_tag',
-            'parameters': 'parameters'
-        }
-
         self._model_name = model_name
         self._model_tag = model_tag
         self._parameters = parameters
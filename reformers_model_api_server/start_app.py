@@ -1,158 +1,284 @@
-import connexion
-import json
-import pathlib
-
-from base64 import b64decode
-from flask import current_app
-from warnings import warn
-
-from reformers_model_api_server import encoder
-from reformers_model_repo_client import Configuration, ApiClient, RepositorySettingsApi
-
-def get_registry_auth_config(
-        registry_auth_config_file: str
-    ) -> dict[str, tuple[str, str]]:
-    """
-    Retrieve authentication config for accessing the container registries.
-
-    :param registry_auth_config_file: path to authentication config file
-    :type registry_auth_config_file: str
-    :return: dict with username / password for all registries
-    :rtype: dict[str, tuple[str, str]]
-    """
-    registry_auth_config_path = pathlib.Path(registry_auth_config_file)
-    registry_auth_config_path = registry_auth_config_path.resolve(strict=True)
-
-    with open(registry_auth_config_path, 'r') as f:
-        config = json.load(f)
-        auth_config = config.get('auths', dict())
-
-    registry_auth_config = dict()
-
-    for registry_url, registry_auth_info in auth_config.items():
-        if not registry_auth_info['auth']:
-            raise RuntimeError(f'Authentication information for registry missing: {registry_url}')
-        registry_auth_info = b64decode(registry_auth_info['auth']).decode('utf-8')
-
-        registry_auth = registry_auth_info.split(':')
-        if not 2 == len(registry_auth):
-            raise RuntimeError('Invalid repository credentials format')
-
-        registry_auth_config[registry_url] = (registry_auth[0], registry_auth[1])
-
-    return registry_auth_config
-
-def get_repo_auth(
-        host: str,
-        repo_auth_config_file: str
-    ) -> tuple[str, str]:
-    """
-    Retrieve authentication config for accessing the repository.
-
-    :param host: host name
-    :type host: str
-    :param repo_auth_config_file: path to authentication config file
-    :type repo_auth_config_file: str
-    :return: tuple with username and password
-    :rtype: tuple[str, str]
-    """
-    repo_auth_config_file = pathlib.Path(repo_auth_config_file)
-    repo_auth_config_file = repo_auth_config_file.resolve(strict=True)
-
-    with open(repo_auth_config_file, 'r') as f:
-        config = json.load(f)
-        auth_config = config.get('auths', dict())
-
-    repo_auth_config = auth_config.get(host, dict(auth=None))
-    if not repo_auth_config['auth']:
-        raise RuntimeError('Authentication information for repository missing')
-
-    repo_auth_info = b64decode(repo_auth_config['auth']).decode('utf-8')
-    repo_auth = repo_auth_info.split(':')
-    if not 2 == len(repo_auth):
-        raise RuntimeError('Invalid repository credentials format')
-
-    return tuple(repo_auth) # type: ignore
-
-def start_app(
-        specification: str,
-        host: str,
-        repo_auth_config_file: str,
-        registry_auth_config_file: str,
-        metagenerator_auth_config_file: str,
-        remove_containers: bool,
-        verify_ssl: bool
-    ) -> connexion.App:
-    """
-    Start the server running the model API app.
-
-    :param specification: OpenAPI specification file name (relative to subfolder 'openapi')
-    :param host: URL to repository
-    :param registry_auth_config_file: path to authentication config file for accessing the container registries
-    :param repo_auth_config_file: path to authentication config file for accessing the repository
-    :param remove_containers: set this to false to remove containers after they have exited
-    :param verify_ssl: set this to true to verify SSL certificates
-    """
-    openapi_dir = pathlib.Path(__file__).parent / 'openapi'
-    specification_file = openapi_dir / specification
-    specification_file = specification_file.resolve(strict=True)
-
-    registry_auth_config = get_registry_auth_config(registry_auth_config_file)
-
-    repo_auth = get_repo_auth(host, repo_auth_config_file)
-
-    repo_config = Configuration(
-        host = f'https://{host}',
-        username = repo_auth[0],
-        password = repo_auth[1]
-    )
-    repo_config.verify_ssl = verify_ssl
-
-    metagenerator_auth_config_path = pathlib.Path(metagenerator_auth_config_file)
-    try:
-        metagenerator_auth_config_path = metagenerator_auth_config_path.resolve(strict=True)
-    except OSError:
-        warn(
-            f'path {metagenerator_auth_config_file} could not be resolved',
-            category=RuntimeWarning
-        )
-
-    flask_app = connexion.App(__name__)
-    flask_app.app.json_encoder = encoder.JSONEncoder
-    flask_app.add_api(specification_file,
-                arguments={'title': 'REFORMERS Digital Twin: Model API'},
-                pythonic_params=True)
-
-    with flask_app.app.app_context():
-
-        current_app.repo_client = ApiClient(repo_config)
-        current_app.registry_auth_config = registry_auth_config
-        current_app.metagenerator_auth_config_file = metagenerator_auth_config_path
-
-        repo_settings_api = RepositorySettingsApi(current_app.repo_client)
-        current_app.repo_settings = {
-            rs.name: rs for rs in repo_settings_api.repository_settings()
-            }
-
-        current_app.remove_containers = remove_containers
-
-    return flask_app
-
-def start_app_from_env():
-
-    import os
-
-    def __parse_to_bool(s: str):
-        return s.upper() not in ['0', 'FALSE']
-
-    specification = os.environ.get('SPECIFICATION', default='openapi.yaml')
-    host = os.environ.get('HOST', default='reformers-dev.ait.ac.at')
-    repo_auth_config = os.environ.get('REPO_AUTH_CONFIG', default='repo-auth-config.json')
-    registry_auth_config = os.environ.get('REGISTRY_AUTH_CONFIG', default='registry-auth-config.json')
-    metagenerator_auth_config = os.environ.get('METAGENERATOR_AUTH_CONFIG', default='registry-auth-config.json')
-    remove = __parse_to_bool(os.environ.get('REMOVE_CONTAINERS', default='True'))
-    verify_ssl = __parse_to_bool(os.environ.get('VERIFY_SSL', default='False'))
-
-    return start_app(
-        specification, host, repo_auth_config, registry_auth_config, metagenerator_auth_config, remove, verify_ssl
-    )
+import connexion
+import json
+import pathlib
+
+from base64 import b64decode
+from concurrent.futures import ThreadPoolExecutor
+from flask import current_app
+from functools import partial
+from typing import Optional
+from warnings import warn
+
+from reformers_model_api_server import encoder
+from reformers_model_api_server.controllers.cache import BlobCache, ManifestCache, NegativeCache, ResponseCache
+from reformers_model_api_server.controllers.docker_client import DockerClientManager, ImagePuller, RegistryLoginCache
+from reformers_model_api_server.controllers.fast_json import FastJSONEncoder
+from reformers_model_api_server.controllers.generator_index import GeneratorIndex
+from reformers_model_api_server.controllers.image_prewarmer import ImagePrewarmer
+from reformers_model_api_server.controllers.metrics import Metrics
+from reformers_model_api_server.controllers.models_controller import warm_generator_image
+from reformers_model_api_server.controllers.single_flight import SingleFlight
+from reformers_model_repo_client import Configuration, ApiClient, RepositorySettingsApi, SearchRepositoryApi
+from reformers_model_repo_client.exceptions import NotFoundException
+
+def get_registry_auth_config(
+        registry_auth_config_file: str
+    ) -> dict[str, tuple[str, str]]:
+    """
+    Retrieve authentication config for accessing the container registries.
+
+    :param registry_auth_config_file: path to authentication config file
+    :type registry_auth_config_file: str
+    :return: dict with username / password for all registries
+    :rtype: dict[str, tuple[str, str]]
+    """
+    registry_auth_config_path = pathlib.Path(registry_auth_config_file)
+    registry_auth_config_path = registry_auth_config_path.resolve(strict=True)
+
+    with open(registry_auth_config_path, 'r') as f:
+        config = json.load(f)
+        auth_config = config.get('auths', dict())
+
+    registry_auth_config = dict()
+
+    for registry_url, registry_auth_info in auth_config.items():
+        if not registry_auth_info['auth']:
+            raise RuntimeError(f'Authentication information for registry missing: {registry_url}')
+        registry_auth_info = b64decode(registry_auth_info['auth']).decode('utf-8')
+
+        registry_auth = registry_auth_info.split(':')
+        if not 2 == len(registry_auth):
+            raise RuntimeError('Invalid repository credentials format')
+
+        registry_auth_config[registry_url] = (registry_auth[0], registry_auth[1])
+
+    return registry_auth_config
+
+def get_repo_auth(
+        host: str,
+        repo_auth_config_file: str
+    ) -> tuple[str, str]:
+    """
+    Retrieve authentication config for accessing the repository.
+
+    :param host: host name
+    :type host: str
+    :param repo_auth_config_file: path to authentication config file
+    :type repo_auth_config_file: str
+    :return: tuple with username and password
+    :rtype: tuple[str, str]
+    """
+    repo_auth_config_file = pathlib.Path(repo_auth_config_file)
+    repo_auth_config_file = repo_auth_config_file.resolve(strict=True)
+
+    with open(repo_auth_config_file, 'r') as f:
+        config = json.load(f)
+        auth_config = config.get('auths', dict())
+
+    repo_auth_config = auth_config.get(host, dict(auth=None))
+    if not repo_auth_config['auth']:
+        raise RuntimeError('Authentication information for repository missing')
+
+    repo_auth_info = b64decode(repo_auth_config['auth']).decode('utf-8')
+    repo_auth = repo_auth_info.split(':')
+    if not 2 == len(repo_auth):
+        raise RuntimeError('Invalid repository credentials format')
+
+    return tuple(repo_auth) # type: ignore
+
+def start_app(
+        specification: str,
+        host: str,
+        repo_auth_config_file: str,
+        registry_auth_config_file: str,
+        metagenerator_auth_config_file: str,
+        remove_containers: bool,
+        verify_ssl: bool,
+        blob_cache_size: int = 64 * 1024 * 1024,
+        blob_cache_dir: Optional[str] = None,
+        manifest_cache_ttl: float = 60.,
+        lookup_concurrency: int = 8,
+        search_prefetch: int = 1,
+        generator_index_interval: float = 300.,
+        negative_cache_ttl: float = 10.,
+        fast_json: bool = True,
+        response_cache_size: int = 64 * 1024 * 1024,
+        response_max_age: int = 0,
+        docker_pool_size: int = 10,
+        docker_health_check_interval: float = 60.,
+        registry_login_ttl: float = 3600.,
+        registry_login_backoff: float = 10.,
+        image_pull_policy: str = 'if-digest-changed',
+        prewarm_generators: str = '',
+        prewarm_concurrency: int = 2
+    ) -> connexion.App:
+    """
+    Start the server running the model API app.
+
+    :param specification: OpenAPI specification file name (relative to subfolder 'openapi')
+    :param host: URL to repository
+    :param registry_auth_config_file: path to authentication config file for accessing the container registries
+    :param repo_auth_config_file: path to authentication config file for accessing the repository
+    :param remove_containers: set this to false to remove containers after they have exited
+    :param verify_ssl: set this to true to verify SSL certificates
+    :param blob_cache_size: maximum size (in bytes) of the in-memory cache for image blobs
+    :param blob_cache_dir: directory for the on-disk cache for image blobs (disabled if not specified)
+    :param manifest_cache_ttl: time (in seconds) during which cached image manifests are used without revalidation
+    :param lookup_concurrency: maximum number of concurrent repository lookups for retrieving information about models
+    :param search_prefetch: number of search result pages retrieved in the background ahead of processing (0 disables prefetching)
+    :param generator_index_interval: time (in seconds) between background refreshes of the model generator index (0 disables background refreshes)
+    :param negative_cache_ttl: time (in seconds) during which image manifests and blobs that have not been found are remembered (0 disables remembering)
+    :param fast_json: set this to false to encode responses with the standard JSON encoder instead of orjson (if installed)
+    :param response_cache_size: maximum total size (in bytes) of the cache for encoded responses of the catalogue endpoints (0 disables the cache)
+    :param response_max_age: maximum age (in seconds) of the responses of the catalogue endpoints for caching on the client side (0 requires revalidation via ETag)
+    :param docker_pool_size: maximum number of pooled connections of the Docker client shared by all requests
+    :param docker_health_check_interval: time (in seconds) between health checks of the Docker client (0 disables health checks)
+    :param registry_login_ttl: time (in seconds) during which Docker logins to container registries are remembered (0 logs in for every new model)
+    :param registry_login_backoff: time (in seconds) during which Docker logins to a container registry are skipped after a failed login (doubled with each consecutive failure, 0 disables backoff)
+    :param image_pull_policy: pull policy for model generator images (always, if-digest-changed or if-missing)
+    :param prewarm_generators: comma-separated patterns of model generator names or name:tag (e.g., generator:v*), whose images are pulled in the background every generator index interval (only once at startup if the interval is 0, empty disables pre-warming)
+    :param prewarm_concurrency: maximum number of concurrent pulls of model generator images in the background
+    """
+    openapi_dir = pathlib.Path(__file__).parent / 'openapi'
+    specification_file = openapi_dir / specification
+    specification_file = specification_file.resolve(strict=True)
+
+    registry_auth_config = get_registry_auth_config(registry_auth_config_file)
+
+    repo_auth = get_repo_auth(host, repo_auth_config_file)
+
+    repo_config = Configuration(
+        host = f'https://{host}',
+        username = repo_auth[0],
+        password = repo_auth[1]
+    )
+    repo_config.verify_ssl = verify_ssl
+
+    metagenerator_auth_config_path = pathlib.Path(metagenerator_auth_config_file)
+    try:
+        metagenerator_auth_config_path = metagenerator_auth_config_path.resolve(strict=True)
+    except OSError:
+        warn(
+            f'path {metagenerator_auth_config_file} could not be resolved',
+            category=RuntimeWarning
+        )
+
+    flask_app = connexion.App(__name__)
+    # Responses are encoded with orjson (if installed), the output is identical to the standard JSON encoder.
+    flask_app.app.json_encoder = FastJSONEncoder if fast_json else encoder.JSONEncoder
+    flask_app.add_api(specification_file,
+                arguments={'title': 'REFORMERS Digital Twin: Model API'},
+                pythonic_params=True)
+
+    with flask_app.app.app_context():
+
+        current_app.repo_client = ApiClient(repo_config)
+        current_app.registry_auth_config = registry_auth_config
+        current_app.metagenerator_auth_config_file = metagenerator_auth_config_path
+
+        current_app.metrics = Metrics()
+
+        # Concurrent identical calls to the repository are coalesced.
+        current_app.single_flight = SingleFlight()
+
+        # Lookups of manifests and blobs that have not been found are remembered for a short time.
+        current_app.blob_cache = BlobCache(
+            blob_cache_size, blob_cache_dir, current_app.single_flight,
+            NegativeCache(negative_cache_ttl, (NotFoundException,))
+        )
+        current_app.manifest_cache = ManifestCache(
+            manifest_cache_ttl, current_app.single_flight,
+            NegativeCache(negative_cache_ttl, (NotFoundException,))
+        )
+
+        # Encoded responses of the catalogue endpoints are cached (as long as the underlying data is unchanged).
+        current_app.response_cache = ResponseCache(response_cache_size)
+        # Responses of the catalogue endpoints are sent with ETags (clients revalidate them via If-None-Match).
+        current_app.response_max_age = response_max_age
+
+        current_app.lookup_executor = ThreadPoolExecutor(
+            max_workers=lookup_concurrency, thread_name_prefix='lookup'
+        )
+        current_app.lookup_concurrency = lookup_concurrency
+        # Searches run in separate threads, which submit lookups to the above pool of worker threads.
+        current_app.search_executor = ThreadPoolExecutor(thread_name_prefix='search')
+        current_app.search_prefetch = search_prefetch
+
+        repo_settings_api = RepositorySettingsApi(current_app.repo_client)
+        current_app.repo_settings = {
+            rs.name: rs for rs in repo_settings_api.repository_settings()
+            }
+
+        current_app.remove_containers = remove_containers
+
+        # The docker client (and its pooled connections) is shared by all requests.
+        current_app.docker_client_manager = DockerClientManager(docker_pool_size, docker_health_check_interval)
+        current_app.docker_client_manager.start()
+        # Logins to container registries happen on demand and are remembered per registry.
+        current_app.registry_login_cache = RegistryLoginCache(
+            registry_auth_config, registry_login_ttl, registry_login_backoff
+        )
+        # Model generator images are pulled according to the pull policy (e.g., only if the local image is outdated),
+        # concurrent pulls of the same image are coalesced.
+        current_app.image_puller = ImagePuller(current_app.single_flight, image_pull_policy)
+
+        search_api_instance = SearchRepositoryApi(current_app.repo_client)
+        current_app.generator_index = GeneratorIndex(
+            partial(search_api_instance.search_components, repository='model-generators'),
+            refresh_interval=generator_index_interval,
+            prefetch=search_prefetch
+        )
+        current_app.generator_index.refresh()
+        current_app.generator_index.start()
+
+        # Images of the model generators matching the allow-list are pulled in the background (if enabled).
+        current_app.image_prewarmer = ImagePrewarmer(
+            current_app.generator_index,
+            partial(warm_generator_image, flask_app.app),
+            [pattern.strip() for pattern in prewarm_generators.split(',') if pattern.strip()],
+            interval=generator_index_interval,
+            concurrency=prewarm_concurrency
+        )
+        current_app.image_prewarmer.start()
+
+    return flask_app
+
+def start_app_from_env():
+
+    import os
+
+    def __parse_to_bool(s: str):
+        return s.upper() not in ['0', 'FALSE']
+
+    specification = os.environ.get('SPECIFICATION', default='openapi.yaml')
+    host = os.environ.get('HOST', default='reformers-dev.ait.ac.at')
+    repo_auth_config = os.environ.get('REPO_AUTH_CONFIG', default='repo-auth-config.json')
+    registry_auth_config = os.environ.get('REGISTRY_AUTH_CONFIG', default='registry-auth-config.json')
+    metagenerator_auth_config = os.environ.get('METAGENERATOR_AUTH_CONFIG', default='registry-auth-config.json')
+    remove = __parse_to_bool(os.environ.get('REMOVE_CONTAINERS', default='True'))
+    verify_ssl = __parse_to_bool(os.environ.get('VERIFY_SSL', default='False'))
+    blob_cache_size = int(os.environ.get('BLOB_CACHE_SIZE', default=64 * 1024 * 1024))
+    blob_cache_dir = os.environ.get('BLOB_CACHE_DIR', default=None)
+    manifest_cache_ttl = float(os.environ.get('MANIFEST_CACHE_TTL', default=60.))
+    lookup_concurrency = int(os.environ.get('LOOKUP_CONCURRENCY', default=8))
+    search_prefetch = int(os.environ.get('SEARCH_PREFETCH', default=1))
+    generator_index_interval = float(os.environ.get('GENERATOR_INDEX_INTERVAL', default=300.))
+    negative_cache_ttl = float(os.environ.get('NEGATIVE_CACHE_TTL', default=10.))
+    fast_json = __parse_to_bool(os.environ.get('FAST_JSON', default='True'))
+    response_cache_size = int(os.environ.get('RESPONSE_CACHE_SIZE', default=64 * 1024 * 1024))
+    response_max_age = int(os.environ.get('RESPONSE_MAX_AGE', default=0))
+    docker_pool_size = int(os.environ.get('DOCKER_POOL_SIZE', default=10))
+    docker_health_check_interval = float(os.environ.get('DOCKER_HEALTH_CHECK_INTERVAL', default=60.))
+    registry_login_ttl = float(os.environ.get('REGISTRY_LOGIN_TTL', default=3600.))
+    registry_login_backoff = float(os.environ.get('REGISTRY_LOGIN_BACKOFF', default=10.))
+    image_pull_policy = os.environ.get('IMAGE_PULL_POLICY', default='if-digest-changed')
+    prewarm_generators = os.environ.get('PREWARM_GENERATORS', default='')
+    prewarm_concurrency = int(os.environ.get('PREWARM_CONCURRENCY', default=2))
+
+    return start_app(
+        specification, host, repo_auth_config, registry_auth_config, metagenerator_auth_config, remove, verify_ssl,
+        blob_cache_size, blob_cache_dir, manifest_cache_ttl, lookup_concurrency, search_prefetch,
+        generator_index_interval, negative_cache_ttl, fast_json, response_cache_size, response_max_age, docker_pool_size,
+        docker_health_check_interval, registry_login_ttl, registry_login_backoff, image_pull_policy, prewarm_generators,
+        prewarm_concurrency
+    )
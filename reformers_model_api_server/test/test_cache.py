@@ -0,0 +1,255 @@
+import gzip
+import tempfile
+import traceback
+import unittest
+
+from reformers_model_api_server.controllers.cache import BlobCache, ManifestCache, NegativeCache, ResponseCache
+
+
+class Blob:
+
+    def __init__(self, data):
+        self.data = data
+
+    @classmethod
+    def from_dict(cls, dikt):
+        return cls(dikt['data'])
+
+    def to_dict(self):
+        return {'data': self.data}
+
+
+class TestBlobCache(unittest.TestCase):
+    """BlobCache unit tests"""
+
+    def test_memory_tier_lru(self):
+        """Test case for eviction of least recently used blobs from the memory tier
+        """
+        blob_size = len('{"data": "xxxx"}')
+        cache = BlobCache(max_memory_size=2 * blob_size)
+
+        cache.put('sha256:01', Blob('aaaa'))
+        cache.put('sha256:02', Blob('bbbb'))
+        self.assertEqual(cache.get('sha256:01', Blob.from_dict).data, 'aaaa')
+
+        cache.put('sha256:03', Blob('cccc'))
+        self.assertIsNone(cache.get('sha256:02', Blob.from_dict))
+        self.assertIsNotNone(cache.get('sha256:01', Blob.from_dict))
+        self.assertIsNotNone(cache.get('sha256:03', Blob.from_dict))
+        self.assertEqual(cache.stats()['memory_size'], 2 * blob_size)
+
+    def test_disk_tier(self):
+        """Test case for retrieving blobs from the disk tier after a restart
+        """
+        with tempfile.TemporaryDirectory() as cache_dir:
+            cache = BlobCache(max_memory_size=1024, cache_dir=cache_dir)
+            cache.put('sha256:01', Blob('aaaa'))
+
+            restarted_cache = BlobCache(max_memory_size=1024, cache_dir=cache_dir)
+            fetch = lambda: self.fail('blob should not be fetched')
+            blob = restarted_cache.get_or_fetch('sha256:01', fetch, Blob.from_dict)
+            self.assertEqual(blob.data, 'aaaa')
+            self.assertEqual(restarted_cache.stats()['disk_hits'], 1)
+
+    def test_get_or_fetch(self):
+        """Test case for fetching blobs only once
+        """
+        cache = BlobCache(max_memory_size=1024)
+        fetched = []
+
+        def fetch():
+            fetched.append(True)
+            return Blob('aaaa')
+
+        cache.get_or_fetch('sha256:01', fetch, Blob.from_dict)
+        cache.get_or_fetch('sha256:01', fetch, Blob.from_dict)
+        self.assertEqual(len(fetched), 1)
+
+
+class TestManifestCache(unittest.TestCase):
+    """ManifestCache unit tests"""
+
+    def test_ttl(self):
+        """Test case for using cached manifests until the TTL expires
+        """
+        cache = ManifestCache(ttl=60.)
+        fetched = []
+
+        def fetch(etag):
+            fetched.append(etag)
+            return 'manifest', 'sha256:01'
+
+        self.assertEqual(cache.get_or_fetch(('generator', 'v0'), fetch), 'manifest')
+        self.assertEqual(cache.get_or_fetch(('generator', 'v0'), fetch), 'manifest')
+        self.assertEqual(fetched, [None])
+        self.assertEqual(cache.stats()['hits'], 1)
+
+    def test_revalidation(self):
+        """Test case for revalidating expired manifests with their ETag
+        """
+        cache = ManifestCache(ttl=0.)
+        cache.get_or_fetch(('generator', 'v0'), lambda etag: ('manifest', 'sha256:01'))
+
+        # The manifest has not been modified.
+        etags = []
+        def fetch_not_modified(etag):
+            etags.append(etag)
+            return None
+
+        self.assertEqual(cache.get_or_fetch(('generator', 'v0'), fetch_not_modified), 'manifest')
+        self.assertEqual(etags, ['sha256:01'])
+
+        # The tag has been moved.
+        manifest = cache.get_or_fetch(('generator', 'v0'), lambda etag: ('new-manifest', 'sha256:02'))
+        self.assertEqual(manifest, 'new-manifest')
+
+        stats = cache.stats()
+        self.assertEqual(stats['misses'], 1)
+        self.assertEqual(stats['revalidations'], 1)
+        self.assertEqual(stats['updates'], 1)
+
+    def test_expire_if_changed(self):
+        """Test case for expiring manifests with a different ETag
+        """
+        cache = ManifestCache(ttl=60.)
+        cache.get_or_fetch(('generator', 'v0'), lambda etag: ('manifest', 'sha256:01'))
+
+        cache.expire_if_changed(('generator', 'v0'), 'sha256:01')
+        self.assertEqual(cache.get_or_fetch(('generator', 'v0'), lambda etag: ('new-manifest', 'sha256:02')), 'manifest')
+
+        cache.expire_if_changed(('generator', 'v0'), 'sha256:02')
+        self.assertEqual(cache.get_or_fetch(('generator', 'v0'), lambda etag: ('new-manifest', 'sha256:02')), 'new-manifest')
+
+    def test_get_etag(self):
+        """Test case for getting the ETag of cached manifests
+        """
+        cache = ManifestCache(ttl=60.)
+        self.assertIsNone(cache.get_etag(('generator', 'v0')))
+
+        cache.get_or_fetch(('generator', 'v0'), lambda etag: ('manifest', 'sha256:01'))
+        self.assertEqual(cache.get_etag(('generator', 'v0')), 'sha256:01')
+
+    def test_not_found(self):
+        """Test case for remembering manifests that have not been found
+        """
+        cache = ManifestCache(ttl=60., negative_cache=NegativeCache(ttl=60., exception_types=(KeyError,)))
+        fetched = []
+
+        def fetch_not_found(etag):
+            fetched.append(etag)
+            raise KeyError('not found')
+
+        for _ in range(2):
+            with self.assertRaises(KeyError):
+                cache.get_or_fetch(('generator', 'v0'), fetch_not_found)
+        self.assertEqual(fetched, [None])
+        self.assertEqual(cache.stats()['not_found']['hits'], 1)
+
+        # The manifest has been created in the meantime.
+        cache.invalidate(('generator', 'v0'))
+        manifest = cache.get_or_fetch(('generator', 'v0'), lambda etag: ('manifest', 'sha256:01'))
+        self.assertEqual(manifest, 'manifest')
+
+        # Other exceptions are not remembered.
+        def fetch_error(etag):
+            fetched.append(etag)
+            raise ValueError('error')
+
+        for _ in range(2):
+            with self.assertRaises(ValueError):
+                cache.get_or_fetch(('generator', 'v1'), fetch_error)
+        self.assertEqual(fetched, [None, None, None])
+
+    def test_not_found_traceback(self):
+        """Test case for re-raising remembered failed lookups without growing tracebacks
+        """
+        cache = ManifestCache(ttl=60., negative_cache=NegativeCache(ttl=60., exception_types=(KeyError,)))
+
+        def fetch_not_found(etag):
+            raise KeyError('not found')
+
+        traceback_lengths = []
+        for _ in range(4):
+            try:
+                cache.get_or_fetch(('generator', 'v0'), fetch_not_found)
+            except KeyError as ex:
+                traceback_lengths.append(len(traceback.extract_tb(ex.__traceback__)))
+
+        self.assertEqual(len(set(traceback_lengths[1:])), 1)
+
+    def test_expire_not_found(self):
+        """Test case for keeping remembered failed lookups when expiring manifests
+        """
+        cache = ManifestCache(ttl=60., negative_cache=NegativeCache(ttl=60., exception_types=(KeyError,)))
+        fetched = []
+
+        def fetch_not_found(etag):
+            fetched.append(etag)
+            raise KeyError('not found')
+
+        for _ in range(3):
+            cache.expire(('generator', 'v0', 'model', 'v0'))
+            with self.assertRaises(KeyError):
+                cache.get_or_fetch(('generator', 'v0', 'model', 'v0'), fetch_not_found)
+        self.assertEqual(fetched, [None])
+
+    def test_removed(self):
+        """Test case for remembering manifests that have been removed since they have been cached
+        """
+        cache = ManifestCache(ttl=60., negative_cache=NegativeCache(ttl=60., exception_types=(KeyError,)))
+        cache.get_or_fetch(('generator', 'v0'), lambda etag: ('manifest', 'sha256:01'))
+        fetched = []
+
+        def fetch_not_found(etag):
+            fetched.append(etag)
+            raise KeyError('not found')
+
+        cache.expire(('generator', 'v0'))
+        for _ in range(2):
+            with self.assertRaises(KeyError):
+                cache.get_or_fetch(('generator', 'v0'), fetch_not_found)
+        self.assertEqual(fetched, ['sha256:01'])
+        self.assertIsNone(cache.get_etag(('generator', 'v0')))
+
+
+class TestResponseCache(unittest.TestCase):
+    """ResponseCache unit tests"""
+
+    def test_digest(self):
+        """Test case for using cached responses only as long as the digest is unchanged
+        """
+        cache = ResponseCache(max_size=1024)
+        body = b'{"generator": ["v0"]}\n'
+
+        self.assertIsNone(cache.get(('list_model_generators',), 'sha256:01'))
+        cached_body, gzip_body = cache.put(('list_model_generators',), 'sha256:01', body)
+        self.assertEqual(cached_body, body)
+        self.assertEqual(gzip.decompress(gzip_body), body)
+
+        self.assertEqual(cache.get(('list_model_generators',), 'sha256:01'), (body, gzip_body))
+        self.assertIsNone(cache.get(('list_model_generators',), 'sha256:02'))
+        self.assertIsNone(cache.get(('list_model_generators',), 'sha256:01'))
+
+        stats = cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['invalidations']), (1, 3, 1))
+        self.assertEqual((stats['entries'], stats['size']), (0, 0))
+
+    def test_lru(self):
+        """Test case for evicting least recently used responses
+        """
+        body = 100 * b'x'
+        size = len(body) + len(gzip.compress(body, mtime=0))
+        cache = ResponseCache(max_size=2 * size)
+
+        cache.put('a', 'sha256:01', body)
+        cache.put('b', 'sha256:01', body)
+        cache.get('a', 'sha256:01')
+        cache.put('c', 'sha256:01', body)
+
+        self.assertIsNotNone(cache.get('a', 'sha256:01'))
+        self.assertIsNone(cache.get('b', 'sha256:01'))
+        self.assertEqual(cache.stats()['size'], 2 * size)
+
+
+if __name__ == '__main__':
+    unittest.main()
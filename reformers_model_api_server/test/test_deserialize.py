@@ -0,0 +1,53 @@
+import unittest
+
+from reformers_model_api_server import util
+from reformers_model_api_server.models.info_model import InfoModel
+from reformers_model_api_server.models.list_models import ListModels
+from reformers_model_api_server.models.request_create_model import RequestCreateModel
+
+
+class TestDeserialize(unittest.TestCase):
+    """util unit tests"""
+
+    def test_deserialize_model(self):
+        """Test case for deserializing nested models
+        """
+        list_models = ListModels.from_dict({
+            'generator_name': 'generator',
+            'generator_tag': 'v0',
+            'models': {
+                'model': {
+                    'v1': {
+                        'info': 'model-info',
+                        'image_tag': None,
+                        'parameters': {'a': {'info': 'parameter a', 'value': 1.5}}
+                    }
+                }
+            }
+        })
+
+        self.assertEqual(list_models.generator_name, 'generator')
+        model = list_models.models['model']['v1']
+        self.assertIsInstance(model, InfoModel)
+        self.assertEqual(model.info, 'model-info')
+        self.assertIsNone(model.image_tag)
+        # Models without attributes keep the original data.
+        self.assertEqual(model.parameters['a'], {'info': 'parameter a', 'value': 1.5})
+        self.assertIn(ListModels, util._deserializer_plans)
+
+    def test_deserialize_model_validation(self):
+        """Test case for validating attributes while deserializing models
+        """
+        with self.assertRaises(ValueError):
+            RequestCreateModel.from_dict({'model_name': 'Invalid Name', 'model_tag': 'v0'})
+
+    def test_deserialize_primitive(self):
+        """Test case for deserializing primitive types
+        """
+        self.assertEqual(util._deserialize('1', int), 1)
+        self.assertEqual(util._deserialize([1, 2], object), [1, 2])
+        self.assertIsNone(util._deserialize(None, str))
+
+
+if __name__ == '__main__':
+    unittest.main()
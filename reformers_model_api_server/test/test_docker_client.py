@@ -0,0 +1,305 @@
+import threading
+import time
+import unittest
+
+import docker
+
+from reformers_model_api_server.controllers.docker_client import DockerClientManager, ImagePuller, RegistryLoginCache, normalize_registry, pull_image
+from reformers_model_api_server.controllers.single_flight import SingleFlight
+
+
+class Client:
+    """Mock docker client"""
+
+    def __init__(self, healthy=True):
+        self.healthy = healthy
+        self.closed = False
+        self.logins = []
+        self.login_error = None
+        self.images = Images()
+
+    def login(self, registry, username, password, reauth=False):
+        self.logins.append(registry)
+        if self.login_error:
+            raise self.login_error
+
+    def ping(self):
+        if not self.healthy:
+            raise ConnectionError('Docker daemon not available')
+        return True
+
+    def close(self):
+        self.closed = True
+
+
+class Image:
+    """Mock docker image"""
+
+    def __init__(self, repo_digests):
+        self.attrs = {'RepoDigests': repo_digests}
+
+
+class Images:
+    """Mock docker image collection"""
+
+    def __init__(self, images=None):
+        self.images = images or dict()
+        self.pulled = []
+        self.pulling = None
+
+    def get(self, name):
+        if name not in self.images:
+            raise docker.errors.ImageNotFound(name)
+        return self.images[name]
+
+    def pull(self, name):
+        self.pulled.append(name)
+        if self.pulling:
+            self.pulling.wait()
+
+
+class TestDockerClientManager(unittest.TestCase):
+    """DockerClientManager unit tests"""
+
+    def test_client(self):
+        """Test case for sharing the client and tracking its usage
+        """
+        pool_sizes = []
+
+        def create_client(max_pool_size):
+            pool_sizes.append(max_pool_size)
+            return Client()
+
+        manager = DockerClientManager(max_pool_size=1, health_check_interval=0., create_client=create_client)
+
+        with manager.client() as client:
+            with manager.client() as other_client:
+                self.assertIs(client, other_client)
+
+        self.assertEqual(pool_sizes, [1])
+        stats = manager.stats()
+        self.assertEqual((stats['in_use'], stats['max_in_use'], stats['leases'], stats['saturated_leases']), (0, 2, 2, 1))
+
+    def test_health_check(self):
+        """Test case for replacing the client after a failed health check
+        """
+        clients = []
+
+        def create_client(max_pool_size):
+            clients.append(Client())
+            return clients[-1]
+
+        manager = DockerClientManager(create_client=create_client)
+
+        client = manager.get()
+        self.assertTrue(manager.check_health())
+        self.assertIs(manager.get(), client)
+
+        client.healthy = False
+        with self.assertWarns(RuntimeWarning):
+            self.assertFalse(manager.check_health())
+        new_client = manager.get()
+        self.assertIsNot(new_client, client)
+        self.assertTrue(client.closed)
+
+        stats = manager.stats()
+        self.assertEqual((stats['created'], stats['health_check_failures']), (2, 1))
+
+    def test_health_check_background(self):
+        """Test case for checking the health of the client in the background (not within requests)
+        """
+        manager = DockerClientManager(health_check_interval=1e-3, create_client=lambda max_pool_size: Client(healthy=False))
+        client = manager.get()
+
+        with self.assertWarns(RuntimeWarning):
+            manager.start()
+            deadline = time.monotonic() + 5.
+            while not client.closed and time.monotonic() < deadline:
+                time.sleep(1e-3)
+        manager.stop()
+
+        self.assertTrue(client.closed)
+
+
+class TestRegistryLoginCache(unittest.TestCase):
+    """RegistryLoginCache unit tests"""
+
+    auth_config = {
+        'https://registry.example.com:8082/': ('user', 'password'),
+        'other.example.com:8083': ('user', 'password'),
+    }
+
+    def test_normalize_registry(self):
+        """Test case for normalizing registry addresses
+        """
+        self.assertEqual(normalize_registry('https://Registry.example.com:8082/'), 'registry.example.com:8082')
+        self.assertEqual(normalize_registry('registry.example.com:8082'), 'registry.example.com:8082')
+
+    def test_login(self):
+        """Test case for logging in lazily and remembering the login
+        """
+        cache = RegistryLoginCache(self.auth_config, ttl=60.)
+        client = Client()
+
+        self.assertTrue(cache.login(client, 'registry.example.com:8082'))
+        self.assertTrue(cache.login(client, 'registry.example.com:8082'))
+        self.assertFalse(cache.login(client, 'unknown.example.com:8082'))
+        self.assertEqual(client.logins, ['https://registry.example.com:8082/'])
+
+        # A new client (e.g., after a failed health check) logs in again.
+        new_client = Client()
+        self.assertTrue(cache.login(new_client, 'registry.example.com:8082'))
+        self.assertEqual(new_client.logins, ['https://registry.example.com:8082/'])
+
+        stats = cache.stats()
+        self.assertEqual((stats['logins'], stats['hits'], stats['sessions']), (2, 1, 1))
+
+    def test_login_expired(self):
+        """Test case for logging in again after the TTL has expired
+        """
+        cache = RegistryLoginCache(self.auth_config, ttl=1e-9)
+        client = Client()
+
+        cache.login(client, 'other.example.com:8083')
+        time.sleep(1e-3)
+        cache.login(client, 'other.example.com:8083')
+        self.assertEqual(client.logins, ['other.example.com:8083'] * 2)
+
+    def test_login_backoff(self):
+        """Test case for skipping logins after a failed login
+        """
+        cache = RegistryLoginCache(self.auth_config, backoff=60.)
+        client = Client()
+        client.login_error = RuntimeError('unauthorized')
+
+        with self.assertRaises(RuntimeError):
+            cache.login(client, 'registry.example.com:8082')
+        self.assertFalse(cache.login(client, 'registry.example.com:8082'))
+        self.assertEqual(len(client.logins), 1)
+
+        # Logins to other registries are not affected.
+        client.login_error = None
+        self.assertTrue(cache.login(client, 'other.example.com:8083'))
+
+        stats = cache.stats()
+        self.assertEqual((stats['failed_logins'], stats['skipped_logins']), (1, 1))
+
+
+class TestPullImage(unittest.TestCase):
+    """pull_image unit tests"""
+
+    repository = 'registry.example.com:8082/generator'
+
+    def create_client(self, repo_digests=None):
+        client = Client()
+        if repo_digests is not None:
+            client.images.images[f'{self.repository}:v0'] = Image(repo_digests)
+        return client
+
+    def test_pull_always(self):
+        """Test case for pull policy always
+        """
+        client = self.create_client([f'{self.repository}@sha256:01'])
+        self.assertTrue(pull_image(client, self.repository, 'v0', 'sha256:01', 'always'))
+        self.assertEqual(client.images.pulled, [f'{self.repository}:v0'])
+
+    def test_pull_if_digest_changed(self):
+        """Test case for pull policy if-digest-changed
+        """
+        client = self.create_client([f'{self.repository}@sha256:01'])
+        self.assertFalse(pull_image(client, self.repository, 'v0', 'sha256:01', 'if-digest-changed'))
+        self.assertTrue(pull_image(client, self.repository, 'v0', 'sha256:02', 'if-digest-changed'))
+        # The image is pulled if the digest is not known.
+        self.assertTrue(pull_image(client, self.repository, 'v0', None, 'if-digest-changed'))
+        self.assertEqual(len(client.images.pulled), 2)
+
+        client = self.create_client()
+        self.assertTrue(pull_image(client, self.repository, 'v0', 'sha256:01', 'if-digest-changed'))
+
+    def test_pull_if_missing(self):
+        """Test case for pull policy if-missing
+        """
+        client = self.create_client([f'{self.repository}@sha256:01'])
+        self.assertFalse(pull_image(client, self.repository, 'v0', 'sha256:02', 'if-missing'))
+
+        client = self.create_client()
+        self.assertTrue(pull_image(client, self.repository, 'v0', None, 'if-missing'))
+
+    def test_invalid_policy(self):
+        """Test case for unknown pull policies
+        """
+        with self.assertRaises(ValueError):
+            pull_image(self.create_client(), self.repository, 'v0', None, 'never')
+
+
+class TestImagePuller(unittest.TestCase):
+    """ImagePuller unit tests"""
+
+    repository = 'registry.example.com:8082/generator'
+
+    def test_pull_coalesced(self):
+        """Test case for coalescing concurrent pulls of the same image
+        """
+        single_flight = SingleFlight()
+        puller = ImagePuller(single_flight, 'always')
+        client = Client()
+        client.images.pulling = threading.Event()
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(puller.pull(client, self.repository, 'v0', None, 'generator')))
+            for _ in range(3)
+        ]
+        for thread in threads:
+            thread.start()
+        while single_flight.stats()['coalesced'] < 2:
+            time.sleep(1e-3)
+        client.images.pulling.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, [True] * 3)
+        self.assertEqual(client.images.pulled, [f'{self.repository}:v0'])
+
+        stats = puller.stats()
+        self.assertEqual(stats['pulls'], 1)
+        self.assertEqual(stats['durations']['generator']['pulls'], 1)
+
+    def test_pull_different_digest(self):
+        """Test case for not coalescing pulls of the same image with different digests
+        """
+        single_flight = SingleFlight()
+        puller = ImagePuller(single_flight, 'always')
+        client = Client()
+        client.images.pulling = threading.Event()
+
+        threads = [
+            threading.Thread(target=puller.pull, args=(client, self.repository, 'v0', digest, 'generator'))
+            for digest in ('sha256:01', 'sha256:02')
+        ]
+        for thread in threads:
+            thread.start()
+        deadline = time.monotonic() + 5.
+        while single_flight.stats()['in_flight'] < 2 and time.monotonic() < deadline:
+            time.sleep(1e-3)
+        client.images.pulling.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(single_flight.stats()['coalesced'], 0)
+        self.assertEqual(len(client.images.pulled), 2)
+
+    def test_pull_skipped(self):
+        """Test case for recording skipped pulls
+        """
+        puller = ImagePuller(SingleFlight(), 'if-missing')
+        client = Client()
+        client.images.images[f'{self.repository}:v0'] = Image([])
+
+        self.assertFalse(puller.pull(client, self.repository, 'v0', None, 'generator'))
+        stats = puller.stats()
+        self.assertEqual((stats['pulls'], stats['skipped_pulls'], stats['durations']), (0, 1, {}))
+
+
+if __name__ == '__main__':
+    unittest.main()
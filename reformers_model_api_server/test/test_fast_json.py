@@ -0,0 +1,74 @@
+import json
+import unittest
+
+from datetime import datetime, timezone
+
+from reformers_model_api_server.encoder import JSONEncoder
+from reformers_model_api_server.controllers.fast_json import FastJSONEncoder
+from reformers_model_api_server.models.info_model import InfoModel
+from reformers_model_api_server.models.list_models import ListModels
+
+
+class TestFastJSONEncoder(unittest.TestCase):
+    """FastJSONEncoder unit tests"""
+
+    def assert_same_output(self, data, **options):
+        self.assertEqual(
+            json.dumps(data, cls=FastJSONEncoder, **options),
+            json.dumps(data, cls=JSONEncoder, **options)
+        )
+
+    def create_list_models(self, generation_parameters):
+        return ListModels(
+            generator_name='generator',
+            generator_tag='v0',
+            models={
+                'model': {
+                    'v1': InfoModel(
+                        generation_parameters=generation_parameters,
+                        info={'description': 'Überblick   \x7f \U0001f600', 'created': datetime(2025, 7, 21, tzinfo=timezone.utc)},
+                        image_name='generator/v0/model',
+                        image_tag='v1',
+                        format='docker'
+                    ),
+                },
+            }
+        )
+
+    def test_encode(self):
+        """Test case for identical output of standard and fast encoder
+        """
+        data = self.create_list_models({'count': 3, 'ratio': 0.25, 'enabled': True, 'tags': ['a', 'b'], 'empty': {}})
+
+        for options in [
+                dict(indent=2, sort_keys=True),
+                dict(indent=2, sort_keys=False, ensure_ascii=False),
+                dict(separators=(',', ':'), sort_keys=True),
+                dict(), # not supported by orjson
+            ]:
+            with self.subTest(options=options):
+                self.assert_same_output(data, **options)
+
+    def test_encode_del(self):
+        """Test case for identical output for ASCII-only strings containing DEL
+        """
+        for options in [dict(indent=2), dict(separators=(',', ':')), dict(indent=2, ensure_ascii=False)]:
+            with self.subTest(options=options):
+                self.assert_same_output({'a': 'x\x7fy'}, **options)
+
+    def test_encode_divergent_floats(self):
+        """Test case for identical output for floats in exponent notation and non-finite floats
+        """
+        for value in [1e16, 1e-5, 5e-324, float('nan'), float('inf')]:
+            with self.subTest(value=value):
+                self.assert_same_output(self.create_list_models({'value': value}), indent=2, sort_keys=True)
+                self.assert_same_output({'value': [value]}, indent=2, sort_keys=True)
+
+    def test_encode_unsupported(self):
+        """Test case for identical output for data not supported by orjson
+        """
+        self.assert_same_output({'value': 2**70, 1: 'non-string key'}, indent=2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+
+from types import SimpleNamespace
+
+from reformers_model_api_server.controllers.generator_index import GeneratorIndex
+
+
+class MockSearchApi:
+    """Mock search API for the model generators repository (single search result page)"""
+
+    def __init__(self, generators):
+        self.generators = generators
+        self.calls = 0
+
+    def search_components(self, continuation_token=None):
+        self.calls += 1
+        return SimpleNamespace(
+            items=[SimpleNamespace(name=name, version=tag) for name, tag in self.generators],
+            continuation_token=None
+        )
+
+
+class TestGeneratorIndex(unittest.TestCase):
+    """GeneratorIndex unit tests"""
+
+    def test_lookup(self):
+        """Test case for looking up model generators without searching the repository again
+        """
+        search_api = MockSearchApi([('pv', 'v0'), ('pv', 'v1'), ('grid', 'v0')])
+        index = GeneratorIndex(search_api.search_components, refresh_interval=0)
+        index.refresh()
+
+        self.assertEqual(index.generators(), {'pv': ['v0', 'v1'], 'grid': ['v0']})
+        self.assertEqual(index.get_tags('pv', 'v1'), ['v0', 'v1'])
+        self.assertEqual(search_api.calls, 1)
+
+    def test_refresh_after_miss(self):
+        """Test case for refreshing the index when a model generator is not found
+        """
+        search_api = MockSearchApi([('pv', 'v0')])
+        index = GeneratorIndex(search_api.search_components, refresh_interval=0, min_refresh_interval=0)
+        index.refresh()
+
+        search_api.generators.append(('grid', 'v0'))
+        self.assertEqual(index.get_tags('grid'), ['v0'])
+        self.assertEqual(index.stats()['lookup_refreshes'], 1)
+
+    def test_rate_limited_refresh(self):
+        """Test case for rate-limiting refreshes triggered by lookups
+        """
+        search_api = MockSearchApi([('pv', 'v0')])
+        index = GeneratorIndex(search_api.search_components, refresh_interval=0, min_refresh_interval=60)
+        index.refresh()
+
+        self.assertEqual(index.get_tags('unknown'), [])
+        self.assertEqual(index.get_tags('unknown'), [])
+        self.assertEqual(search_api.calls, 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,115 @@
+import threading
+import unittest
+
+from concurrent.futures import wait
+
+from reformers_model_api_server.controllers.image_prewarmer import ImagePrewarmer
+
+
+class GeneratorIndex:
+    """Mock model generator index"""
+
+    def __init__(self, generators):
+        self.digests = generators
+
+    def generators(self):
+        return {name: list(tags) for name, tags in self.digests.items()}
+
+    def get_digest(self, generator_name, generator_tag):
+        return self.digests.get(generator_name, dict()).get(generator_tag)
+
+
+class TestImagePrewarmer(unittest.TestCase):
+    """ImagePrewarmer unit tests"""
+
+    def test_is_allowed(self):
+        """Test case for matching model generators against the allow-list
+        """
+        prewarmer = ImagePrewarmer(GeneratorIndex({}), None, ['generator', 'other:v*'], interval=60.)
+
+        self.assertTrue(prewarmer.is_allowed('generator', 'latest'))
+        self.assertTrue(prewarmer.is_allowed('other', 'v1'))
+        self.assertFalse(prewarmer.is_allowed('other', 'latest'))
+        self.assertFalse(prewarmer.is_allowed('unknown', 'v1'))
+
+        self.assertTrue(prewarmer.enabled)
+        self.assertFalse(ImagePrewarmer(GeneratorIndex({}), None, [], interval=60.).enabled)
+
+    def test_warm(self):
+        """Test case for pulling images of new or updated model generator tags
+        """
+        index = GeneratorIndex({'generator': {'v0': 'sha256:01', 'v1': None}, 'other': {'v0': 'sha256:02'}})
+        warmed = []
+
+        def warm_image(generator_name, generator_tag, digest):
+            warmed.append((generator_name, generator_tag, digest))
+            return True
+
+        prewarmer = ImagePrewarmer(index, warm_image, ['generator'], interval=60.)
+
+        wait(prewarmer.warm())
+        self.assertEqual(sorted(warmed), [('generator', 'v0', 'sha256:01'), ('generator', 'v1', None)])
+
+        # Only the updated tag is pulled again.
+        index.digests['generator']['v0'] = 'sha256:03'
+        wait(prewarmer.warm())
+        self.assertEqual(warmed[2:], [('generator', 'v0', 'sha256:03')])
+
+        stats = prewarmer.stats()
+        self.assertEqual((stats['runs'], stats['warmed'], stats['pulls']), (2, 2, 3))
+        prewarmer.stop()
+
+    def test_warm_failed(self):
+        """Test case for pulling images again after a failed pull
+        """
+        index = GeneratorIndex({'generator': {'v0': 'sha256:01'}})
+        attempts = []
+
+        def warm_image(generator_name, generator_tag, digest):
+            attempts.append(generator_tag)
+            if len(attempts) == 1:
+                raise RuntimeError('registry not available')
+            return False
+
+        prewarmer = ImagePrewarmer(index, warm_image, ['*'], interval=60.)
+
+        with self.assertWarns(RuntimeWarning):
+            wait(prewarmer.warm())
+        wait(prewarmer.warm())
+        wait(prewarmer.warm())
+        self.assertEqual(attempts, ['v0', 'v0'])
+
+        stats = prewarmer.stats()
+        self.assertEqual((stats['failures'], stats['skipped_pulls']), (1, 1))
+        prewarmer.stop()
+
+    def test_start_once(self):
+        """Test case for pre-warming images once at startup without an interval
+        """
+        index = GeneratorIndex({'generator': {'v0': 'sha256:01'}})
+        warmed = threading.Event()
+
+        def warm_image(generator_name, generator_tag, digest):
+            warmed.set()
+            return True
+
+        prewarmer = ImagePrewarmer(index, warm_image, ['generator'], interval=0.)
+        self.assertTrue(prewarmer.enabled)
+
+        prewarmer.start()
+        self.assertTrue(warmed.wait(5.))
+        self.assertEqual(prewarmer.stats()['runs'], 1)
+        prewarmer.stop()
+
+    def test_start_disabled(self):
+        """Test case for warning about disabled pre-warming despite an allow-list
+        """
+        prewarmer = ImagePrewarmer(GeneratorIndex({}), None, ['generator'], interval=60., concurrency=0)
+
+        self.assertFalse(prewarmer.enabled)
+        with self.assertWarns(RuntimeWarning):
+            prewarmer.start()
+
+
+if __name__ == '__main__':
+    unittest.main()
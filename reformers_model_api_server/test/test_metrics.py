@@ -0,0 +1,32 @@
+import threading
+import unittest
+
+from reformers_model_api_server.controllers.metrics import Metrics
+
+
+class TestMetrics(unittest.TestCase):
+    """Metrics unit tests"""
+
+    def test_increment(self):
+        """Test case for incrementing counters from concurrent threads
+        """
+        metrics = Metrics()
+
+        def increment():
+            for _ in range(1000):
+                metrics.increment('discarded')
+
+        threads = [threading.Thread(target=increment) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        metrics.increment('skipped', 0)
+        self.assertEqual(metrics.get('discarded'), 4000)
+        self.assertEqual(metrics.stats(), {'discarded': 4000, 'skipped': 0})
+        self.assertEqual(metrics.get('unknown'), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,253 @@
+import json
+import queue
+import threading
+import time
+import unittest
+
+from concurrent.futures import ThreadPoolExecutor
+from flask import Flask
+from functools import partial
+from types import SimpleNamespace
+
+from reformers_model_api_server.controllers.models_controller import MODEL_ARTIFACT, MODEL_IMAGE, get_model_image_summary, get_models_page, is_model_artifact_search_item, is_model_image_search_item, iterate_streamed_model_infos, list_model_summaries, put_completed, stream_model_info_lookups
+from reformers_model_api_server.controllers.util import submit_in_app_context
+from reformers_model_api_server.encoder import JSONEncoder
+from reformers_model_api_server.models.info_model import InfoModel
+from reformers_model_api_server.models.list_models import ListModels
+
+
+class TestModels(unittest.TestCase):
+    """Model unit tests"""
+
+    def test_slots(self):
+        """Test case for storing schema metadata at class level and attribute values in slots
+        """
+        model = InfoModel(info='model-info', image_name='generator/v0/model', image_tag='v0')
+
+        self.assertFalse(hasattr(model, '__dict__'))
+        self.assertIs(model.openapi_types, InfoModel.openapi_types)
+        self.assertIs(model.attribute_map, InfoModel.attribute_map)
+        with self.assertRaises(AttributeError):
+            model.unknown = 'value'
+
+    def test_to_dict(self):
+        """Test case for converting nested models to dicts and JSON
+        """
+        list_models = ListModels(generator_name='generator', generator_tag='v0', models={
+            'model': {'v0': InfoModel(info='model-info', image_tag='v0')}
+        })
+
+        self.assertEqual(InfoModel(info='model-info').to_dict()['info'], 'model-info')
+        self.assertEqual(
+            json.loads(json.dumps(list_models, cls=JSONEncoder)),
+            {'generator_name': 'generator', 'generator_tag': 'v0', 'models': {'model': {'v0': {'info': 'model-info', 'image-tag': 'v0'}}}}
+        )
+
+    def test_eq(self):
+        """Test case for comparing models
+        """
+        self.assertEqual(InfoModel(info='model-info', image_tag='v0'), InfoModel(info='model-info', image_tag='v0'))
+        self.assertNotEqual(InfoModel(info='model-info', image_tag='v0'), InfoModel(info='model-info', image_tag='v1'))
+        self.assertNotEqual(InfoModel(info='model-info'), ListModels())
+        self.assertNotEqual(InfoModel(info='model-info'), {'info': 'model-info'})
+
+
+class TestModelSearchItems(unittest.TestCase):
+    """Model search item filter unit tests"""
+
+    def test_is_model_image_search_item(self):
+        """Test case for matching model images of a model generator
+        """
+        def is_image(name):
+            return is_model_image_search_item(SimpleNamespace(name=name, version='v0'), 'pv', 'v1')
+
+        self.assertTrue(is_image('pv/v1/model'))
+        self.assertFalse(is_image('wind/v1/model'))
+        self.assertFalse(is_image('pv/v2/model'))
+        # The search pattern also matches model generators whose names start with the name of this one.
+        self.assertFalse(is_image('pv-ext/v1/model'))
+        self.assertFalse(is_image('pv/v1'))
+
+    def test_is_model_image_search_item_cache(self):
+        """Test case for build cache images of a model generator
+        """
+        search_item = SimpleNamespace(name='pv/v1/cache', version='v0')
+
+        # The build cache belongs to the model generator, but it is not a model.
+        self.assertTrue(is_model_image_search_item(search_item, 'pv', 'v1'))
+        self.assertFalse(is_model_image_search_item(search_item, 'pv-ext', 'v1'))
+        self.assertIsNone(get_model_image_summary(search_item, format='docker'))
+
+    def test_is_model_artifact_search_item(self):
+        """Test case for matching model artifacts of a model generator
+        """
+        def is_artifact(group):
+            return is_model_artifact_search_item(SimpleNamespace(group=group, name='model', version='v0'), 'pv', 'v1')
+
+        self.assertTrue(is_artifact('pv.v1'))
+        self.assertFalse(is_artifact('wind.v1'))
+        self.assertFalse(is_artifact('pv.v2'))
+        self.assertFalse(is_artifact('pv-ext.v1'))
+        self.assertFalse(is_artifact('pv.v1.cache'))
+
+
+class TestModelsPage(unittest.TestCase):
+    """Model pagination unit tests"""
+
+    def setUp(self):
+        # Model images first, then model artifacts (like the searches).
+        self.model_summaries = self.create_summaries([
+            SimpleNamespace(name='model-b', version='v1', kind='image'),
+            SimpleNamespace(name='model-a', version='v2', kind='image'),
+            SimpleNamespace(name='cache', version='v0', kind=None),
+            SimpleNamespace(name='model-a', version='v1', kind='image'),
+            SimpleNamespace(name='model-c', version='v0', kind='artifact'),
+            SimpleNamespace(name='model-a', version='v2', kind='artifact'),
+        ])
+
+    def create_summaries(self, search_items):
+        return list_model_summaries(
+            search_items,
+            lambda search_item: (search_item.name, search_item.version, search_item.kind) if search_item.kind else None,
+            lambda search_item: (search_item.name, search_item.version, f'{search_item.kind}-info')
+        )
+
+    def get_keys(self, page):
+        return [model_summary[:2] for model_summary, _ in page]
+
+    def test_list_model_summaries(self):
+        """Test case for skipping search items without summary and deferring the retrieval of information
+        """
+        self.assertEqual(len(self.model_summaries), 5)
+
+        model_summary, get_model_info = self.model_summaries[0]
+        self.assertEqual(model_summary, ('model-b', 'v1', 'image'))
+        self.assertEqual(get_model_info(), ('model-b', 'v1', 'image-info'))
+
+    def test_sorted(self):
+        """Test case for sorting models by model name and version and preferring model artifacts
+        """
+        page, next_page = get_models_page(self.model_summaries, None, None)
+
+        self.assertEqual(self.get_keys(page), [('model-a', 'v1'), ('model-a', 'v2'), ('model-b', 'v1'), ('model-c', 'v0')])
+        self.assertIsNone(next_page)
+
+        # The model artifact takes precedence over the model image with the same model name and version.
+        self.assertEqual(page[1][0], ('model-a', 'v2', 'artifact'))
+        self.assertEqual(page[1][1](), ('model-a', 'v2', 'artifact-info'))
+
+    def test_pages(self):
+        """Test case for retrieving pages after the last model version of the previous page
+        """
+        page, next_page = get_models_page(self.model_summaries, 2, None)
+        self.assertEqual(self.get_keys(page), [('model-a', 'v1'), ('model-a', 'v2')])
+        self.assertEqual(next_page, ('model-a', 'v2'))
+
+        page, next_page = get_models_page(self.model_summaries, 2, next_page)
+        self.assertEqual(self.get_keys(page), [('model-b', 'v1'), ('model-c', 'v0')])
+        # There is no next page, even though the last page is full.
+        self.assertIsNone(next_page)
+
+        # The boundary is exclusive, also for model versions that do not exist (anymore).
+        page, next_page = get_models_page(self.model_summaries, None, ('model-a', 'v1'))
+        self.assertEqual(self.get_keys(page), [('model-a', 'v2'), ('model-b', 'v1'), ('model-c', 'v0')])
+        page, next_page = get_models_page(self.model_summaries, 1, ('model-b', 'v0'))
+        self.assertEqual(self.get_keys(page), [('model-b', 'v1')])
+        self.assertEqual(next_page, ('model-b', 'v1'))
+
+        page, next_page = get_models_page(self.model_summaries, 2, ('model-c', 'v0'))
+        self.assertEqual((page, next_page), ([], None))
+
+
+class TestStreamedModelInfos(unittest.TestCase):
+    """Streamed model info lookups unit tests"""
+
+    def setUp(self):
+        self.app = Flask(__name__)
+        self.executor = ThreadPoolExecutor(max_workers=2)
+
+    def tearDown(self):
+        self.executor.shutdown()
+
+    def stream(self, images, artifacts, max_pending, get_model_info):
+        completed = queue.Queue()
+        image_lookups = threading.Semaphore(max_pending)
+        artifact_lookups = threading.Semaphore(max_pending)
+        artifact_keys = set()
+        stop = threading.Event()
+
+        searches = []
+
+        def search(search_items, source, pending_lookups, model_keys=None):
+            with self.app.app_context():
+                searches.append(submit_in_app_context(
+                    self.executor, stream_model_info_lookups, iter(search_items), get_model_info,
+                    partial(put_completed, completed, source), pending_lookups, stop, lookup=False,
+                    model_keys=model_keys
+                ))
+            return searches[-1]
+
+        model_infos = iterate_streamed_model_infos(
+            completed,
+            partial(search, images, MODEL_IMAGE, image_lookups),
+            partial(search, artifacts, MODEL_ARTIFACT, artifact_lookups, artifact_keys),
+            image_lookups,
+            artifact_lookups,
+            artifact_keys,
+            stop
+        )
+        return model_infos, searches
+
+    def test_stream(self):
+        """Test case for bounding pending lookups and preferring model artifacts
+        """
+        images = [SimpleNamespace(name=f'model-{i}', version='v0', kind='image') for i in range(6)]
+        artifacts = [SimpleNamespace(name=f'model-{i}', version='v0', kind='artifact') for i in range(0, 6, 2)]
+        lookups = []
+
+        def get_model_info(search_item):
+            lookups.append(search_item)
+            return search_item.name, search_item.version, search_item.kind
+
+        model_infos, _ = self.stream(images, artifacts, 2, get_model_info)
+
+        # Until the next record is consumed, at most 2 lookups per search are pending (besides the sent record).
+        first_result = next(model_infos)
+        time.sleep(0.05)
+        self.assertLessEqual(len(lookups), 5)
+
+        results = sorted([first_result] + list(model_infos))
+        self.assertEqual(results, [
+            (f'model-{i}', 'v0', 'artifact' if i % 2 == 0 else 'image') for i in range(6)
+        ])
+
+    def test_stream_closed(self):
+        """Test case for stopping the searches when the stream is closed early
+        """
+        images = [SimpleNamespace(name=f'model-{i}', version='v0') for i in range(100)]
+
+        model_infos, searches = self.stream(
+            images, [], 2, lambda search_item: (search_item.name, search_item.version, None)
+        )
+        next(model_infos)
+        model_infos.close()
+
+        image_search, artifact_search = searches
+        self.assertLess(image_search.result(timeout=1.), 100)
+        self.assertEqual(artifact_search.result(timeout=1.), 0)
+
+    def test_stream_not_iterated(self):
+        """Test case for not starting the searches when the stream is never iterated (e.g., HEAD requests)
+        """
+        images = [SimpleNamespace(name=f'model-{i}', version='v0') for i in range(100)]
+
+        model_infos, searches = self.stream(
+            images, [], 2, lambda search_item: (search_item.name, search_item.version, None)
+        )
+        model_infos.close()
+
+        self.assertEqual(searches, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
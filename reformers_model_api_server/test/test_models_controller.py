@@ -32,6 +32,22 @@ class TestModelsController(BaseTestCase):
         self.assert200(response,
                        'Response body is : ' + response.data.decode('utf-8'))
 
+    def test_get_model(self):
+        """Test case for get_model
+
+        Get information about a specific model version
+        """
+        headers = { 
+            'Accept': 'application/json',
+            'Authorization': 'Bearer special-key',
+        }
+        response = self.client.open(
+            '/model-generators/{generator_name}/{generator_tag}/models/{model_name}/{model_version}'.format(generator_name='generator_name_example', generator_tag='generator_tag_example', model_name='model_name_example', model_version='model_version_example'),
+            method='GET',
+            headers=headers)
+        self.assert200(response,
+                       'Response body is : ' + response.data.decode('utf-8'))
+
     def test_list_models(self):
         """Test case for list_models
 
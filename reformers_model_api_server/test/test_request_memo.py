@@ -0,0 +1,49 @@
+import traceback
+import unittest
+
+from reformers_model_api_server.controllers.request_memo import RequestMemo
+
+
+class TestRequestMemo(unittest.TestCase):
+    """RequestMemo unit tests"""
+
+    def test_get_or_fetch(self):
+        """Test case for retrieving objects at most once
+        """
+        memo = RequestMemo()
+        fetched = []
+
+        def fetch():
+            fetched.append(True)
+            return 'manifest'
+
+        self.assertEqual(memo.get_or_fetch(('manifest', 'generator', 'v0'), fetch), 'manifest')
+        self.assertEqual(memo.get_or_fetch(('manifest', 'generator', 'v0'), fetch), 'manifest')
+        self.assertEqual(len(fetched), 1)
+        self.assertEqual(memo.hits, 1)
+
+    def test_get_or_fetch_exception(self):
+        """Test case for re-raising the exception of a failed lookup
+        """
+        memo = RequestMemo()
+        fetched = []
+
+        def fetch():
+            fetched.append(True)
+            raise KeyError('not found')
+
+        traceback_lengths = []
+        for _ in range(3):
+            try:
+                memo.get_or_fetch(('blob', 'sha256:01'), fetch)
+            except KeyError as ex:
+                traceback_lengths.append(len(traceback.extract_tb(ex.__traceback__)))
+        self.assertEqual(len(traceback_lengths), 3)
+        self.assertEqual(len(fetched), 1)
+
+        # The traceback does not grow with every re-raise.
+        self.assertEqual(len(set(traceback_lengths[1:])), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
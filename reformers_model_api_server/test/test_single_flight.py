@@ -0,0 +1,82 @@
+import threading
+import time
+import unittest
+
+from reformers_model_api_server.controllers.single_flight import SingleFlight
+
+
+class TestSingleFlight(unittest.TestCase):
+    """SingleFlight unit tests"""
+
+    def run_concurrently(self, single_flight, key, func, count):
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(self.call(single_flight, key, func)))
+            for _ in range(count)
+        ]
+        for thread in threads:
+            thread.start()
+        return threads, results
+
+    def call(self, single_flight, key, func):
+        try:
+            return single_flight.do(key, func)
+        except Exception as ex:
+            return ex
+
+    def test_coalesce(self):
+        """Test case for sharing the result of a call in flight
+        """
+        single_flight = SingleFlight()
+        release = threading.Event()
+        calls = []
+
+        def func():
+            calls.append(True)
+            release.wait()
+            return 'result'
+
+        threads, results = self.run_concurrently(single_flight, 'key', func, 4)
+        while single_flight.stats()['coalesced'] < 3:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(results, ['result'] * 4)
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(single_flight.stats(), dict(in_flight=0, executed=1, coalesced=3))
+
+    def test_coalesce_exception(self):
+        """Test case for sharing the exception of a call in flight
+        """
+        single_flight = SingleFlight()
+        release = threading.Event()
+
+        def func():
+            release.wait()
+            raise RuntimeError('failed')
+
+        threads, results = self.run_concurrently(single_flight, 'key', func, 2)
+        while single_flight.stats()['coalesced'] < 1:
+            time.sleep(0.01)
+        release.set()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual([str(r) for r in results], ['failed'] * 2)
+        self.assertIsNot(results[0], results[1])
+
+    def test_wrap(self):
+        """Test case for executing sequential calls again
+        """
+        single_flight = SingleFlight()
+        func = single_flight.wrap(lambda x, y=0: x + y, 'add')
+
+        self.assertEqual(func(1, y=2), 3)
+        self.assertEqual(func(1, y=2), 3)
+        self.assertEqual(single_flight.stats()['executed'], 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
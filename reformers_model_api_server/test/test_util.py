@@ -0,0 +1,198 @@
+import unittest
+
+from concurrent.futures import Future
+from flask import Flask
+from types import SimpleNamespace
+
+from reformers_model_api_server.controllers.cache import ResponseCache
+from reformers_model_api_server.controllers.metrics import Metrics
+from reformers_model_api_server.controllers.util import cache_response, create_digest, create_models_cursor, create_response_etag, decode_models_cursor, gather_results, get_cached_response, get_search_item_fingerprint, iterate_search_items, paginated_search, run_as_future
+
+
+def search_api_func(continuation_token=None, pages=3, page_size=2):
+    """Mock search API function returning `pages` pages with `page_size` items each"""
+    page = int(continuation_token) if continuation_token else 0
+    return SimpleNamespace(
+        items=[page * page_size + i for i in range(page_size)],
+        continuation_token=str(page + 1) if page + 1 < pages else None
+    )
+
+
+class TestUtil(unittest.TestCase):
+    """controllers.util unit tests"""
+
+    def test_paginated_search(self):
+        """Test case for paginated search with and without prefetching
+        """
+        for prefetch in [0, 1, 3]:
+            search_items = []
+            paginated_search(search_api_func, search_items.append, prefetch=prefetch)
+            self.assertEqual(search_items, list(range(6)))
+
+    def test_paginated_search_prefetch_exception(self):
+        """Test case for re-raising exceptions raised while prefetching
+        """
+        def failing_search_api_func(continuation_token=None):
+            if continuation_token:
+                raise RuntimeError('search failed')
+            return search_api_func(continuation_token)
+
+        search_items = []
+        with self.assertRaisesRegex(RuntimeError, 'search failed'):
+            paginated_search(failing_search_api_func, search_items.append, prefetch=1)
+        self.assertEqual(search_items, [0, 1])
+
+    def test_iterate_search_items(self):
+        """Test case for lazily iterating through search items with early termination
+        """
+        requested_pages = []
+        def tracking_search_api_func(continuation_token=None):
+            requested_pages.append(continuation_token)
+            return search_api_func(continuation_token)
+
+        self.assertEqual(list(iterate_search_items(tracking_search_api_func, limit=3)), [0, 1, 2])
+        self.assertEqual(requested_pages, [None, '1'])
+
+        requested_pages.clear()
+        stop_condition = lambda search_item: search_item == 2
+        self.assertEqual(list(iterate_search_items(tracking_search_api_func, stop_condition=stop_condition)), [0, 1])
+        self.assertEqual(requested_pages, [None, '1'])
+
+    def test_gather_results(self):
+        """Test case for gathering results of futures in their original order
+        """
+        futures = [Future() for _ in range(3)]
+        for i, future in reversed(list(enumerate(futures))):
+            future.set_result(i)
+
+        self.assertEqual(gather_results(futures), [0, 1, 2])
+
+    def test_gather_results_exception(self):
+        """Test case for re-raising the first exception after all futures have finished
+        """
+        futures = [Future() for _ in range(3)]
+        futures[0].set_result(0)
+        futures[1].set_exception(RuntimeError('first'))
+        futures[2].set_exception(RuntimeError('second'))
+
+        with self.assertRaisesRegex(RuntimeError, 'first'):
+            gather_results(futures)
+
+    def test_run_as_future(self):
+        """Test case for handling functions executed in the current thread like submitted functions
+        """
+        def fail():
+            raise RuntimeError('failed')
+
+        futures = [run_as_future(lambda x: x + 1, 0), run_as_future(fail)]
+        self.assertTrue(all(future.done() for future in futures))
+
+        with self.assertRaisesRegex(RuntimeError, 'failed'):
+            gather_results(futures)
+
+    def test_models_cursor(self):
+        """Test case for encoding and decoding cursors for pages of models
+        """
+        cursor = create_models_cursor('model', '1.0.0')
+        self.assertEqual(decode_models_cursor(cursor), ('model', '1.0.0'))
+
+        with self.assertRaisesRegex(RuntimeError, 'malformed cursor'):
+            decode_models_cursor('invalid')
+
+    def test_search_items_digest(self):
+        """Test case for creating digests of search items (independent of irrelevant properties)
+        """
+        def search_item(checksum, last_downloaded):
+            asset = SimpleNamespace(path='model/1.0.0/model-1.0.0.zip', checksum={'sha256': checksum}, last_downloaded=last_downloaded)
+            return SimpleNamespace(group='generator.v0', name='model', version='1.0.0', assets=[asset])
+
+        digest = create_digest([get_search_item_fingerprint(search_item('01', None))])
+        self.assertTrue(digest.startswith('sha256:'))
+        self.assertEqual(digest, create_digest([get_search_item_fingerprint(search_item('01', '2025-07-21'))]))
+        self.assertNotEqual(digest, create_digest([get_search_item_fingerprint(search_item('02', None))]))
+
+    def test_response_etag(self):
+        """Test case for creating ETags of responses (per endpoint, parameters, digest and encoding)
+        """
+        etag = create_response_etag(('list_models', 'generator', 'v0', 'full'), 'sha256:01')
+        self.assertEqual(etag, create_response_etag(('list_models', 'generator', 'v0', 'full'), 'sha256:01'))
+        self.assertNotEqual(etag, create_response_etag(('list_models', 'generator', 'v0', 'summary'), 'sha256:01'))
+        self.assertNotEqual(etag, create_response_etag(('list_models', 'generator', 'v0', 'full'), 'sha256:02'))
+        self.assertEqual(create_response_etag(('list_models', 'generator', 'v0', 'full'), 'sha256:01', gzip=True), f'{etag}-gzip')
+
+    def test_not_modified(self):
+        """Test case for responding with status 304 to clients sending the ETag of the current response
+        """
+        app = Flask(__name__)
+        app.response_cache = ResponseCache(max_size=1024)
+        app.metrics = Metrics()
+        app.response_max_age = 0
+
+        key = ('list_model_generators',)
+        data = {'generator': ['v0']}
+        digest = create_digest(data)
+
+        with app.test_request_context(headers={'Accept-Encoding': 'gzip'}):
+            response = cache_response(key, digest, data)
+            self.assertEqual(response.headers['Content-Encoding'], 'gzip')
+            gzip_etag = response.headers['ETag']
+
+        with app.test_request_context():
+            response = get_cached_response(key, digest)
+            self.assertEqual(response.status_code, 200)
+            self.assertNotIn('Content-Encoding', response.headers)
+            etag = response.headers['ETag']
+            self.assertNotEqual(etag, gzip_etag)
+
+        with app.test_request_context(headers={'If-None-Match': etag}):
+            response = get_cached_response(key, digest)
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.headers['ETag'], etag)
+            self.assertEqual(response.headers['Cache-Control'], 'no-cache')
+
+        with app.test_request_context(headers={'If-None-Match': gzip_etag, 'Accept-Encoding': 'gzip'}):
+            response = get_cached_response(key, digest)
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.headers['ETag'], gzip_etag)
+
+        # The ETags of the identity and the gzip variant do not match each other.
+        with app.test_request_context(headers={'If-None-Match': etag, 'Accept-Encoding': 'gzip'}):
+            response = get_cached_response(key, digest)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers['ETag'], gzip_etag)
+
+        with app.test_request_context(headers={'If-None-Match': gzip_etag}):
+            response = get_cached_response(key, digest)
+            self.assertEqual(response.status_code, 200)
+            self.assertEqual(response.headers['ETag'], etag)
+
+        # The ETag does not match once the underlying data has changed.
+        with app.test_request_context(headers={'If-None-Match': etag}):
+            self.assertIsNone(get_cached_response(key, create_digest({'generator': ['v0', 'v1']})))
+
+        self.assertEqual(app.metrics.get('not_modified_responses'), 2)
+
+    def test_not_modified_cache_disabled(self):
+        """Test case for sending ETags and responding with status 304 without response cache
+        """
+        app = Flask(__name__)
+        app.response_cache = ResponseCache(max_size=0)
+        app.metrics = Metrics()
+        app.response_max_age = 0
+
+        key = ('list_models', 'generator', 'v0', 'full')
+        data = {'model': {'v1': {}}}
+        digest = create_digest(data)
+
+        with app.test_request_context():
+            self.assertIsNone(get_cached_response(key, digest))
+            etag = cache_response(key, digest, data).headers['ETag']
+
+        with app.test_request_context(headers={'If-None-Match': etag}):
+            response = get_cached_response(key, digest)
+            self.assertEqual(response.status_code, 304)
+            self.assertEqual(response.headers['ETag'], etag)
+
+
+if __name__ == '__main__':
+    unittest.main()
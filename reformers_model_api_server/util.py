@@ -1,8 +1,15 @@
 import datetime
 
 import typing
+from functools import partial
 from reformers_model_api_server import typing_utils
 
+# Class literal -> converter function for deserializing data into objects of this class.
+_deserializers = {}
+
+# Model class -> deserializer plan, i.e., tuple of (json key, attribute name, converter function).
+_deserializer_plans = {}
+
 
 def _deserialize(data, klass):
     """Deserializes dict, list, str into an object.
@@ -15,21 +22,63 @@ def _deserialize(data, klass):
     if data is None:
         return None
 
+    return _get_deserializer(klass)(data)
+
+
+def _get_deserializer(klass):
+    """Returns the (cached) converter function for deserializing data into objects of a class.
+
+    :param klass: class literal.
+
+    :return: converter function.
+    """
+    try:
+        return _deserializers[klass]
+    except KeyError:
+        pass
+
     if klass in (int, float, str, bool, bytearray):
-        return _deserialize_primitive(data, klass)
+        deserializer = partial(_deserialize_primitive, klass=klass)
     elif klass == object:
-        return _deserialize_object(data)
+        deserializer = _deserialize_object
     elif klass == datetime.date:
-        return deserialize_date(data)
+        deserializer = deserialize_date
     elif klass == datetime.datetime:
-        return deserialize_datetime(data)
+        deserializer = deserialize_datetime
     elif typing_utils.is_generic(klass):
         if typing_utils.is_list(klass):
-            return _deserialize_list(data, klass.__args__[0])
-        if typing_utils.is_dict(klass):
-            return _deserialize_dict(data, klass.__args__[1])
+            deserializer = partial(_deserialize_list, boxed_type=klass.__args__[0])
+        elif typing_utils.is_dict(klass):
+            deserializer = partial(_deserialize_dict, boxed_type=klass.__args__[1])
+        else:
+            deserializer = _deserialize_none
     else:
-        return deserialize_model(data, klass)
+        deserializer = partial(deserialize_model, klass=klass)
+
+    _deserializers[klass] = deserializer
+    return deserializer
+
+
+def _get_deserializer_plan(klass):
+    """Returns the (cached) deserializer plan of a model class.
+
+    :param klass: class literal.
+
+    :return: tuple of (json key, attribute name, converter function) per attribute.
+    :rtype: tuple
+    """
+    try:
+        return _deserializer_plans[klass]
+    except KeyError:
+        pass
+
+    plan = tuple(
+        (klass.attribute_map[attr], attr, _get_deserializer(attr_type))
+        for attr, attr_type in klass.openapi_types.items()
+    )
+
+    _deserializer_plans[klass] = plan
+    return plan
 
 
 def _deserialize_primitive(data, klass):
@@ -58,6 +107,14 @@ def _deserialize_object(value):
     return value
 
 
+def _deserialize_none(value):
+    """Return None (for generic types other than List and Dict).
+
+    :return: None.
+    """
+    return None
+
+
 def deserialize_date(string):
     """Deserializes string to date.
 
@@ -104,17 +161,19 @@ def deserialize_model(data, klass):
     :param klass: class literal.
     :return: model object.
     """
+    plan = _get_deserializer_plan(klass)
     instance = klass()
 
-    if not instance.openapi_types:
+    if not plan:
         return data
 
-    for attr, attr_type in instance.openapi_types.items():
-        if data is not None \
-                and instance.attribute_map[attr] in data \
-                and isinstance(data, (list, dict)):
-            value = data[instance.attribute_map[attr]]
-            setattr(instance, attr, _deserialize(value, attr_type))
+    if data is None:
+        return instance
+
+    for key, attr, deserializer in plan:
+        if key in data and isinstance(data, (list, dict)):
+            value = data[key]
+            setattr(instance, attr, None if value is None else deserializer(value))
 
     return instance
 